@@ -1,3 +1,7 @@
+import queue
+from unittest import mock
+
+import pytest
 from wandb.sdk.internal import tb_watcher
 
 
@@ -59,3 +63,49 @@ class TestIsTfEventsFileCreatedBy:
             tb_watcher.is_tfevents_file_created_by("me.193.tfevents", "me", 193)
             is False
         )
+
+
+def test_local_events_are_migrated(tmp_path):
+    pytest.importorskip("tensorboard")
+    from tensorboard.compat.proto import event_pb2, summary_pb2
+    from tensorboard.summary.writer.event_file_writer import EventFileWriter
+
+    def histogram(step, metadata=None):
+        value = summary_pb2.Summary.Value(tag="tf2", metadata=metadata)
+        value.tensor.dtype = 1  # DT_FLOAT
+        value.tensor.tensor_shape.dim.add(size=1)
+        value.tensor.tensor_shape.dim.add(size=3)
+        value.tensor.float_val.extend([0.0, 1.0, float(step)])
+        return event_pb2.Event(step=step, summary=summary_pb2.Summary(value=[value]))
+
+    writer = EventFileWriter(str(tmp_path))
+    metadata = summary_pb2.SummaryMetadata()
+    metadata.plugin_data.plugin_name = "histograms"
+    writer.add_event(histogram(0, metadata))
+    writer.add_event(histogram(1))
+    legacy = summary_pb2.Summary.Value(tag="legacy")
+    legacy.histo.min = 0
+    legacy.histo.max = 1
+    legacy.histo.num = 1
+    legacy.histo.bucket_limit.extend([1.0])
+    legacy.histo.bucket.extend([1.0])
+    writer.add_event(
+        event_pb2.Event(step=2, summary=summary_pb2.Summary(value=[legacy]))
+    )
+    writer.close()
+
+    events = queue.Queue()
+    watcher = tb_watcher.TBDirWatcher(
+        mock.Mock(), str(tmp_path), False, None, events, force=True
+    )
+    watcher._process_events()
+
+    values = [events.get_nowait().event.summary.value[0] for _ in range(3)]
+    assert [v.tag for v in values] == ["tf2", "tf2", "legacy"]
+    assert all(v.metadata.plugin_data.plugin_name == "histograms" for v in values)
+    assert values[2].HasField("tensor")
+
+    # Remote logdirs are read by tensorboard's loader, with the same result.
+    loader = watcher._loader(save=False)(str(next(tmp_path.iterdir())))
+    loaded = [e.summary.value[0] for e in loader.Load() if e.HasField("summary")]
+    assert loaded == values
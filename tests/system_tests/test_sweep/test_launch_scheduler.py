@@ -376,6 +376,103 @@ def test_sweep_scheduler_base_run_states(user, monkeypatch):
     assert _scheduler._runs["foo_run_2"].state == RunState.UNKNOWN
 
 
+@patch.multiple(Scheduler, __abstractmethods__=set())
+def test_sweep_scheduler_base_batched_run_states(user, monkeypatch):
+    _patch_wandb_run(monkeypatch)
+    _entity = user
+    _project = "test-project"
+    api = internal.Api()
+    sweep_id = wandb.sweep(SWEEP_CONFIG_RANDOM, entity=_entity, project=_project)
+
+    polled_states = {"run1": "running", "run2": "finished", "run3": "?????"}
+    batched_calls = []
+
+    def mock_get_run_states(entity, project, run_ids, *args, **kwargs):
+        batched_calls.append(sorted(run_ids))
+        return {
+            run_id: {"state": polled_states[run_id], "summaryMetrics": "{}"}
+            for run_id in run_ids
+            if run_id in polled_states
+        }
+
+    single_calls = []
+
+    def mock_get_run_state(entity, project, run_id, *args, **kwargs):
+        single_calls.append(run_id)
+        return "running"
+
+    api.get_run_states = mock_get_run_states
+    api.get_run_state = mock_get_run_state
+    _scheduler = Scheduler(
+        api, sweep_id=sweep_id, entity=_entity, project=_project, num_workers=1
+    )
+    for i, run_id in enumerate(["run1", "run2", "run3", "run4"]):
+        _scheduler._runs[run_id] = SweepRun(
+            id=run_id, state=RunState.RUNNING, worker_id=i
+        )
+    _scheduler._update_run_states()
+
+    # All runs are polled at once, runs missing from the result one at a time
+    assert batched_calls == [["run1", "run2", "run3", "run4"]]
+    assert single_calls == ["run4"]
+    assert _scheduler._runs["run1"].state == RunState.RUNNING
+    assert "run2" not in _scheduler._runs
+    assert _scheduler._runs["run3"].state == RunState.UNKNOWN
+    assert _scheduler._runs["run4"].state == RunState.RUNNING
+
+
+@patch.multiple(Scheduler, __abstractmethods__=set())
+def test_sweep_scheduler_base_metrics_read_history_tail(user, monkeypatch):
+    _patch_wandb_run(monkeypatch)
+    _entity = user
+    _project = "test-project"
+    api = internal.Api()
+    sweep_id = wandb.sweep(SWEEP_CONFIG_RANDOM, entity=_entity, project=_project)
+    _scheduler = Scheduler(
+        api, sweep_id=sweep_id, entity=_entity, project=_project, num_workers=1
+    )
+    metric_name = _scheduler._sweep_config["metric"]["name"]
+
+    history = [{"_step": 0, metric_name: 1.0}, {"_step": 1, metric_name: 0.5}]
+    scans = []
+
+    def scan_history(keys, min_step=0, max_step=None):
+        scans.append(min_step)
+        return [row for row in history if min_step <= row["_step"] < max_step]
+
+    api_run = Mock(["scan_history", "lastHistoryStep"])
+    api_run.scan_history = scan_history
+    api_run.lastHistoryStep = 1
+    _scheduler._public_api = Mock(["run"])
+    _scheduler._public_api.run.return_value = api_run
+
+    queued_run = Mock(["entity", "project"])
+    _scheduler._runs["run1"] = SweepRun(
+        id="run1", state=RunState.RUNNING, worker_id=0, queued_run=queued_run
+    )
+
+    def poll(step):
+        summary = f'{{"_step": {step}}}'
+        _scheduler._polled_runs = {
+            "run1": {"state": "running", "summaryMetrics": summary}
+        }
+
+    poll(1)
+    assert _scheduler._get_metrics_from_run("run1") == [1.0, 0.5]
+
+    # The run has not logged anything since the last read
+    assert _scheduler._get_metrics_from_run("run1") == [1.0, 0.5]
+    assert scans == [0]
+
+    # Only the new history is read
+    history.append({"_step": 2, metric_name: 0.25})
+    api_run.lastHistoryStep = 2
+    poll(2)
+    assert _scheduler._get_metrics_from_run("run1") == [1.0, 0.5, 0.25]
+    assert scans == [0, 2]
+    assert _scheduler._public_api.run.call_count == 1
+
+
 @patch.multiple(Scheduler, __abstractmethods__=set())
 def test_sweep_scheduler_base_add_to_launch_queue(user, monkeypatch):
     sweep_config = SWEEP_CONFIG_RANDOM
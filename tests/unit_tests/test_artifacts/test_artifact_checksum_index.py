@@ -0,0 +1,140 @@
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+from pytest import fixture
+from pytest_mock import MockerFixture
+from wandb import env
+from wandb.sdk.artifacts.artifact import Artifact
+from wandb.sdk.artifacts.artifact_checksum_index import (
+    ArtifactChecksumIndex,
+    get_artifact_checksum_index,
+)
+from wandb.sdk.artifacts.artifact_file_cache import ArtifactFileCache
+from wandb.sdk.lib.hashutil import B64MD5, md5_file_b64, md5_files_b64
+
+
+@fixture
+def index(tmp_path: Path):
+    index = ArtifactChecksumIndex(tmp_path / "checksums.db")
+    yield index
+    index.close()
+
+
+def test_get_returns_digest_for_unchanged_file(
+    tmp_path: Path,
+    index: ArtifactChecksumIndex,
+):
+    file = tmp_path / "file.txt"
+    file.write_text("hello")
+
+    index.put(file, B64MD5("digest"))
+
+    assert index.get(file) == "digest"
+
+
+def test_get_misses_after_file_changes(
+    tmp_path: Path,
+    index: ArtifactChecksumIndex,
+):
+    file = tmp_path / "file.txt"
+    file.write_text("hello")
+    index.put(file, B64MD5("digest"))
+
+    file.write_text("hello, world")
+
+    assert index.get(file) is None
+
+
+def test_get_many_queries_in_batches(
+    tmp_path: Path,
+    index: ArtifactChecksumIndex,
+):
+    stats = {}
+    for i in range(1_234):
+        file = tmp_path / f"file_{i}.txt"
+        file.write_text(str(i))
+        stats[str(file)] = os.stat(file)
+
+    index.put_many((path, st, B64MD5(f"digest-{path}")) for path, st in stats.items())
+
+    assert index.get_many(stats) == {path: f"digest-{path}" for path in stats}
+
+
+def test_get_many_treats_corrupt_index_as_miss(tmp_path: Path):
+    db_path = tmp_path / "checksums.db"
+    db_path.write_text("not a database")
+    index = ArtifactChecksumIndex(db_path)
+    file = tmp_path / "file.txt"
+    file.write_text("hello")
+
+    index.put(file, B64MD5("digest"))
+
+    assert index.get(file) is None
+    index.close()
+
+
+def test_unusable_cache_dir_is_treated_as_miss(tmp_path: Path):
+    not_a_dir = tmp_path / "not_a_dir"
+    not_a_dir.write_text("")
+    index = ArtifactChecksumIndex(not_a_dir / "cache" / "checksums.db")
+    file = tmp_path / "file.txt"
+    file.write_text("hello")
+
+    index.put(file, B64MD5("digest"))
+
+    assert index.get(file) is None
+    index.close()
+
+
+def test_add_file_hashes_with_unusable_cache_dir(
+    tmp_path: Path,
+    mocker: MockerFixture,
+):
+    not_a_dir = tmp_path / "not_a_dir"
+    not_a_dir.write_text("")
+    mocker.patch.dict(os.environ, {env.CACHE_DIR: str(not_a_dir / "cache")})
+    file = tmp_path / "file.txt"
+    file.write_text("hello")
+
+    artifact = Artifact("x", "dataset")
+    artifact.add_file(str(file))
+
+    assert artifact.manifest.entries["file.txt"].digest == md5_file_b64(str(file))
+
+
+def test_add_dir_skips_hashing_unchanged_files(
+    tmp_path: Path,
+    mocker: MockerFixture,
+    artifact_file_cache: ArtifactFileCache,
+):
+    data_dir = tmp_path / "data"
+    data_dir.mkdir()
+    for i in range(5):
+        (data_dir / f"file_{i}.txt").write_text(str(i))
+
+    Artifact("first", "dataset").add_dir(str(data_dir), policy="immutable")
+    assert get_artifact_checksum_index().get(data_dir / "file_0.txt") == (
+        md5_file_b64(str(data_dir / "file_0.txt"))
+    )
+
+    hashed_paths = []
+
+    def record_md5_files_b64(paths, **kwargs):
+        paths = list(paths)
+        hashed_paths.extend(paths)
+        return md5_files_b64(paths, **kwargs)
+
+    mocker.patch(
+        "wandb.sdk.artifacts.artifact.md5_files_b64",
+        side_effect=record_md5_files_b64,
+    )
+    (data_dir / "file_0.txt").write_text("changed")
+    artifact = Artifact("second", "dataset")
+    artifact.add_dir(str(data_dir), policy="immutable")
+
+    assert hashed_paths == [str(data_dir / "file_0.txt")]
+    assert artifact.manifest.entries["file_0.txt"].digest == md5_file_b64(
+        str(data_dir / "file_0.txt")
+    )
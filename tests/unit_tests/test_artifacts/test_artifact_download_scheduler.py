@@ -0,0 +1,155 @@
+from __future__ import annotations
+
+import threading
+from pathlib import Path
+from types import SimpleNamespace
+
+from pytest import raises
+from pytest_mock import MockerFixture
+from wandb.sdk.artifacts.artifact import Artifact
+from wandb.sdk.artifacts.artifact_download_scheduler import (
+    _MIN_ENTRY_COST,
+    ArtifactDownloadScheduler,
+)
+from wandb.sdk.artifacts.artifact_manifest_entry import ArtifactManifestEntry
+
+
+def make_entry(path: str, size: int) -> ArtifactManifestEntry:
+    return ArtifactManifestEntry(path=path, digest="digest", size=size)
+
+
+def test_downloads_smallest_first():
+    downloaded = []
+
+    with ArtifactDownloadScheduler(
+        lambda entry: downloaded.append(entry.path),
+        min_workers=1,
+        max_workers=1,
+    ) as scheduler:
+        scheduler.submit_page(
+            [make_entry("big", 300), make_entry("small", 1), make_entry("mid", 20)]
+        )
+
+    assert downloaded == ["small", "mid", "big"]
+
+
+def test_bounds_bytes_in_flight():
+    lock = threading.Lock()
+    in_flight = 0
+    max_in_flight = 0
+    max_bytes_in_flight = 4 * _MIN_ENTRY_COST
+
+    def download(entry: ArtifactManifestEntry) -> None:
+        nonlocal in_flight, max_in_flight
+        with lock:
+            in_flight += _MIN_ENTRY_COST
+            max_in_flight = max(max_in_flight, in_flight)
+        with lock:
+            in_flight -= _MIN_ENTRY_COST
+
+    with ArtifactDownloadScheduler(
+        download,
+        min_workers=16,
+        max_workers=16,
+        max_bytes_in_flight=max_bytes_in_flight,
+    ) as scheduler:
+        scheduler.submit_page(make_entry(f"file_{i}", 1) for i in range(200))
+
+        # Submitting blocks on the budget, so the queue never outgrows it.
+        assert scheduler._bytes_in_flight <= max_bytes_in_flight
+
+    assert max_in_flight <= max_bytes_in_flight
+
+
+def test_admits_entry_larger_than_budget():
+    downloaded = []
+
+    with ArtifactDownloadScheduler(
+        lambda entry: downloaded.append(entry.path),
+        max_workers=2,
+        max_bytes_in_flight=10,
+    ) as scheduler:
+        scheduler.submit_page([make_entry("huge", 10**9), make_entry("huger", 10**10)])
+
+    assert sorted(downloaded) == ["huge", "huger"]
+
+
+def test_reraises_first_error_on_exit():
+    def download(entry: ArtifactManifestEntry) -> None:
+        raise ValueError(entry.path)
+
+    with raises(ValueError, match="only"):
+        with ArtifactDownloadScheduler(
+            download,
+            min_workers=1,
+            max_workers=1,
+        ) as scheduler:
+            scheduler.submit_page([make_entry("only", 1)])
+
+
+def test_adds_workers_while_throughput_improves():
+    now = 0.0
+    release = threading.Event()
+    done = threading.Event()
+    worker_counts = []
+
+    def download(entry: ArtifactManifestEntry) -> None:
+        nonlocal now
+        # Hold the first download until all entries are queued.
+        release.wait()
+        worker_counts.append(scheduler.worker_count)
+        now += 1
+        if len(worker_counts) == 20:
+            done.set()
+
+    scheduler = ArtifactDownloadScheduler(
+        download,
+        min_workers=1,
+        max_workers=8,
+        clock_for_testing=lambda: now,
+    )
+    with scheduler:
+        scheduler.submit_page(make_entry(f"file_{i}", 1) for i in range(20))
+        release.set()
+        assert done.wait(timeout=10)
+
+    # The first measurement window is an improvement over nothing.
+    assert worker_counts[0] == 1
+    assert max(worker_counts) > 1
+
+
+def test_download_prefetches_next_page(tmp_path: Path, mocker: MockerFixture):
+    artifact = Artifact("test", "dataset")
+    entries = {f"file_{i}": make_entry(f"file_{i}", i) for i in range(4)}
+    mocker.patch.object(artifact, "get_entry", side_effect=entries.__getitem__)
+
+    def page(names: list[str], cursor: str | None) -> SimpleNamespace:
+        return SimpleNamespace(
+            page_info=SimpleNamespace(
+                has_next_page=cursor is not None,
+                end_cursor=cursor,
+            ),
+            edges=[
+                SimpleNamespace(node=SimpleNamespace(name=name, direct_url=name))
+                for name in names
+            ],
+        )
+
+    pages = {
+        None: page(["file_0", "file_1"], "next"),
+        "next": page(["file_2", "file_3"], None),
+    }
+    fetched = []
+
+    def fetch_file_urls(cursor: str | None, per_page: int) -> SimpleNamespace:
+        fetched.append(cursor)
+        return pages[cursor]
+
+    mocker.patch.object(artifact, "_fetch_file_urls", side_effect=fetch_file_urls)
+    download = mocker.patch.object(ArtifactManifestEntry, "download")
+
+    artifact._download(str(tmp_path))
+
+    assert fetched == [None, "next"]
+    assert download.call_count == 4
+    assert all(entry._download_url == name for name, entry in entries.items())
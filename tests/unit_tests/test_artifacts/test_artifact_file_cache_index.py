@@ -0,0 +1,207 @@
+from __future__ import annotations
+
+import os
+import shutil
+from pathlib import Path
+
+from pytest import fixture
+from pytest_mock import MockerFixture
+from wandb.sdk.artifacts.artifact_file_cache import ArtifactFileCache
+from wandb.sdk.artifacts.artifact_file_cache_index import ArtifactFileCacheIndex
+from wandb.sdk.lib.hashutil import md5_string
+
+
+@fixture
+def obj_dir(tmp_path: Path) -> Path:
+    obj_dir = tmp_path / "obj"
+    obj_dir.mkdir()
+    return obj_dir
+
+
+@fixture
+def index(tmp_path: Path, obj_dir: Path):
+    index = ArtifactFileCacheIndex(tmp_path / "index.db", obj_dir)
+    yield index
+    index.close()
+
+
+def write_object(obj_dir: Path, name: str, size: int, atime: int) -> Path:
+    path = obj_dir / name[:2] / name[2:]
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(b"x" * size)
+    os.utime(path, (atime, atime))
+    return path
+
+
+def write_cached(cache: ArtifactFileCache, content: str) -> str:
+    path, _, opener = cache.check_md5_obj_path(md5_string(content), len(content))
+    with opener() as f:
+        f.write(content)
+    return path
+
+
+def test_build_indexes_existing_objects(
+    index: ArtifactFileCacheIndex,
+    obj_dir: Path,
+):
+    write_object(obj_dir, "aaaa", 100, atime=1000)
+    write_object(obj_dir, "bbbb", 200, atime=2000)
+
+    assert index.total_size() == 300
+
+
+def test_evict_removes_least_recently_used_first(
+    index: ArtifactFileCacheIndex,
+    obj_dir: Path,
+):
+    oldest = write_object(obj_dir, "aaaa", 100, atime=1000)
+    middle = write_object(obj_dir, "bbbb", 100, atime=2000)
+    newest = write_object(obj_dir, "cccc", 100, atime=3000)
+
+    assert index.evict(target_size=150) == (200, 100)
+
+    assert not oldest.exists()
+    assert not middle.exists()
+    assert newest.exists()
+    assert index.total_size() == 100
+
+
+def test_reconcile_only_lists_modified_dirs(
+    index: ArtifactFileCacheIndex,
+    obj_dir: Path,
+    mocker: MockerFixture,
+):
+    path = write_object(obj_dir, "aaaa", 100, atime=1000)
+    for directory in (path.parent, obj_dir):
+        os.utime(directory, (1000, 1000))
+    index.total_size()
+    scandir = mocker.patch(
+        "wandb.sdk.artifacts.artifact_file_cache_index.os.scandir",
+        side_effect=AssertionError("cache was listed"),
+    )
+
+    assert index.evict(target_size=0) == (100, 0)
+    scandir.assert_not_called()
+
+
+def test_reconcile_drops_removed_objects(
+    index: ArtifactFileCacheIndex,
+    obj_dir: Path,
+):
+    removed = write_object(obj_dir, "aaaa", 100, atime=1000)
+    write_object(obj_dir, "bbbb", 200, atime=2000)
+    index.total_size()
+
+    removed.unlink()
+    assert index.total_size() == 200
+
+    shutil.rmtree(obj_dir / "bb")
+    assert index.total_size() == 0
+
+
+def test_evict_drops_missing_objects_without_reclaiming(
+    index: ArtifactFileCacheIndex,
+    obj_dir: Path,
+):
+    missing = write_object(obj_dir, "aaaa", 100, atime=1000)
+    write_object(obj_dir, "bbbb", 100, atime=2000)
+    index.total_size()
+    missing.unlink()
+
+    assert index.evict(target_size=100) == (0, 100)
+
+
+def test_evict_keeps_objects_rewritten_since_indexed(
+    index: ArtifactFileCacheIndex,
+    obj_dir: Path,
+):
+    rewritten = write_object(obj_dir, "aaaa", 100, atime=1000)
+    index.total_size()
+    os.utime(rewritten, ns=(1000 * 10**9, 4000 * 10**9))
+    other = write_object(obj_dir, "bbbb", 100, atime=2000)
+    index.record(other, 100)
+
+    # The rewritten object's mtime is newer than its recorded access, so it
+    # is refreshed and the other object is evicted instead.
+    assert index.evict(target_size=100) == (100, 100)
+
+    assert rewritten.exists()
+    assert not other.exists()
+
+
+def test_cache_hit_marks_object_as_recently_used(
+    artifact_file_cache: ArtifactFileCache,
+):
+    first = write_cached(artifact_file_cache, "first")
+    second = write_cached(artifact_file_cache, "second")
+
+    _, hit, _ = artifact_file_cache.check_md5_obj_path(md5_string("first"), 5)
+    assert hit
+
+    artifact_file_cache.cleanup(target_size=5)
+
+    assert os.path.exists(first)
+    assert not os.path.exists(second)
+
+
+def test_cleanup_falls_back_to_scan_if_index_is_corrupt(tmp_path: Path):
+    (tmp_path / "index.db").write_text("not a database")
+    cache = ArtifactFileCache(tmp_path)
+    write_object(cache._obj_dir, "aaaa", 100, atime=1000)
+    write_object(cache._obj_dir, "bbbb", 100, atime=2000)
+
+    assert cache.cleanup(target_size=100) == 100
+    assert not (cache._obj_dir / "aa" / "aa").exists()
+    assert (cache._obj_dir / "bb" / "bb").exists()
+
+
+def test_unrecorded_objects_are_indexed(
+    artifact_file_cache: ArtifactFileCache,
+):
+    write_cached(artifact_file_cache, "first")
+    assert artifact_file_cache._index.total_size() == 5
+
+    # Objects written by wandb-core aren't recorded in the index.
+    path, _, _ = artifact_file_cache.check_md5_obj_path(md5_string("unrecorded"), 10)
+    Path(path).parent.mkdir(parents=True, exist_ok=True)
+    Path(path).write_text("unrecorded")
+    assert artifact_file_cache._index.total_size() == 15
+
+
+def test_cleanup_evicts_unrecorded_objects(
+    artifact_file_cache: ArtifactFileCache,
+):
+    write_cached(artifact_file_cache, "first")
+    artifact_file_cache._index.total_size()
+    unrecorded = write_object(artifact_file_cache._obj_dir, "aaaa", 100, atime=1000)
+
+    assert artifact_file_cache.cleanup(target_size=5) == 100
+    assert not unrecorded.exists()
+    assert artifact_file_cache._index.total_size() == 5
+
+
+def test_evict_keeps_objects_read_since_indexed(
+    index: ArtifactFileCacheIndex,
+    obj_dir: Path,
+):
+    read = write_object(obj_dir, "aaaa", 100, atime=1000)
+    other = write_object(obj_dir, "bbbb", 100, atime=2000)
+    index.total_size()
+
+    # Read by wandb-core, which doesn't record cache hits in the index.
+    os.utime(read, ns=(3000 * 10**9, read.stat().st_mtime_ns))
+
+    assert index.evict(target_size=100) == (100, 100)
+    assert read.exists()
+    assert not other.exists()
+
+
+def test_cleanup_to_zero_removes_unrecorded_objects(
+    artifact_file_cache: ArtifactFileCache,
+):
+    write_cached(artifact_file_cache, "first")
+    artifact_file_cache._index.total_size()
+    unrecorded = write_object(artifact_file_cache._obj_dir, "aaaa", 100, atime=1000)
+
+    assert artifact_file_cache.cleanup(target_size=0) == 105
+    assert not unrecorded.exists()
@@ -16,6 +16,7 @@ import responses
 from hypothesis import given
 from hypothesis.strategies import from_regex, text
 from pytest import CaptureFixture, MonkeyPatch, fail, fixture, mark, raises
+from pytest_mock import MockerFixture
 from wandb.filesync.step_prepare import ResponsePrepare, StepPrepare
 from wandb.sdk.artifacts._validators import NAME_MAXLEN
 from wandb.sdk.artifacts.artifact import Artifact
@@ -560,6 +561,107 @@ def test_verify_rejects_invalid_artifact_path(tmp_path):
         artifact.verify(root=str(tmp_path))
 
 
+def make_committed_artifact(data_dir: Path, nfiles: int) -> Artifact:
+    data_dir.mkdir()
+    for i in range(nfiles):
+        (data_dir / f"file_{i}.txt").write_text(f"content {i}")
+    artifact = Artifact("test-artifact", "test-type")
+    artifact.add_dir(str(data_dir))
+    artifact._state = ArtifactState.COMMITTED
+    return artifact
+
+
+def test_verify_reports_every_mismatch(
+    tmp_path: Path,
+    artifact_file_cache: ArtifactFileCache,
+):
+    data_dir = tmp_path / "data"
+    artifact = make_committed_artifact(data_dir, nfiles=4)
+    (data_dir / "file_0.txt").write_text("content X")
+    (data_dir / "file_1.txt").write_text("resized")
+    (data_dir / "file_2.txt").unlink()
+    (data_dir / "extra.txt").write_text("extra")
+
+    report = artifact.verify(root=str(data_dir), raise_on_mismatch=False)
+
+    assert {(Path(m.path).name, m.reason) for m in report.mismatches} == {
+        ("file_0.txt", "digest"),
+        ("file_1.txt", "size"),
+        ("file_2.txt", "missing"),
+        ("extra.txt", "untracked"),
+    }
+    with raises(ValueError, match="Digest mismatch for file"):
+        artifact.verify(root=str(data_dir))
+
+
+def test_verify_skips_hashing_unchanged_files(
+    tmp_path: Path,
+    artifact_file_cache: ArtifactFileCache,
+):
+    data_dir = tmp_path / "data"
+    artifact = make_committed_artifact(data_dir, nfiles=3)
+
+    first = artifact.verify(root=str(data_dir))
+    second = artifact.verify(root=str(data_dir))
+
+    # add_dir already recorded the digests of the unchanged files.
+    assert first.ok and second.ok
+    assert second.files_cached == 3
+    assert second.files_hashed == 0
+
+
+def test_verify_size_mode_does_not_hash(
+    tmp_path: Path,
+    artifact_file_cache: ArtifactFileCache,
+):
+    data_dir = tmp_path / "data"
+    artifact = make_committed_artifact(data_dir, nfiles=3)
+    (data_dir / "file_0.txt").write_text("content X")
+
+    report = artifact.verify(root=str(data_dir), mode="size")
+
+    assert report.ok
+    assert report.files_checked == 3
+    assert report.files_hashed == 0
+
+
+def test_verify_sample_mode_hashes_a_fraction_of_files(
+    tmp_path: Path,
+    mocker: MockerFixture,
+    artifact_file_cache: ArtifactFileCache,
+):
+    data_dir = tmp_path / "data"
+    artifact = make_committed_artifact(data_dir, nfiles=10)
+    mocker.patch(
+        "wandb.sdk.artifacts.artifact_verification.get_artifact_checksum_index"
+    ).return_value.get_many.return_value = {}
+
+    report = artifact.verify(root=str(data_dir), mode="sample", sample_fraction=0.3)
+
+    assert report.ok
+    assert report.files_hashed == 3
+
+
+@mark.parametrize(
+    "kwargs, message",
+    [
+        ({"mode": "sampled"}, "Invalid verification mode 'sampled'"),
+        ({"mode": "sample", "sample_fraction": 0}, "sample_fraction"),
+        ({"mode": "sample", "sample_fraction": 1.5}, "sample_fraction"),
+    ],
+)
+def test_verify_rejects_invalid_options(
+    tmp_path: Path,
+    artifact_file_cache: ArtifactFileCache,
+    kwargs,
+    message,
+):
+    artifact = make_committed_artifact(tmp_path / "data", nfiles=1)
+
+    with raises(ValueError, match=message):
+        artifact.verify(root=str(tmp_path / "data"), **kwargs)
+
+
 def test_artifact_multipart_download_threshold():
     mb = 1024 * 1024
     assert should_multipart_download(100 * mb) is False
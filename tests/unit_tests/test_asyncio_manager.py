@@ -100,6 +100,34 @@ def test_run_after_join_fails():
         asyncer.run(lambda: _return_value("test"))
 
 
+def test_call_soon_threadsafe_calls_in_loop_thread():
+    asyncer = asyncio_manager.AsyncioManager()
+    asyncer.start()
+    called_in = []
+    called = threading.Event()
+
+    def record_thread():
+        called_in.append(threading.current_thread().name)
+        called.set()
+
+    try:
+        asyncer.call_soon_threadsafe(record_thread)
+        assert called.wait(timeout=5)
+    finally:
+        asyncer.join()
+
+    assert called_in == ["wandb-AsyncioManager-main"]
+
+
+def test_call_soon_threadsafe_after_join_fails():
+    asyncer = asyncio_manager.AsyncioManager()
+    asyncer.start()
+    asyncer.join()
+
+    with pytest.raises(asyncio_manager.AlreadyJoinedError):
+        asyncer.call_soon_threadsafe(lambda: None)
+
+
 def test_join_after_join_ok():
     asyncer = asyncio_manager.AsyncioManager()
     asyncer.start()
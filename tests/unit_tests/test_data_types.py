@@ -1,3 +1,4 @@
+import hashlib
 import io
 import os
 import platform
@@ -17,7 +18,10 @@ from PIL import Image
 from wandb import data_types, env
 from wandb.sdk.data_types import _dtypes
 from wandb.sdk.data_types import utils as data_types_utils
-from wandb.sdk.data_types.base_types.media import _numpy_arrays_to_lists
+from wandb.sdk.data_types.base_types.media import (
+    _HashingBuffer,
+    _numpy_arrays_to_lists,
+)
 from wandb.sdk.wandb_settings import Settings
 
 
@@ -174,6 +178,35 @@ def test_bind_image(
     assert wb_image.is_bound()
 
 
+@pytest.mark.usefixtures("patch_max_cli_version")
+def test_bind_image_writes_encoded_file_once(mock_run, image):
+    run = mock_run()
+    wb_image = wandb.Image(image)
+    assert wb_image._file_path is None
+
+    wb_image.bind_to_run(run, "stuff", 10)
+
+    assert wb_image._path.startswith(run.dir)
+    with open(wb_image._path, "rb") as f:
+        contents = f.read()
+    assert hashlib.sha256(contents).hexdigest() == wb_image._sha256
+    assert len(contents) == wb_image._size
+    assert wb_image.image.size == (image.shape[1], image.shape[0])
+
+
+def test_hashing_buffer_handles_rewrites():
+    buffer = _HashingBuffer()
+    buffer.write(b"header--")
+    buffer.write(b"body")
+    assert buffer.sha256() == hashlib.sha256(b"header--body").hexdigest()
+
+    buffer.seek(0)
+    buffer.write(b"HEADER")
+    buffer.seek(0, os.SEEK_END)
+    buffer.write(b"!")
+    assert buffer.sha256() == hashlib.sha256(b"HEADER--body!").hexdigest()
+
+
 def test_image_accepts_other_images():
     image_a = wandb.Image(np.random.random((300, 300, 3)))
     image_b = wandb.Image(image_a)
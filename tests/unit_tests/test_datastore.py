@@ -137,3 +137,100 @@ def test_data_write_fill(with_datastore):
         expected_records=records,
         expected_record_sizes=lengths,
     )
+
+
+def write_records(fname, records):
+    ds = datastore.DataStore()
+    ds.open_for_write(fname)
+    for rec in records:
+        ds.write(rec)
+    ds.close()
+
+
+def make_records():
+    history = wandb_internal_pb2.Record(num=1)
+    history.history.item.add(key="loss", value_json="0.5")
+    large = wandb_internal_pb2.Record(num=2)
+    large.output.line = "x" * (3 * 32768)
+    summary = wandb_internal_pb2.Record()
+    summary.summary.update.add(key="loss", value_json="0.5")
+    control = wandb_internal_pb2.Record(num=4)
+    control.control.local = True
+    control.exit.exit_code = 1
+    return [history, large, summary, control]
+
+
+def test_mmap_datastore_matches_datastore(tmp_path):
+    fname = str(tmp_path / "run.wandb")
+    records = make_records()
+    write_records(fname, records)
+
+    ds = datastore.DataStore()
+    ds.open_for_scan(fname)
+    expected = [ds.scan_data() for _ in range(len(records) + 1)]
+    ds.close()
+
+    mds = datastore.MmapDataStore()
+    mds.open_for_scan(fname)
+    scanned = [bytes(data) for data in mds]
+    mds.close()
+
+    assert expected[-1] is None
+    assert scanned == expected[:-1]
+    assert scanned == [rec.SerializeToString() for rec in records]
+
+
+def test_mmap_datastore_returns_views_of_single_block_records(tmp_path):
+    fname = str(tmp_path / "run.wandb")
+    write_records(fname, make_records()[:1])
+
+    mds = datastore.MmapDataStore()
+    mds.open_for_scan(fname)
+    data = mds.scan_data()
+
+    assert isinstance(data, memoryview)
+    assert mds.scan_data() is None
+    mds.close()
+
+
+def test_mmap_datastore_index(tmp_path):
+    fname = str(tmp_path / "run.wandb")
+    records = make_records()
+    write_records(fname, records)
+
+    mds = datastore.MmapDataStore()
+    mds.open_for_scan(fname)
+    index = mds.build_index()
+
+    assert [entry.record_type for entry in index] == [
+        "history",
+        "output",
+        "summary",
+        "exit",
+    ]
+    summary = wandb_internal_pb2.Record()
+    summary.ParseFromString(mds.read_at(index[2].offset))
+    assert summary == records[2]
+    mds.close()
+
+
+def test_mmap_datastore_detects_corruption(tmp_path):
+    fname = str(tmp_path / "run.wandb")
+    write_records(fname, make_records()[:1])
+    with open(fname, "r+b") as f:
+        f.seek(-1, os.SEEK_END)
+        f.write(b"\xff")
+
+    mds = datastore.MmapDataStore()
+    mds.open_for_scan(fname)
+    with pytest.raises(AssertionError, match="checksum is invalid"):
+        mds.scan_data()
+    mds.close()
+
+
+def test_mmap_datastore_empty_file(tmp_path):
+    fname = tmp_path / "run.wandb"
+    fname.touch()
+
+    with pytest.raises(AssertionError, match="header is 0 bytes"):
+        datastore.MmapDataStore().open_for_scan(str(fname))
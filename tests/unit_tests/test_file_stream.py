@@ -2,10 +2,13 @@ import itertools
 import os
 import random
 import string
+import threading
 from dataclasses import dataclass
+from unittest import mock
 
+import requests
 from wandb import util
-from wandb.sdk.internal.file_stream import CRDedupeFilePolicy
+from wandb.sdk.internal.file_stream import CRDedupeFilePolicy, FileStreamApi
 from wandb.sdk.lib.file_stream_utils import split_files
 
 
@@ -188,3 +191,48 @@ def test_crdedupe_process_chunks():
     files["output.log"] = ret
     file_requests = list(split_files(files, max_bytes=util.MAX_LINE_BYTES))
     assert 2 == len(file_requests)
+
+
+def _file_stream(status_code: int = 200) -> FileStreamApi:
+    api = mock.Mock(
+        request_auth=("api", "key"),
+        request_headers={},
+        request_proxies={},
+        dynamic_settings={"heartbeat_seconds": 30},
+    )
+    api.settings.return_value = {"base_url": "https://x", "entity": "e", "project": "p"}
+    fs = FileStreamApi(api, "run", start_time=0)
+
+    response = mock.Mock(status_code=status_code)
+    if status_code != 200:
+        response.raise_for_status.side_effect = requests.exceptions.HTTPError(
+            response=response
+        )
+    fs._client.post = mock.Mock(return_value=response)
+    return fs
+
+
+def test_flush_confirms_posted_chunks():
+    fs = _file_stream()
+    fs.start()
+    flushed = threading.Event()
+
+    fs.push("output.log", "line\n")
+    fs.flush(flushed.set)
+
+    assert flushed.wait(timeout=30)
+    posted = [call.kwargs["json"] for call in fs._client.post.call_args_list]
+    assert posted[0]["files"]["output.log"]["content"] == ["line\n"]
+    fs.finish(0)
+
+
+def test_flush_not_confirmed_if_chunks_dropped():
+    fs = _file_stream(status_code=400)
+    fs.start()
+    flushed = threading.Event()
+
+    fs.push("output.log", "line\n")
+    fs.flush(flushed.set)
+    fs.finish(0)
+
+    assert not flushed.is_set()
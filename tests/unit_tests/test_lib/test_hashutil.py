@@ -136,3 +136,26 @@ def test_md5_file_hashes_on_mounted_filesystem(
 
     assert expected_b64_hash == hashutil.md5_file_b64(fpath_large)
     assert expected_hex_hash == hashutil.md5_file_hex(fpath_large)
+
+
+def test_md5_files_b64_matches_md5_file_b64(tmp_path: Path):
+    paths = []
+    for i, size in enumerate([0, 1, 100, 3 * 1024 * 1024 + 7] + [10] * 300):
+        path = tmp_path / f"file_{i}"
+        path.write_bytes(bytes(j % 251 for j in range(size)))
+        paths.append(path)
+
+    digests, stats = hashutil.md5_files_b64(paths, max_workers=4)
+
+    assert digests == {str(p): hashutil.md5_file_b64(p) for p in paths}
+    assert stats.files == len(paths)
+    assert stats.bytes == sum(p.stat().st_size for p in paths)
+    assert stats.mb_per_second >= 0
+
+
+def test_md5_files_b64_empty():
+    digests, stats = hashutil.md5_files_b64([])
+
+    assert digests == {}
+    assert stats.files == 0
+    assert stats.mb_per_second == 0
@@ -0,0 +1,80 @@
+from __future__ import annotations
+
+import json
+import os
+import subprocess
+import sys
+import types
+
+import pytest
+import wandb
+from wandb.sdk.lib import lazyloader
+
+
+def make_package() -> types.ModuleType:
+    package = types.ModuleType("fakepkg")
+    package.__getattr__, package.__dir__ = lazyloader.lazy_attributes(
+        "json",
+        vars(package),
+        {"dumps": ("json", "dumps"), "decoder": ("json.decoder", None)},
+    )
+    return package
+
+
+def test_lazy_attributes_load_on_first_use():
+    package = make_package()
+    assert "dumps" not in vars(package)
+
+    assert package.dumps is json.dumps
+    assert vars(package)["dumps"] is json.dumps
+    assert package.decoder is sys.modules["json.decoder"]
+
+
+def test_lazy_attributes_import_submodules():
+    package = make_package()
+
+    assert package.scanner is sys.modules["json.scanner"]
+
+
+def test_lazy_attributes_missing():
+    package = make_package()
+
+    with pytest.raises(AttributeError):
+        package.missing  # noqa: B018
+    with pytest.raises(AttributeError):
+        package.__missing__  # noqa: B018
+
+
+def test_lazy_attributes_dir():
+    package = make_package()
+
+    assert {"dumps", "decoder"} <= set(package.__dir__())
+
+
+def test_import_wandb_is_lazy():
+    # These modules are slow to import and must only be loaded on first use.
+    heavy = [
+        "numpy",
+        "pandas",
+        "pydantic",
+        "requests",
+        "wandb.apis.public",
+        "wandb.data_types",
+        "wandb.sdk.wandb_run",
+        "wandb.sdk.wandb_settings",
+        "wandb.util",
+    ]
+    code = (
+        "import json, sys, wandb\n"
+        f"print(json.dumps([m for m in {heavy!r} if m in sys.modules]))"
+    )
+    wandb_root = os.path.dirname(os.path.dirname(wandb.__file__))
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        cwd=wandb_root,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+    assert json.loads(result.stdout.splitlines()[-1]) == []
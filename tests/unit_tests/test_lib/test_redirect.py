@@ -0,0 +1,108 @@
+from __future__ import annotations
+
+import os
+import queue
+
+from wandb.sdk.lib import redirect
+
+
+def read_lines(emulator: redirect.TerminalEmulator) -> list[str]:
+    return emulator.read().split(os.linesep)
+
+
+def test_plain_lines():
+    emulator = redirect.TerminalEmulator()
+    emulator.write("hello\nworld\n")
+
+    assert emulator.read() == f"hello{os.linesep}world{os.linesep}"
+
+
+def test_carriage_return_overwrites():
+    emulator = redirect.TerminalEmulator()
+    emulator.write("progress 10%\rprogress 99%\rprogress 100%")
+
+    assert emulator.read() == f"progress 100%{os.linesep}"
+
+
+def test_carriage_return_keeps_longer_tail():
+    emulator = redirect.TerminalEmulator()
+    emulator.write("abcdef\rxy")
+
+    assert emulator.read() == f"xycdef{os.linesep}"
+
+
+def test_colors_render_as_ansi_codes():
+    emulator = redirect.TerminalEmulator()
+    emulator.write("\x1b[31mred\x1b[0m plain \x1b[42m\x1b[1mbold\x1b[0m!\n")
+
+    assert emulator.read() == (
+        f"\x1b[31mred\x1b[39m plain \x1b[42m\x1b[1mbold\x1b[49m\x1b[22m!{os.linesep}"
+    )
+
+
+def test_overwrite_splits_style_runs():
+    emulator = redirect.TerminalEmulator()
+    emulator.write("\x1b[32mgreen text\x1b[0m\r\x1b[31mred\x1b[0m")
+
+    assert emulator.read() == (f"\x1b[31mred\x1b[32men text{os.linesep}")
+
+
+def test_erase_line():
+    emulator = redirect.TerminalEmulator()
+    emulator.write("hello world\x1b[6D\x1b[K!")
+
+    assert emulator.read() == f"hello!{os.linesep}"
+
+
+def test_erase_screen_from_cursor():
+    emulator = redirect.TerminalEmulator()
+    emulator.write("one\ntwo\nthree\x1b[1A\x1b[4D\x1b[J")
+
+    assert emulator.read() == f"one{os.linesep}t{os.linesep}{os.linesep}"
+
+
+def test_cursor_up_rewrites_previous_line():
+    emulator = redirect.TerminalEmulator()
+    emulator.write("a\nb\n\x1b[2A\x1b[2Kc\n")
+
+    assert emulator.read() == f"c{os.linesep}b{os.linesep}"
+
+
+def test_read_returns_only_new_output():
+    emulator = redirect.TerminalEmulator()
+    emulator.write("first\n")
+    assert emulator.read() == f"first{os.linesep}"
+
+    assert emulator.read() == ""
+
+    emulator.write("second\n")
+    assert emulator.read() == f"second{os.linesep}"
+
+
+def test_read_rewrites_changed_last_line():
+    emulator = redirect.TerminalEmulator()
+    emulator.write("10%")
+    assert emulator.read() == f"10%{os.linesep}"
+
+    emulator.write("\r50%")
+    assert emulator.read() == f"\r50%{os.linesep}"
+
+
+def test_read_keeps_last_lines():
+    emulator = redirect.TerminalEmulator()
+    emulator.write("".join(f"line {i}\n" for i in range(150)))
+    emulator.read()
+
+    assert emulator.num_lines == redirect.TerminalEmulator._MAX_LINES
+    assert emulator.buffer[0].render() == "line 50"
+    emulator.write("end\n")
+    assert emulator.read() == f"end{os.linesep}"
+
+
+def test_drain():
+    q: queue.Queue[int] = queue.Queue()
+    for i in range(3):
+        q.put(i)
+
+    assert redirect._drain(q) == [0, 1, 2]
+    assert redirect._drain(q) == []
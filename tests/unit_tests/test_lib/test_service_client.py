@@ -6,6 +6,7 @@ import threading
 from typing import Literal
 
 import pytest
+from wandb.proto import wandb_internal_pb2 as pb
 from wandb.proto import wandb_server_pb2 as spb
 from wandb.sdk import mailbox
 from wandb.sdk.lib import asyncio_manager
@@ -215,3 +216,52 @@ def test_closes_mailbox_on_eof(
             handle.wait_or(timeout=5)
     finally:
         asyncer.run(client.close)
+
+
+def test_publish_record_sends_record_publish_request(
+    asyncer: asyncio_manager.AsyncioManager,
+    client: ServiceClient,
+    fake_server: _FakeServer,
+):
+    record = pb.Record()
+    record.exit.exit_code = 123
+    record._info.stream_id = "stream"
+
+    try:
+        client.publish_record(record)
+    finally:
+        asyncer.run(client.close)
+
+    assert fake_server.requests() == [spb.ServerRequest(record_publish=record)]
+
+
+def test_publish_record_keeps_order_under_backpressure(
+    asyncer: asyncio_manager.AsyncioManager,
+    fake_server: _FakeServer,
+):
+    reader, writer = asyncer.run(
+        lambda: asyncio.open_connection("127.0.0.1", fake_server.port),
+    )
+    client = ServiceClient(asyncer, reader, writer, max_pending_bytes=100)
+    records = [pb.Record(num=i) for i in range(1000)]
+
+    try:
+        for record in records:
+            client.publish_record(record)
+        asyncer.run(lambda: client.publish(spb.ServerRequest()))
+    finally:
+        asyncer.run(client.close)
+
+    requests = fake_server.requests()
+    assert [r.record_publish for r in requests[:-1]] == records
+    assert requests[-1] == spb.ServerRequest()
+
+
+def test_publish_record_after_close_raises(
+    asyncer: asyncio_manager.AsyncioManager,
+    client: ServiceClient,
+):
+    asyncer.run(client.close)
+
+    with pytest.raises(BrokenPipeError):
+        client.publish_record(pb.Record())
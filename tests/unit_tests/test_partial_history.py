@@ -0,0 +1,120 @@
+from __future__ import annotations
+
+import threading
+
+from wandb.proto import wandb_internal_pb2 as pb
+from wandb.sdk.interface.partial_history import PartialHistoryCoalescer
+
+
+def make_request(
+    step: int | None = None,
+    flush: bool | None = None,
+    **values: str,
+) -> pb.PartialHistoryRequest:
+    request = pb.PartialHistoryRequest()
+    for key, value in values.items():
+        request.item.add(key=key, value_json=value)
+    if step is not None:
+        request.step.num = step
+    if flush is not None:
+        request.action.flush = flush
+    return request
+
+
+def items(request: pb.PartialHistoryRequest) -> dict[str, str]:
+    return {item.key: item.value_json for item in request.item}
+
+
+def test_merges_requests_until_commit():
+    sent: list[pb.PartialHistoryRequest] = []
+    coalescer = PartialHistoryCoalescer(sent.append)
+
+    coalescer.publish(make_request(flush=False, a="1"))
+    coalescer.publish(make_request(flush=False, a="2", b="3"))
+    assert sent == []
+
+    coalescer.publish(make_request(c="4"))
+
+    assert len(sent) == 1
+    assert items(sent[0]) == {"a": "2", "b": "3", "c": "4"}
+    assert not sent[0].HasField("step")
+    assert not sent[0].HasField("action")
+    assert coalescer.requests_saved == 2
+
+
+def test_sends_buffer_on_step_change():
+    sent: list[pb.PartialHistoryRequest] = []
+    coalescer = PartialHistoryCoalescer(sent.append)
+
+    coalescer.publish(make_request(step=1, a="1"))
+    coalescer.publish(make_request(step=1, b="2"))
+    coalescer.publish(make_request(step=2, a="3"))
+
+    assert len(sent) == 1
+    assert sent[0].step.num == 1
+    assert items(sent[0]) == {"a": "1", "b": "2"}
+
+    coalescer.flush()
+    assert sent[1].step.num == 2
+    assert (coalescer.requests_received, coalescer.requests_sent) == (3, 2)
+
+
+def test_sends_committing_request_without_buffer():
+    sent: list[pb.PartialHistoryRequest] = []
+    coalescer = PartialHistoryCoalescer(sent.append)
+    request = make_request(step=1, flush=True, a="1")
+
+    coalescer.publish(request)
+
+    assert sent == [request]
+
+
+def test_shared_mode_ignores_steps():
+    sent: list[pb.PartialHistoryRequest] = []
+    coalescer = PartialHistoryCoalescer(sent.append, shared=True)
+
+    coalescer.publish(make_request(step=1, flush=False, a="1"))
+    coalescer.publish(make_request(step=2, flush=False, b="2"))
+    assert sent == []
+
+    # Without an action, requests commit the row in shared mode.
+    coalescer.publish(make_request(step=3, c="3"))
+    assert len(sent) == 1
+    assert items(sent[0]) == {"a": "1", "b": "2", "c": "3"}
+
+
+def test_sends_buffer_over_size_bounds():
+    sent: list[pb.PartialHistoryRequest] = []
+    coalescer = PartialHistoryCoalescer(sent.append, max_items=3, max_bytes=10)
+
+    coalescer.publish(make_request(flush=False, a="1", b="2"))
+    coalescer.publish(make_request(flush=False, a="3"))
+    assert sent == []
+    coalescer.publish(make_request(flush=False, c="4"))
+    assert len(sent) == 1
+
+    coalescer.publish(make_request(flush=False, big="x" * 10))
+    assert len(sent) == 2
+
+
+def test_sends_old_buffer_in_background():
+    sent = threading.Event()
+    coalescer = PartialHistoryCoalescer(lambda _: sent.set(), max_age=0.01)
+
+    coalescer.publish(make_request(flush=False, a="1"))
+
+    assert sent.wait(timeout=5)
+    coalescer.close()
+
+
+def test_close_sends_buffer():
+    sent: list[pb.PartialHistoryRequest] = []
+    coalescer = PartialHistoryCoalescer(sent.append)
+    coalescer.publish(make_request(step=1, a="1"))
+
+    coalescer.close()
+    assert len(sent) == 1
+
+    # Requests after closing are sent immediately.
+    coalescer.publish(make_request(step=1, b="2"))
+    assert len(sent) == 2
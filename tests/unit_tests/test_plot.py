@@ -1,5 +1,7 @@
+import numpy as np
 import pytest
 from wandb.plot import confusion_matrix, line_series, pr_curve, roc_curve
+from wandb.plot.utils import fit_curves, simplify_curve
 
 
 def test_roc_curve_no_title():
@@ -187,6 +189,49 @@ def test_confusion_matrix_without_class_names():
     ]
 
 
+def test_confusion_matrix_rejects_labels_outside_class_names():
+    with pytest.raises(ValueError, match="indices into `class_names`"):
+        confusion_matrix(
+            y_true=[0, 1],
+            preds=[0, 3],
+            class_names=["Cat", "Dog"],
+        )
+
+
+def test_simplify_curve_keeps_corners():
+    """A piecewise-linear curve is reduced to its corners."""
+    x = np.concatenate([np.zeros(100), np.linspace(0, 1, 101)])
+    y = np.concatenate([np.linspace(0, 1, 100), np.ones(101)])
+
+    indices = simplify_curve(x, y, max_points=10)
+
+    assert indices.tolist() == [0, 99, 200]
+
+
+def test_simplify_curve_respects_budget():
+    x = np.linspace(0, 1, 10_000)
+    y = np.sqrt(x)
+
+    indices = simplify_curve(x, y, max_points=50)
+
+    assert len(indices) == 50
+    assert indices[0] == 0 and indices[-1] == len(x) - 1
+    # The simplified curve stays close to the original.
+    assert np.max(np.abs(np.interp(x, x[indices], y[indices]) - y)) < 0.01
+
+
+def test_fit_curves_limits_total_points():
+    x = np.linspace(0, 1, 5_000)
+    curves = {"a": (x, x**2), "b": (x, x**3), "c": (x, np.sqrt(x))}
+
+    fitted = fit_curves(curves, max_points=900)
+
+    assert sum(len(fx) for fx, _ in fitted.values()) <= 900
+    for fx, fy in fitted.values():
+        assert (fx[0], fy[0]) == (0, 0)
+        assert (fx[-1], fy[-1]) == (1, 1)
+
+
 @pytest.mark.parametrize(
     "x_values",
     [
@@ -2,7 +2,8 @@ import json
 from collections.abc import Callable
 from types import SimpleNamespace
 
-from wandb.apis.public.history import HistoryScan
+import pytest
+from wandb.apis.public.history import HistoryColumnarScan, HistoryScan
 from wandb.proto import wandb_api_pb2 as apb
 
 
@@ -10,6 +11,8 @@ class FakeServiceApi:
     def __init__(self, pages):
         self.pages = list(pages)
         self.scan_ranges = []
+        self.in_flight = 0
+        self.max_in_flight = 0
 
     def send_api_request(self, request):
         read_request = request.read_run_history_request
@@ -36,6 +39,15 @@ class FakeServiceApi:
             )
         )
 
+    def send_api_request_nowait(self, request):
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        return self.send_api_request(request)
+
+    def wait_api_response(self, response):
+        self.in_flight -= 1
+        return response
+
     def finalize(self, *args, **kwargs) -> Callable[[], None]:
         return lambda: None
 
@@ -74,3 +86,88 @@ def test_scan_history_skips_empty_pages_before_later_history():
         {"_step": 3, "acc": 0.75},
     ]
     assert service_api.scan_ranges == [(0, 2), (2, 4)]
+
+
+def test_scan_history_numpy_yields_one_batch_per_page():
+    import numpy as np
+
+    service_api = FakeServiceApi(
+        pages=[
+            [
+                history_row(_step=0, acc=0.5, name="a"),
+                history_row(_step=1, name="b"),
+            ],
+            [],
+            [history_row(_step=4, acc=1, name="c")],
+        ]
+    )
+    run = SimpleNamespace(entity="entity", project="project", id="run-id")
+
+    scan = HistoryColumnarScan(
+        service_api=service_api,
+        run=run,
+        min_step=0,
+        max_step=6,
+        page_size=2,
+        format="numpy",
+    )
+    batches = list(scan)
+
+    assert len(batches) == 2
+    np.testing.assert_array_equal(batches[0]["_step"], np.array([0, 1]))
+    np.testing.assert_array_equal(batches[0]["acc"], np.array([0.5, np.nan]))
+    assert batches[0]["name"].tolist() == ["a", "b"]
+    assert batches[1]["acc"].tolist() == [1]
+    assert service_api.scan_ranges == [(0, 2), (2, 4), (4, 6)]
+
+
+def test_scan_history_arrow_yields_record_batches():
+    pa = pytest.importorskip("pyarrow")
+
+    service_api = FakeServiceApi(
+        pages=[
+            [
+                history_row(_step=0, acc=0.5, tags=["x"]),
+                history_row(_step=1, acc=0.75),
+            ],
+        ]
+    )
+    run = SimpleNamespace(entity="entity", project="project", id="run-id")
+
+    scan = HistoryColumnarScan(
+        service_api=service_api,
+        run=run,
+        min_step=0,
+        max_step=2,
+        page_size=2,
+        format="arrow",
+    )
+    (batch,) = list(scan)
+
+    assert isinstance(batch, pa.RecordBatch)
+    assert batch.to_pydict() == {
+        "_step": [0, 1],
+        "acc": [0.5, 0.75],
+        "tags": [["x"], None],
+    }
+
+
+def test_scan_history_prefetch_keeps_pages_in_flight_in_order():
+    service_api = FakeServiceApi(
+        pages=[[history_row(_step=step)] for step in range(5)],
+    )
+    run = SimpleNamespace(entity="entity", project="project", id="run-id")
+
+    scan = HistoryScan(
+        service_api=service_api,
+        run=run,
+        min_step=0,
+        max_step=5,
+        page_size=1,
+        prefetch_pages=2,
+    )
+
+    assert [row["_step"] for row in scan] == [0, 1, 2, 3, 4]
+    assert service_api.scan_ranges == [(0, 1), (1, 2), (2, 3), (3, 4), (4, 5)]
+    assert service_api.max_in_flight == 3
+    assert service_api.in_flight == 0
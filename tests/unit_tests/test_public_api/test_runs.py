@@ -3,7 +3,7 @@ from unittest import mock
 
 import pytest
 import wandb
-from wandb.apis.public.runs import Run, RunNotFoundError
+from wandb.apis.public.runs import Run, RunNotFoundError, Runs
 from wandb.apis.public.sweeps import Sweep
 from wandb.proto import wandb_api_pb2 as apb
 
@@ -361,3 +361,54 @@ def test_lazy_run_missing_raises():
     with pytest.raises(RunNotFoundError, match="Could not find run"):
         # run.config triggers a full data load
         _ = run.config
+
+
+def _fake_runs_history_graphql(query, variables):
+    project = {}
+    i = 0
+    while f"name{i}" in variables:
+        run_id = variables[f"name{i}"]
+        if "specs" in variables:
+            rows = [{"_step": 0, "acc": 0.5, "run": run_id}]
+            project[f"run{i}"] = {"sampledHistory": [rows]}
+        else:
+            lines = [json.dumps({"_step": 0, "loss": 1.0, "run": run_id})]
+            project[f"run{i}"] = {"history": lines}
+        i += 1
+    return {"project": project}
+
+
+@pytest.mark.parametrize("keys", [None, ["acc"]])
+def test_histories_batches_runs_into_few_queries(mocker, keys):
+    service_api = mocker.MagicMock()
+    service_api.execute_graphql.side_effect = _fake_runs_history_graphql
+    runs = Runs(service_api=service_api, entity="entity", project="project")
+    run_ids = [f"run-{i}" for i in range(45)]
+    mocker.patch.object(
+        Runs,
+        "__iter__",
+        return_value=iter([mocker.Mock(id=run_id) for run_id in run_ids]),
+    )
+
+    histories = runs.histories(keys=keys)
+
+    assert service_api.execute_graphql.call_count == 3
+    assert [row["run_id"] for row in histories] == run_ids
+    assert all(row["run"] == row["run_id"] for row in histories)
+
+
+def test_histories_pandas_builds_one_frame(mocker):
+    service_api = mocker.MagicMock()
+    service_api.execute_graphql.side_effect = _fake_runs_history_graphql
+    runs = Runs(service_api=service_api, entity="entity", project="project")
+    mocker.patch.object(
+        Runs,
+        "__iter__",
+        return_value=iter([mocker.Mock(id="a"), mocker.Mock(id="b")]),
+    )
+
+    df = runs.histories(format="pandas")
+
+    assert list(df.columns) == ["_step", "loss", "run", "run_id"]
+    assert df["run_id"].tolist() == ["a", "b"]
+    assert df.index.tolist() == [0, 1]
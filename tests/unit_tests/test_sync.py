@@ -0,0 +1,116 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+from pytest import fixture
+from pytest_mock import MockerFixture
+from wandb.proto import wandb_internal_pb2
+from wandb.sdk.internal import datastore
+from wandb.sync import sync
+from wandb.sync.sync import CHECKPOINT_SUFFIX, _SyncCheckpoint
+
+
+@fixture
+def sync_item(tmp_path: Path) -> str:
+    ds = datastore.DataStore()
+    path = str(tmp_path / "run-abc.wandb")
+    ds.open_for_write(path)
+    ds.write(wandb_internal_pb2.Record(history=wandb_internal_pb2.HistoryRecord()))
+    ds.close()
+    return path
+
+
+DESTINATION = {"entity": "e", "project": "p", "run_id": "abc"}
+
+
+def test_checkpoint_due_every_interval(sync_item: str, mocker: MockerFixture):
+    now = 0.0
+    mocker.patch.object(sync.time, "monotonic", side_effect=lambda: now)
+    checkpoint = _SyncCheckpoint(sync_item, enabled=True)
+
+    now = 20
+    assert not checkpoint.due()
+    now = 31
+    assert checkpoint.due()
+    assert not checkpoint.due()
+    now = 62
+    assert checkpoint.due()
+
+    assert not _SyncCheckpoint(sync_item, enabled=False).due()
+
+
+def test_checkpoint_save_and_finish(sync_item: str):
+    checkpoint_file = Path(f"{sync_item}{CHECKPOINT_SUFFIX}")
+    checkpoint = _SyncCheckpoint(sync_item, enabled=True)
+
+    # Nothing is saved before the run being synced to is known.
+    checkpoint.save(7)
+    assert not checkpoint_file.exists()
+
+    checkpoint.set_destination(**DESTINATION)
+    checkpoint.save(7)
+    checkpoint.finish(finished=False)
+    assert json.loads(checkpoint_file.read_text()) == {
+        "offset": 7,
+        "destination": DESTINATION,
+    }
+    assert _SyncCheckpoint(sync_item, enabled=True).resume_offset == 7
+
+    checkpoint.finish(finished=True)
+    assert not checkpoint_file.exists()
+
+
+def test_checkpoint_ignored_if_invalid(sync_item: str):
+    checkpoint_file = Path(f"{sync_item}{CHECKPOINT_SUFFIX}")
+
+    checkpoint_file.write_text("not json")
+    assert _SyncCheckpoint(sync_item, enabled=True).resume_offset is None
+
+    # Past the end of the file, so it belongs to a different file.
+    checkpoint_file.write_text(
+        json.dumps({"offset": 10**9, "destination": DESTINATION})
+    )
+    assert _SyncCheckpoint(sync_item, enabled=True).resume_offset is None
+
+    checkpoint_file.write_text(json.dumps({"offset": 7, "destination": DESTINATION}))
+    assert _SyncCheckpoint(sync_item, enabled=False).resume_offset is None
+
+
+def test_checkpoint_ignored_for_other_destination(sync_item: str):
+    Path(f"{sync_item}{CHECKPOINT_SUFFIX}").write_text(
+        json.dumps({"offset": 10, "destination": DESTINATION})
+    )
+    checkpoint = _SyncCheckpoint(sync_item, enabled=True)
+    history = wandb_internal_pb2.Record()
+    history.history.step.num = 5
+
+    checkpoint.set_destination(**{**DESTINATION, "project": "other"})
+
+    assert checkpoint.resume_offset is None
+    assert not checkpoint.skip_data(history.SerializeToString(), end_offset=10)
+    assert not checkpoint.skip_record(history, resume_step=6)
+
+
+def test_checkpoint_skips_synced_records(sync_item: str):
+    Path(f"{sync_item}{CHECKPOINT_SUFFIX}").write_text(
+        json.dumps({"offset": 10, "destination": DESTINATION})
+    )
+    checkpoint = _SyncCheckpoint(sync_item, enabled=True)
+    history = wandb_internal_pb2.Record()
+    history.history.step.num = 5
+    config = wandb_internal_pb2.Record(config=wandb_internal_pb2.ConfigRecord())
+
+    # Nothing is skipped until the destination is known to match.
+    assert not checkpoint.skip_data(history.SerializeToString(), end_offset=10)
+    checkpoint.set_destination(**DESTINATION)
+
+    # Records before the checkpoint are skipped, except ones that set state.
+    assert checkpoint.skip_data(history.SerializeToString(), end_offset=10)
+    assert not checkpoint.skip_data(history.SerializeToString(), end_offset=11)
+    assert not checkpoint.skip_data(config.SerializeToString(), end_offset=10)
+
+    # History the server already has is skipped anywhere.
+    assert checkpoint.skip_record(history, resume_step=6)
+    assert not checkpoint.skip_record(history, resume_step=5)
+    assert not checkpoint.skip_record(config, resume_step=6)
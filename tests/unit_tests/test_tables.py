@@ -1,9 +1,12 @@
 import datetime
 import json
+from unittest import mock
 
 import numpy as np
+import pandas as pd
 import pytest
 import wandb
+from wandb.sdk.data_types._dtypes import OptionalType, TimestampType
 from wandb.sdk.data_types.table import _ForeignKeyType, _PrimaryKeyType
 
 
@@ -444,3 +447,251 @@ def test_table_logging_mode_incremental_warns_after_100_increments(
         "You have exceeded 100 increments for this table. "
         "Only the latest 100 increments will be visualized in the run workspace."
     )
+
+
+def test_columnar_table_matches_row_table():
+    rows = [[1, 0.5, "a", True], [2, 1.5, "b", False], [3, 2.5, None, True]]
+    columns = ["i", "f", "s", "b"]
+    row_table = wandb.Table(columns=columns, data=rows)
+    col_table = wandb.Table(columns=columns, data=rows, storage="columnar")
+
+    assert col_table._columnar is not None
+    assert col_table._column_types == row_table._column_types
+    assert col_table.get_column("f") == [0.5, 1.5, 2.5]
+    assert col_table.get_column("s") == ["a", "b", None]
+
+    art = wandb.Artifact("A", "B")
+    assert col_table.to_json(art)["data"] == row_table.to_json(art)["data"]
+
+
+def test_columnar_table_add_rows_and_columns():
+    table = wandb.Table(columns=["a"], storage="columnar")
+    table.add_rows(np.arange(6).reshape(3, 2)[:, :1])
+    table.add_data(3)
+    table.add_columns({"b": np.array([0.0, 1.0, 2.0, 3.0]), "c": list("wxyz")})
+
+    assert table.columns == ["a", "b", "c"]
+    np.testing.assert_array_equal(
+        table.get_column("a", convert_to="numpy"), [0, 2, 4, 3]
+    )
+    assert [row for _, row in table.iterrows()][-1] == [3, 3.0, "z"]
+    assert table.get_dataframe()["c"].tolist() == ["w", "x", "y", "z"]
+
+
+def test_columnar_table_buffers_single_rows():
+    table = wandb.Table(columns=["i", "s"], storage="columnar")
+    for i in range(100):
+        table.add_data(i, str(i))
+
+    assert all(len(chunks) == 1 for chunks in table._columnar._chunks)
+    assert table.get_column("i") == list(range(100))
+    assert isinstance(table.get_column("i", convert_to="numpy"), np.ndarray)
+
+
+def test_columnar_table_mixed_chunks_return_python_numbers():
+    table = wandb.Table(columns=["a"], data=np.arange(2)[:, None], storage="columnar")
+    table.add_data(2.5)
+
+    column = table.get_column("a")
+    assert column == [0, 1, 2.5]
+    assert [type(v) for v in column] == [int, int, float]
+
+
+def test_columnar_table_rejects_incompatible_batch():
+    table = wandb.Table(columns=["a", "b"], data=[[1, "x"]], storage="columnar")
+
+    with pytest.raises(TypeError, match="Data in column 'a'"):
+        table.add_rows([[2, "y"], ["three", "z"]])
+
+    with pytest.raises(AssertionError):
+        table.add_columns({"c": [1], "d": [1, 2]})
+
+    assert table.columns == ["a", "b"]
+    assert table.data == [[1, "x"]]
+
+
+def test_columnar_table_data_converts_to_rows():
+    table = wandb.Table(columns=["a"], data=np.ones((2, 1)), storage="columnar")
+
+    table.data.append([2.0])
+
+    assert table._columnar is None
+    assert table.get_column("a") == [1.0, 1.0, 2.0]
+
+
+class _LocalEntry:
+    def __init__(self, entry):
+        self._entry = entry
+
+    def download(self):
+        return self._entry.local_path
+
+
+class _LocalArtifact:
+    """Serves the files added to an artifact that hasn't been logged."""
+
+    def __init__(self, artifact):
+        self._artifact = artifact
+
+    def get_entry(self, name):
+        return _LocalEntry(self._artifact.manifest.entries[name])
+
+
+def _table_json_round_trip():
+    art = wandb.Artifact("A", "B")
+    table = wandb.Table(
+        columns=["n", "ts", "html", "arr"],
+        data=[
+            [
+                i,
+                datetime.datetime(2000, 12, i + 1, tzinfo=datetime.timezone.utc),
+                wandb.Html(f"<p>{i}</p>"),
+                np.full((20, 2), i),
+            ]
+            for i in range(3)
+        ],
+    )
+    return table, table.to_json(art), _LocalArtifact(art)
+
+
+def test_from_json_adopts_column_types():
+    table, json_obj, source = _table_json_round_trip()
+
+    loaded = wandb.Table.from_json(json_obj, source)
+
+    assert loaded._column_types == table._column_types
+    assert [row[:2] for row in loaded.data] == [row[:2] for row in table.data]
+    assert all(isinstance(row[2], wandb.Html) for row in loaded.data)
+    assert all((row[3] == i).all() for i, row in enumerate(loaded.data))
+
+
+def test_from_json_lazy_media():
+    _, json_obj, source = _table_json_round_trip()
+
+    loaded = wandb.Table.from_json(json_obj, source, lazy_media=True)
+    assert loaded.get_column("n") == [0, 1, 2]
+    assert isinstance(loaded._rows[0][2], dict)
+
+    assert all(isinstance(html, wandb.Html) for html in loaded.get_column("html"))
+    assert isinstance(loaded.data[0][2], wandb.Html)
+
+    eager = wandb.Table.from_json(json_obj, source)
+    assert isinstance(eager._rows[0][2], wandb.Html)
+
+
+def test_from_json_checks_row_lengths():
+    _, json_obj, source = _table_json_round_trip()
+    json_obj["data"][1] = json_obj["data"][1][:-1]
+
+    with pytest.raises(ValueError, match="This table expects"):
+        wandb.Table.from_json(json_obj, source)
+
+
+class _IncrementsArtifact:
+    """An artifact holding incremental table files written to disk."""
+
+    aliases = ["latest"]
+
+    def __init__(self, tmp_path, increments):
+        self.manifest = mock.Mock(entries={})
+        for name, rows in increments.items():
+            path = tmp_path / name
+            path.write_text(json.dumps({"data": rows}))
+            self.manifest.entries[name] = mock.Mock(
+                download=mock.Mock(return_value=str(path))
+            )
+
+
+def test_incremental_from_json_merges_increments_in_order(tmp_path):
+    source = _IncrementsArtifact(
+        tmp_path,
+        {
+            f"{i}-{1000 + i}.table.table.json": [[i * 2], [i * 2 + 1]]
+            for i in reversed(range(30))
+        },
+    )
+    json_obj = {
+        "columns": ["a"],
+        "log_mode": "INCREMENTAL",
+        "increment_num": 29,
+    }
+
+    rows = wandb.Table.iter_json_rows(json_obj, source)
+    assert next(rows) == [0]
+    assert list(rows) == [[i] for i in range(1, 60)]
+
+    table = wandb.Table.from_json(json_obj, source)
+    assert table.get_column("a") == list(range(60))
+
+
+def test_incremental_from_json_invalid_increment(tmp_path):
+    source = _IncrementsArtifact(
+        tmp_path,
+        {"0-1.table.table.json": [[0]], "1-2.table.table.json": [[1]]},
+    )
+    (tmp_path / "1-2.table.table.json").write_text("{}")
+    json_obj = {"columns": ["a"], "log_mode": "INCREMENTAL", "increment_num": 1}
+
+    with pytest.raises(wandb.Error, match="1-2.table.table.json"):
+        wandb.Table.from_json(json_obj, source)
+
+
+def _table_from_rows(columns, rows):
+    table = wandb.Table(columns=columns)
+    for row in rows:
+        table.add_data(*row)
+    return table
+
+
+def test_table_from_dataframe_types_columns_by_dtype():
+    df = pd.DataFrame(
+        {
+            "i": [1, 2, 3],
+            "f": [0.5, np.nan, 2.5],
+            "b": [True, False, True],
+            "s": ["a", None, "c"],
+            "t": pd.to_datetime(["2020-01-01", "2020-01-02", "2020-01-03"]),
+        }
+    )
+
+    table = wandb.Table(dataframe=df)
+    expected = _table_from_rows(
+        list(df.columns),
+        [[df[col].values[row] for col in df.columns] for row in range(len(df))],
+    )
+
+    assert table._column_types == expected._column_types
+    assert table.data[0][:4] == [1, 0.5, True, "a"]
+    art = wandb.Artifact("A", "B")
+    assert table.to_json(art)["data"] == expected.to_json(art)["data"]
+
+
+def test_table_from_dataframe_keeps_datetime_and_extension_values():
+    df = pd.DataFrame(
+        {
+            "t": pd.date_range("2020", periods=2, tz="UTC"),
+            "c": pd.Categorical(["a", "b"]),
+        }
+    )
+
+    table = wandb.Table(dataframe=df)
+    expected = _table_from_rows(
+        list(df.columns),
+        [[df[col].values[row] for col in df.columns] for row in range(len(df))],
+    )
+
+    assert table._column_types == expected._column_types
+    assert table._column_types.params["type_map"]["t"] == OptionalType(TimestampType())
+    art = wandb.Artifact("A", "B")
+    assert table.to_json(art)["data"] == expected.to_json(art)["data"]
+
+
+def test_table_from_ndarray_types_columns_by_dtype():
+    table = wandb.Table(columns=["a", "b"], data=np.arange(6).reshape(3, 2))
+    cells = wandb.Table(columns=["a", "b"], data=np.zeros((3, 2, 4)))
+
+    assert table._column_types == _table_from_rows(["a", "b"], [[0, 1]])._column_types
+    assert table.get_column("b") == [1, 3, 5]
+    assert cells.data[0][1].shape == (4,)
+    with pytest.raises(ValueError, match="expects 2 columns"):
+        wandb.Table(columns=["a", "b"], data=np.zeros((3, 3)))
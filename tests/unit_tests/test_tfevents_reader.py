@@ -0,0 +1,128 @@
+from __future__ import annotations
+
+import os
+import struct
+from pathlib import Path
+
+from wandb.sdk.internal import tfevents_reader
+from wandb.sdk.internal.tfevents_reader import TFEventsDirTailer, TFRecordTailer
+
+
+def encode_record(data: bytes) -> bytes:
+    length = struct.pack("<Q", len(data))
+    return (
+        length
+        + struct.pack("<I", tfevents_reader.masked_crc32c(length))
+        + data
+        + struct.pack("<I", tfevents_reader.masked_crc32c(data))
+    )
+
+
+def append(path: Path, data: bytes) -> None:
+    with open(path, "ab") as f:
+        f.write(data)
+
+
+def test_masked_crc32c():
+    # The CRC-32C check value is 0xE3069283.
+    crc = 0xE3069283
+    masked = (((crc >> 15) | (crc << 17)) + 0xA282EAD8) & 0xFFFFFFFF
+
+    assert tfevents_reader.masked_crc32c(b"123456789") == masked
+
+
+def test_reads_appended_records(tmp_path: Path):
+    path = tmp_path / "events.out.tfevents.1.host"
+    append(path, encode_record(b"first") + encode_record(b"second"))
+    tailer = TFRecordTailer(str(path))
+
+    assert tailer.read_records() == [b"first", b"second"]
+    assert tailer.read_records() == []
+
+    append(path, encode_record(b"third"))
+    assert tailer.read_records() == [b"third"]
+
+
+def test_waits_for_partial_record(tmp_path: Path):
+    path = tmp_path / "events.out.tfevents.1.host"
+    record = encode_record(b"payload")
+    append(path, record[:-3])
+    tailer = TFRecordTailer(str(path))
+
+    assert tailer.read_records() == []
+
+    append(path, record[-3:])
+    assert tailer.read_records() == [b"payload"]
+    assert tailer.offset == len(record)
+
+
+def test_reads_in_bounded_chunks(tmp_path: Path):
+    path = tmp_path / "events.out.tfevents.1.host"
+    append(path, b"".join(encode_record(b"%d" % i) for i in range(100)))
+    tailer = TFRecordTailer(str(path), max_read_bytes=64)
+
+    records = []
+    while chunk := tailer.read_records():
+        assert len(chunk) < 100
+        records.extend(chunk)
+
+    assert records == [b"%d" % i for i in range(100)]
+
+
+def test_reads_record_larger_than_max_read(tmp_path: Path):
+    path = tmp_path / "events.out.tfevents.1.host"
+    append(path, encode_record(b"x" * 1000))
+    tailer = TFRecordTailer(str(path), max_read_bytes=64)
+
+    assert tailer.read_records() == [b"x" * 1000]
+
+
+def test_stops_at_corrupt_record(tmp_path: Path):
+    path = tmp_path / "events.out.tfevents.1.host"
+    append(path, encode_record(b"good") + b"\xff" * 16 + encode_record(b"after"))
+    tailer = TFRecordTailer(str(path))
+
+    assert tailer.read_records() == [b"good"]
+    assert tailer.corrupt
+    assert tailer.read_records() == []
+
+
+def test_dir_tailer_finds_new_files(tmp_path: Path):
+    tailer = TFEventsDirTailer(str(tmp_path), lambda path: "tfevents" in path)
+    first = tmp_path / "events.out.tfevents.1.host"
+    append(first, encode_record(b"a"))
+    append(tmp_path / "notes.txt", b"ignored")
+
+    assert tailer.scan() == [str(first)]
+    assert tailer.read_records() == [b"a"]
+
+    second = tmp_path / "events.out.tfevents.2.host"
+    append(second, encode_record(b"b"))
+    append(first, encode_record(b"c"))
+
+    assert tailer.scan() == [str(second)]
+    assert tailer.read_records() == [b"c", b"b"]
+
+    append(second, encode_record(b"d"))
+    assert tailer.read_records_by_file() == [(str(second), [b"d"])]
+
+
+def test_dir_tailer_skips_listing_unchanged_dir(tmp_path: Path, monkeypatch):
+    tailer = TFEventsDirTailer(str(tmp_path), lambda path: "tfevents" in path)
+    append(tmp_path / "events.out.tfevents.1.host", encode_record(b"a"))
+    old = 1_000_000_000
+    os.utime(tmp_path, ns=(old, old))
+    assert len(tailer.scan()) == 1
+
+    def fail(path):
+        raise AssertionError("listed an unchanged directory")
+
+    monkeypatch.setattr(tfevents_reader.os, "scandir", fail)
+    assert tailer.scan() == []
+
+
+def test_dir_tailer_missing_dir(tmp_path: Path):
+    tailer = TFEventsDirTailer(str(tmp_path / "missing"), lambda path: True)
+
+    assert tailer.scan() == []
+    assert tailer.read_records() == []
@@ -1,6 +1,7 @@
 import pytest
 import torch
 import torch.nn as nn
+import wandb
 from wandb.integration.torch import wandb_torch
 
 
@@ -103,3 +104,46 @@ def test_watch_bad_argument(mock_run):
         ValueError, match="log must be one of 'gradients', 'parameters', 'all', or None"
     ):
         run.watch(net, log="bad_argument")
+
+
+def test_log_tensors_stats_matches_log_tensor_stats(mocker):
+    run = mocker.patch.object(wandb, "run")
+    torch_history = wandb_torch.TorchHistory()
+    tensors = {
+        "normal": torch.randn(1000),
+        "non_finite": torch.Tensor([1.0, float("nan"), float("inf"), 3.0]),
+        "constant": torch.full((5,), 2.0),
+        "ints": torch.arange(10),
+        "empty": torch.Tensor([]),
+        "sparse": torch.Tensor([[0.0, 1.0], [2.0, 0.0]]).to_sparse(),
+    }
+
+    torch_history.log_tensors_stats(tensors)
+
+    run._log.assert_called_once()
+    histograms = run._log.call_args.args[0]
+    assert set(histograms) == set(tensors) - {"empty"}
+    for name, histogram in histograms.items():
+        expected = torch_history._tensor_histogram(tensors[name])
+        assert histogram.histogram == expected.histogram
+        assert histogram.bins == pytest.approx(expected.bins, abs=1e-5)
+
+
+def test_watch_logs_all_gradients_together(mocker):
+    run = mocker.patch.object(wandb, "run")
+    torch_history = wandb_torch.TorchHistory()
+    net = nn.Sequential(nn.Linear(10, 4), nn.Linear(4, 2))
+    torch_history.add_log_gradients_hook(net, log_freq=2)
+
+    for _ in range(4):
+        net(torch.randn(3, 10)).sum().backward()
+
+    assert run._log.call_count == 2
+    assert set(run._log.call_args.args[0]) == {
+        f"gradients/{name}" for name, _ in net.named_parameters()
+    }
+    assert net._wandb_hook_names == ["gradients/"]
+
+    torch_history.unhook("gradients/")
+    net(torch.randn(3, 10)).sum().backward()
+    assert run._log.call_count == 2
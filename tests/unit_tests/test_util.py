@@ -1,3 +1,4 @@
+import datetime
 import enum
 import json
 import os
@@ -272,6 +273,33 @@ def test_json_friendly_val_drops_numpy_float_nan(dtype):
     assert util.json_friendly_val(dtype("nan")) is None
 
 
+def test_json_dumps_history_scalars_matches_history_encoder():
+    data = {
+        "int": 3,
+        "float": 0.25,
+        "bool": True,
+        "str": "a, b",
+        "nan": float("nan"),
+        "inf": float("-inf"),
+        "np_int": np.int64(7),
+        "np_float32": np.float32(0.5),
+        "np_nan": np.float16("nan"),
+        "np_bool": np.bool_(False),
+    }
+
+    assert util.json_dumps_history_scalars(data) == [
+        util.json_dumps_safer_history(value) for value in data.values()
+    ]
+
+
+@pytest.mark.parametrize(
+    "value",
+    [None, [1, 2], {"a": 1}, np.zeros(3), np.str_("a"), datetime.date(2020, 1, 1)],
+)
+def test_json_dumps_history_scalars_rejects_non_scalars(value):
+    assert util.json_dumps_history_scalars({"a": 1, "b": value}) is None
+
+
 def test_json_dumps_safer_supports_non_string_keys():
     assert util.json_dumps_safer({1: "one"}) == '{"1":"one"}'
 
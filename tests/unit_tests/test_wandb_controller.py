@@ -0,0 +1,95 @@
+from __future__ import annotations
+
+import json
+from typing import Any
+
+import pytest
+
+pytest.importorskip("sweeps")
+
+from wandb import wandb_controller
+
+
+class FakeApi:
+    """Serves sweep runs and records what the controller asks for."""
+
+    def __init__(self) -> None:
+        self.runs: dict[str, dict[str, Any]] = {}
+        self.history: dict[str, list[list[dict]]] = {}
+        self.run_queries: list[str | None] = []
+        self.history_queries: list[list[str]] = []
+
+    def set_run(self, name: str, updated_at: str, **summary: Any) -> None:
+        self.runs[name] = {
+            "name": name,
+            "state": "running",
+            "config": json.dumps({"lr": {"value": 0.1}}),
+            "updatedAt": updated_at,
+            "summaryMetrics": json.dumps(summary),
+        }
+
+    def sweep_runs(self, sweep: str, updated_since: str | None = None) -> list[dict]:
+        self.run_queries.append(updated_since)
+        return [
+            dict(run)
+            for run in self.runs.values()
+            if updated_since is None or run["updatedAt"] >= updated_since
+        ]
+
+    def runs_sampled_history(self, runs: list[str], specs: str) -> dict[str, list]:
+        self.history_queries.append(sorted(runs))
+        return {name: self.history.get(name, [[]]) for name in runs}
+
+
+def test_run_cache_reads_only_updated_runs():
+    api = FakeApi()
+    api.set_run("a", "2024-01-01T00:00:01", loss=1.0, _step=1)
+    api.set_run("b", "2024-01-01T00:00:02", loss=2.0, _step=1)
+    api.history = {"a": [[{"_step": 1, "loss": 1.0}]], "b": [[]]}
+    cache = wandb_controller._SweepRunCache(api, "sweep")
+
+    cache.update("loss")
+    assert api.run_queries == [None]
+    assert api.history_queries == [["a", "b"]]
+    assert [run.name for run in cache.runs] == ["a", "b"]
+    assert cache.runs[0].history == [{"_step": 1, "loss": 1.0}]
+
+    # Nothing changed: only the latest run is read again, and no history.
+    cache.update("loss")
+    assert api.run_queries[-1] == "2024-01-01T00:00:02"
+    assert len(api.history_queries) == 1
+
+    # Only the run whose metric moved has its history read.
+    api.set_run("a", "2024-01-01T00:00:03", loss=0.5, _step=2)
+    cache.update("loss")
+    assert api.history_queries[-1] == ["a"]
+    assert cache.runs[0].summary_metrics == {"loss": 0.5, "_step": 2}
+
+
+def test_run_cache_rereads_history_for_new_metric():
+    api = FakeApi()
+    api.set_run("a", "2024-01-01T00:00:01", loss=1.0, acc=0.1)
+    cache = wandb_controller._SweepRunCache(api, "sweep")
+
+    cache.update(None)
+    assert api.history_queries == []
+
+    cache.update("acc")
+    assert api.history_queries == [["a"]]
+
+
+def test_run_cache_full_sync_drops_deleted_runs(monkeypatch):
+    monkeypatch.setattr(wandb_controller, "_FULL_SYNC_INTERVAL", 2)
+    api = FakeApi()
+    api.set_run("a", "2024-01-01T00:00:01")
+    api.set_run("b", "2024-01-01T00:00:02")
+    cache = wandb_controller._SweepRunCache(api, "sweep")
+    cache.update(None)
+
+    del api.runs["a"]
+    cache.update(None)
+    assert [run.name for run in cache.runs] == ["a", "b"]
+
+    cache.update(None)
+    assert api.run_queries[-1] is None
+    assert [run.name for run in cache.runs] == ["b"]
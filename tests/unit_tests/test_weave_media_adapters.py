@@ -252,9 +252,9 @@ def test_media_adapter_audio_data_uses_weave_audio_from_path(
 
     class FakeSoundFile:
         @staticmethod
-        def write(path, data, sample_rate):
-            with open(path, "wb") as f:
-                f.write(b"RIFFfake-wave")
+        def write(file, data, sample_rate, format):
+            assert format == "WAV"
+            file.write(b"RIFFfake-wave")
 
     original_get_module = audio_module.util.get_module
 
@@ -280,6 +280,7 @@ def test_media_adapter_audio_data_uses_weave_audio_from_path(
     mock_wandb_log.assert_warned("wandb.Audio values")
     assert result["kind"] == "audio-path"
     assert result["path"].suffix == ".wav"
+    assert result["path"].read_bytes() == b"RIFFfake-wave"
     assert FakeWeaveAudio.calls == [("from_path", result["path"])]
 
 
@@ -293,11 +294,11 @@ def test_media_adapter_audio_numpy_array_uses_weave_audio_from_path(
 
     class FakeSoundFile:
         @staticmethod
-        def write(path, data, sample_rate):
+        def write(file, data, sample_rate, format):
             assert data.shape == (2,)
             assert sample_rate == 2
-            with open(path, "wb") as f:
-                f.write(b"RIFFfake-wave")
+            assert format == "WAV"
+            file.write(b"RIFFfake-wave")
 
     original_get_module = audio_module.util.get_module
 
@@ -323,6 +324,7 @@ def test_media_adapter_audio_numpy_array_uses_weave_audio_from_path(
     mock_wandb_log.assert_warned("wandb.Audio values")
     assert result["kind"] == "audio-path"
     assert result["path"].suffix == ".wav"
+    assert result["path"].read_bytes() == b"RIFFfake-wave"
     assert FakeWeaveAudio.calls == [("from_path", result["path"])]
 
 
@@ -0,0 +1,123 @@
+#!/usr/bin/env python
+"""Import-time benchmark and budget for `import wandb`.
+
+Imports wandb in fresh interpreters with `python -X importtime`, reports the
+median time and the slowest modules, and fails if the import goes over its
+time budget or eagerly imports a module that must only be loaded on first
+use.
+
+Usage:
+    ./micro_import_time.py --repeat 5 --budget-ms 300 --top 15
+"""
+
+from __future__ import annotations
+
+import argparse
+import statistics
+import subprocess
+import sys
+
+# Modules that `import wandb` must not load. Each of these pulls in a large
+# part of the SDK or a third-party dependency.
+DEFAULT_FORBIDDEN = (
+    "numpy",
+    "pandas",
+    "pydantic",
+    "requests",
+    "wandb.apis.public",
+    "wandb.data_types",
+    "wandb.sdk.artifacts.artifact",
+    "wandb.sdk.wandb_init",
+    "wandb.sdk.wandb_run",
+    "wandb.sdk.wandb_settings",
+    "wandb.util",
+)
+
+
+def run_importtime(statement: str) -> list[tuple[str, int]]:
+    """Run a statement in a new interpreter with `-X importtime`.
+
+    Returns each imported module's name, indented by its nesting depth, and
+    its cumulative import time in microseconds.
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+    imports = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "[us]" in line:
+            continue
+        _, cumulative, name = line[len("import time:") :].split("|")
+        imports.append((name[1:].rstrip(), int(cumulative)))
+    return imports
+
+
+def import_times(statement: str, startup: set[str]) -> tuple[int, dict[str, int]]:
+    """Time the imports of a statement.
+
+    Returns the statement's total import time and the cumulative import time
+    of each module it imported, in microseconds. Modules in `startup`, which
+    the interpreter imports before running the statement, are excluded.
+    """
+    total = 0
+    times: dict[str, int] = {}
+    for name, cumulative in run_importtime(statement):
+        if name.strip() in startup:
+            continue
+        times[name.strip()] = cumulative
+        # Nested imports are indented under the module that imported them.
+        if not name.startswith(" "):
+            total += cumulative
+    return total, times
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--statement", default="import wandb")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument(
+        "--budget-ms",
+        type=float,
+        default=300,
+        help="Fail if the median import takes longer than this.",
+    )
+    parser.add_argument(
+        "--forbid",
+        nargs="*",
+        default=list(DEFAULT_FORBIDDEN),
+        help="Fail if any of these modules is imported.",
+    )
+    parser.add_argument("--top", type=int, default=15)
+    args = parser.parse_args()
+
+    startup = {name.strip() for name, _ in run_importtime("pass")}
+    totals = []
+    for _ in range(args.repeat):
+        total, times = import_times(args.statement, startup)
+        totals.append(total)
+    total_ms = statistics.median(totals) / 1000
+
+    print(f"{args.statement!r}: {total_ms:.1f} ms (median of {args.repeat})")
+    print(f"slowest {args.top} modules (cumulative ms):")
+    slowest = sorted(times.items(), key=lambda item: item[1], reverse=True)
+    for name, us in slowest[: args.top]:
+        print(f"  {us / 1000:8.1f}  {name}")
+
+    failures = []
+    if total_ms > args.budget_ms:
+        failures.append(f"import took {total_ms:.1f} ms, budget is {args.budget_ms} ms")
+    for name in args.forbid:
+        if name in times:
+            failures.append(f"{name} was imported eagerly")
+
+    for failure in failures:
+        print(f"FAIL: {failure}")
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    main()
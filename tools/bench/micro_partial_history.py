@@ -0,0 +1,77 @@
+#!/usr/bin/env python
+"""Microbenchmark for encoding run.log() payloads of scalars.
+
+Compares the per-step cost of the generic history encoding path
+(`history_dict_to_json` + `json_dumps_safer_history` per value) with the bulk
+scalar fast path used by `InterfaceBase.publish_partial_history`.
+
+Usage:
+    ./micro_partial_history.py --keys 200 --steps 2000
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+
+import numpy as np
+from wandb import util
+from wandb.proto import wandb_internal_pb2 as pb
+from wandb.sdk.data_types.utils import history_dict_to_json
+
+
+def make_payload(num_keys: int, step: int) -> dict:
+    payload = {}
+    for i in range(num_keys):
+        if i % 4 == 0:
+            payload[f"np/metric_{i}"] = np.float32(step * 0.1 + i)
+        elif i % 4 == 1:
+            payload[f"int/metric_{i}"] = step + i
+        else:
+            payload[f"float/metric_{i}"] = step * 0.01 + i
+    payload["_timestamp"] = time.time()
+    return payload
+
+
+def encode_generic(data: dict, step: int) -> pb.PartialHistoryRequest:
+    data = history_dict_to_json(None, data, step=step, ignore_copy_err=True)
+    request = pb.PartialHistoryRequest()
+    for k, v in data.items():
+        request.item.add(key=k, value_json=util.json_dumps_safer_history(v))
+    return request
+
+
+def encode_fast(data: dict, step: int) -> pb.PartialHistoryRequest:
+    values_json = util.json_dumps_history_scalars(data)
+    assert values_json is not None
+    request = pb.PartialHistoryRequest()
+    for k, v in zip(data, values_json, strict=True):
+        request.item.add(key=k, value_json=v)
+    return request
+
+
+def bench(encode, args) -> float:
+    payloads = [make_payload(args.keys, step) for step in range(args.steps)]
+    start = time.perf_counter()
+    for step, payload in enumerate(payloads):
+        encode(payload, step)
+    return (time.perf_counter() - start) / args.steps
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--keys", type=int, default=100)
+    parser.add_argument("--steps", type=int, default=2000)
+    args = parser.parse_args()
+
+    generic = bench(encode_generic, args)
+    fast = bench(encode_fast, args)
+
+    print(f"keys per step:  {args.keys}")
+    print(f"generic path:   {generic * 1e6:9.1f} us/step")
+    print(f"scalar path:    {fast * 1e6:9.1f} us/step")
+    print(f"speedup:        {generic / fast:9.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,108 @@
+#!/usr/bin/env python
+"""Microbenchmark for publishing records to the service socket.
+
+Publishes `run.log()` payloads through `InterfaceSock` to a socket that a
+background thread reads and discards, and reports records per second and
+the latency percentiles of `publish_partial_history`.
+
+Compares the queued publish path, which returns once the record is queued
+for the asyncio writer, with the previous path, which copied each record into
+a ServerRequest and waited in the asyncio thread until it was written.
+
+Usage:
+    ./micro_publish.py --keys 20 --records 20000
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import socket
+import statistics
+import struct
+import threading
+import time
+
+from wandb.proto import wandb_internal_pb2 as pb
+from wandb.proto import wandb_server_pb2 as spb
+from wandb.sdk.interface.interface_sock import InterfaceSock
+from wandb.sdk.lib import asyncio_manager
+from wandb.sdk.lib.service.service_client import ServiceClient
+
+
+class _LegacyInterfaceSock(InterfaceSock):
+    """Publishes records one at a time in the asyncio thread."""
+
+    def _publish(self, record: pb.Record, *, nowait: bool = False) -> None:
+        self._assign(record)
+        request = spb.ServerRequest()
+        request.record_publish.CopyFrom(record)
+        self._asyncer.run(lambda: self._write(request))
+
+    async def _write(self, request: spb.ServerRequest) -> None:
+        writer = self._client._writer
+        writer.write(struct.pack("<BI", ord("W"), request.ByteSize()))
+        writer.write(request.SerializeToString())
+        await writer.drain()
+
+
+def _discard(sock: socket.socket, done: threading.Event) -> None:
+    """Read from the socket until it's closed."""
+    while sock.recv(1 << 20):
+        pass
+    done.set()
+
+
+def bench(interface_cls: type[InterfaceSock], args) -> tuple[float, list[float]]:
+    """Return records per second and per-call latencies in seconds."""
+    asyncer = asyncio_manager.AsyncioManager()
+    asyncer.start()
+
+    client_sock, server_sock = socket.socketpair()
+    done = threading.Event()
+    threading.Thread(target=_discard, args=(server_sock, done), daemon=True).start()
+
+    reader, writer = asyncer.run(lambda: asyncio.open_connection(sock=client_sock))
+    client = ServiceClient(asyncer, reader, writer)
+    interface = interface_cls(asyncer, client, "stream")
+
+    payload = {f"metric_{i}": i * 0.5 for i in range(args.keys)}
+    latencies = []
+
+    start = time.perf_counter()
+    for step in range(args.records):
+        t = time.perf_counter()
+        interface.publish_partial_history(None, dict(payload), user_step=step)
+        latencies.append(time.perf_counter() - t)
+
+    asyncer.run(client.close)
+    done.wait()
+    elapsed = time.perf_counter() - start
+
+    asyncer.join()
+    server_sock.close()
+    return args.records / elapsed, latencies
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--keys", type=int, default=20)
+    parser.add_argument("--records", type=int, default=20000)
+    args = parser.parse_args()
+
+    print(f"keys per record: {args.keys}")
+    for name, interface_cls in (
+        ("previous", _LegacyInterfaceSock),
+        ("queued", InterfaceSock),
+    ):
+        rate, latencies = bench(interface_cls, args)
+        percentiles = statistics.quantiles(latencies, n=100)
+        print(
+            f"{name:>9}: {rate:9.0f} records/s"
+            f"  p50 {percentiles[49] * 1e6:7.1f} us"
+            f"  p99 {percentiles[98] * 1e6:7.1f} us"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+#!/usr/bin/env python
+"""Microbenchmark for creating a wandb.Table from a DataFrame or an ndarray.
+
+Compares `wandb.Table(dataframe=...)` and `wandb.Table(data=ndarray)` with
+adding the same rows one at a time with `add_data`, which is how tables
+were built from DataFrames and arrays before types were derived from the
+NumPy dtypes.
+
+Usage:
+    ./micro_table_ingest.py --rows 200000 --cols 20
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+
+import numpy as np
+import pandas as pd
+
+import wandb
+
+
+def make_dataframe(rows: int, cols: int, object_cols: int) -> pd.DataFrame:
+    rng = np.random.default_rng(0)
+    data = {}
+    for i in range(cols):
+        if i < object_cols:
+            data[f"c{i}"] = [f"s{v}" for v in rng.integers(0, 100, rows)]
+        elif i % 3 == 0:
+            data[f"c{i}"] = rng.integers(0, 1000, rows)
+        elif i % 3 == 1:
+            data[f"c{i}"] = rng.random(rows)
+        else:
+            data[f"c{i}"] = rng.random(rows) > 0.5
+    return pd.DataFrame(data)
+
+
+def from_dataframe(df: pd.DataFrame) -> None:
+    wandb.Table(dataframe=df)
+
+
+def from_ndarray(df: pd.DataFrame) -> None:
+    wandb.Table(columns=list(df.columns), data=df.to_numpy())
+
+
+def per_row(df: pd.DataFrame) -> None:
+    table = wandb.Table(columns=list(df.columns))
+    columns = [df[col].values for col in df.columns]
+    for row in range(len(df)):
+        table.add_data(*(values[row] for values in columns))
+
+
+def per_row_ndarray(df: pd.DataFrame) -> None:
+    table = wandb.Table(columns=list(df.columns))
+    for row in df.to_numpy():
+        table.add_data(*row)
+
+
+def bench(fn, df: pd.DataFrame) -> float:
+    start = time.perf_counter()
+    fn(df)
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", type=int, default=200_000)
+    parser.add_argument("--cols", type=int, default=20)
+    parser.add_argument(
+        "--object-cols",
+        type=int,
+        default=2,
+        help="Number of string columns, which are typed cell by cell.",
+    )
+    args = parser.parse_args()
+
+    df = make_dataframe(args.rows, args.cols, args.object_cols)
+    numeric = df.select_dtypes("number")
+    print(f"{args.rows} rows x {args.cols} columns")
+    print(f"dataframe        {bench(from_dataframe, df):8.3f} s")
+    print(f"dataframe (rows) {bench(per_row, df):8.3f} s")
+
+    ndarray_df = pd.DataFrame(numeric.to_numpy(), columns=numeric.columns)
+    print(f"ndarray          {bench(from_ndarray, ndarray_df):8.3f} s")
+    print(f"ndarray (rows)   {bench(per_row_ndarray, ndarray_df):8.3f} s")
+
+
+if __name__ == "__main__":
+    main()
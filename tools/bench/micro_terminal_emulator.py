@@ -0,0 +1,109 @@
+#!/usr/bin/env python
+"""Microbenchmark for the console TerminalEmulator.
+
+Replays synthetic console streams through `TerminalEmulator`, reading the
+emulator's output periodically the way the console redirect does, and
+reports the CPU time spent per MB of console output.
+
+Streams:
+    tqdm   progress bars redrawn with carriage returns, interleaved with logs
+    ansi   colored log lines with cursor movement and line erasure
+    plain  plain log lines
+
+Usage:
+    ./micro_terminal_emulator.py --mb 4 --read-every 64
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import time
+from collections.abc import Iterator
+
+from wandb.sdk.lib.redirect import TerminalEmulator
+
+
+def tqdm_stream(rng: random.Random) -> Iterator[str]:
+    epoch = 0
+    while True:
+        epoch += 1
+        for i in range(101):
+            bar = "#" * (i // 10) + " " * (10 - i // 10)
+            rate = rng.uniform(10, 100)
+            yield f"\rEpoch {epoch}: {i:3d}%|{bar}| {i}/100 [{rate:.2f}it/s]"
+        yield "\n"
+        yield f"Epoch {epoch}: loss={rng.random():.4f} acc={rng.random():.4f}\n"
+
+
+def ansi_stream(rng: random.Random) -> Iterator[str]:
+    colors = [31, 32, 33, 34, 35, 36]
+    step = 0
+    while True:
+        step += 1
+        color = rng.choice(colors)
+        yield f"\x1b[{color}m[INFO]\x1b[0m \x1b[1mstep {step}\x1b[0m"
+        yield f" value={rng.random():.6f}\n"
+        if step % 10 == 0:
+            yield f"\x1b[2A\x1b[2K\x1b[42m status {step} \x1b[0m\x1b[K\n\n"
+
+
+def plain_stream(rng: random.Random) -> Iterator[str]:
+    step = 0
+    while True:
+        step += 1
+        yield f"step {step}: loss={rng.random():.6f}\n"
+
+
+STREAMS = {
+    "tqdm": tqdm_stream,
+    "ansi": ansi_stream,
+    "plain": plain_stream,
+}
+
+
+def make_chunks(name: str, size: int) -> list[str]:
+    chunks = []
+    total = 0
+    for chunk in STREAMS[name](random.Random(0)):
+        chunks.append(chunk)
+        total += len(chunk)
+        if total >= size:
+            return chunks
+    return chunks
+
+
+def bench(chunks: list[str], read_every: int) -> float:
+    """Return the CPU seconds to write and read all chunks."""
+    emulator = TerminalEmulator()
+    start = time.process_time()
+    for i, chunk in enumerate(chunks, 1):
+        emulator.write(chunk)
+        if i % read_every == 0:
+            emulator.read()
+    emulator.read()
+    return time.process_time() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--mb", type=float, default=4)
+    parser.add_argument(
+        "--read-every",
+        type=int,
+        default=64,
+        help="Number of writes between reads of the emulator's output.",
+    )
+    parser.add_argument("--streams", nargs="+", default=list(STREAMS))
+    args = parser.parse_args()
+
+    size = int(args.mb * 1024 * 1024)
+    for name in args.streams:
+        chunks = make_chunks(name, size)
+        mb = sum(map(len, chunks)) / (1024 * 1024)
+        cpu = bench(chunks, args.read_every)
+        print(f"{name:6s} {mb:6.2f} MB  {cpu / mb:8.3f} CPU s/MB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+#!/usr/bin/env python
+"""Microbenchmark for computing wandb.watch() histograms of a model's tensors.
+
+Compares the per-step cost of summarizing each tensor on its own
+(`TorchHistory.log_tensor_stats`) with summarizing all of them in one pass
+(`TorchHistory.log_tensors_stats`). Runs on the CPU by default.
+
+Usage:
+    ./micro_torch_histograms.py --tensors 500 --numel 4096 --steps 20
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+from unittest import mock
+
+import torch
+import wandb
+from wandb.integration.torch import wandb_torch
+
+
+def make_tensors(args) -> dict[str, torch.Tensor]:
+    return {
+        f"gradients/layer_{i}.weight": torch.randn(args.numel, device=args.device)
+        for i in range(args.tensors)
+    }
+
+
+def log_one_by_one(history: wandb_torch.TorchHistory, tensors: dict) -> None:
+    for name, tensor in tensors.items():
+        history.log_tensor_stats(tensor, name)
+
+
+def log_batched(history: wandb_torch.TorchHistory, tensors: dict) -> None:
+    history.log_tensors_stats(tensors)
+
+
+def bench(log, args) -> tuple[float, int]:
+    history = wandb_torch.TorchHistory()
+    tensors = make_tensors(args)
+    with mock.patch.object(wandb, "run") as run:
+        log(history, tensors)  # warm up
+        run.reset_mock()
+        start = time.perf_counter()
+        for _ in range(args.steps):
+            log(history, tensors)
+        elapsed = time.perf_counter() - start
+    return elapsed / args.steps, run._log.call_count // args.steps
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--tensors", type=int, default=500)
+    parser.add_argument("--numel", type=int, default=4096)
+    parser.add_argument("--steps", type=int, default=20)
+    parser.add_argument("--device", default="cpu")
+    args = parser.parse_args()
+
+    single, single_logs = bench(log_one_by_one, args)
+    batched, batched_logs = bench(log_batched, args)
+
+    print(f"tensors per step: {args.tensors} x {args.numel} on {args.device}")
+    print(f"per tensor:       {single * 1e3:9.1f} ms/step, {single_logs} logs")
+    print(f"batched:          {batched * 1e3:9.1f} ms/step, {batched_logs} logs")
+    print(f"speedup:          {single / batched:9.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -22,104 +22,117 @@ from wandb.errors.term import termsetup, termlog, termerror, termwarn
 from wandb.sdk.lib import wb_logging as _wb_logging
 _wb_logging.configure_wandb_logger()
 
-from wandb import sdk as wandb_sdk
-
-import wandb
-
-wandb.wandb_lib = wandb_sdk.lib  # type: ignore
-
-init = wandb_sdk.init
-setup = wandb_sdk.setup
-attach = _attach = wandb_sdk._attach
-teardown = _teardown = wandb_sdk.teardown
-finish = wandb_sdk.finish
-join = finish
-login = wandb_sdk.login
-helper = wandb_sdk.helper
-sweep = wandb_sdk.sweep
-controller = wandb_sdk.controller
-require = wandb_sdk.require
-Artifact = wandb_sdk.Artifact
-AlertLevel = wandb_sdk.AlertLevel
-Settings = wandb_sdk.Settings
-Config = wandb_sdk.Config
-
-from wandb.apis import InternalApi, PublicApi
 from wandb.errors import CommError, UsageError
 
 from wandb.sdk.lib import preinit as _preinit
 from wandb.sdk.lib import lazyloader as _lazyloader
 
-from wandb.integration.torch import wandb_torch
-
 from wandb.sdk.data_types._private import _cleanup_media_tmp_dir
 
 _cleanup_media_tmp_dir()
 
-from wandb.data_types import Graph
-from wandb.data_types import Image
-from wandb.data_types import Plotly
-from wandb.data_types import Video
-from wandb.data_types import Audio
-from wandb.data_types import Table
-from wandb.data_types import EvalTable
-from wandb.data_types import Html
-from wandb.data_types import box3d
-from wandb.data_types import Object3D
-from wandb.data_types import Molecule
-from wandb.data_types import Histogram
-from wandb.data_types import Classes
-from wandb.data_types import JoinedTable
+# The public namespace is imported on first use, see __getattr__ below.
+_lazy_getattr, _lazy_dir = _lazyloader.lazy_attributes(
+    __name__,
+    globals(),
+    {
+        "wandb_sdk": ("wandb.sdk", None),
+        "wandb_lib": ("wandb.sdk.lib", None),
+        "init": ("wandb.sdk", "init"),
+        "setup": ("wandb.sdk", "setup"),
+        "attach": ("wandb.sdk", "_attach"),
+        "_attach": ("wandb.sdk", "_attach"),
+        "teardown": ("wandb.sdk", "teardown"),
+        "_teardown": ("wandb.sdk", "teardown"),
+        "finish": ("wandb.sdk", "finish"),
+        "join": ("wandb.sdk", "finish"),
+        "login": ("wandb.sdk", "login"),
+        "helper": ("wandb.sdk", "helper"),
+        "sweep": ("wandb.sdk", "sweep"),
+        "controller": ("wandb.sdk", "controller"),
+        "require": ("wandb.sdk", "require"),
+        "Artifact": ("wandb.sdk", "Artifact"),
+        "AlertLevel": ("wandb.sdk", "AlertLevel"),
+        "Settings": ("wandb.sdk", "Settings"),
+        "Config": ("wandb.sdk", "Config"),
+        "InternalApi": ("wandb.apis", "InternalApi"),
+        "PublicApi": ("wandb.apis", "PublicApi"),
+        "Api": ("wandb.apis", "PublicApi"),
+        "wandb_torch": ("wandb.integration.torch.wandb_torch", None),
+        "Graph": ("wandb.data_types", "Graph"),
+        "Image": ("wandb.data_types", "Image"),
+        "Plotly": ("wandb.data_types", "Plotly"),
+        "Video": ("wandb.data_types", "Video"),
+        "Audio": ("wandb.data_types", "Audio"),
+        "Table": ("wandb.data_types", "Table"),
+        "EvalTable": ("wandb.data_types", "EvalTable"),
+        "Html": ("wandb.data_types", "Html"),
+        "box3d": ("wandb.data_types", "box3d"),
+        "Object3D": ("wandb.data_types", "Object3D"),
+        "Molecule": ("wandb.data_types", "Molecule"),
+        "Histogram": ("wandb.data_types", "Histogram"),
+        "Classes": ("wandb.data_types", "Classes"),
+        "JoinedTable": ("wandb.data_types", "JoinedTable"),
+        "agent": ("wandb.wandb_agent", "agent"),
+        "visualize": ("wandb.plot", "visualize"),
+        "plot_table": ("wandb.plot", "plot_table"),
+        "sagemaker_auth": ("wandb.integration.sagemaker", "sagemaker_auth"),
+        "profiler": ("wandb.sdk.internal.profiler", None),
+        "Run": ("wandb.sdk.wandb_run", "Run"),
+        "restore": ("wandb.sdk.wandb_run", "restore"),
+        # Artifact import types
+        "ArtifactTTL": ("wandb.sdk.artifacts.artifact_ttl", "ArtifactTTL"),
+    },
+)
 
-from wandb.wandb_agent import agent
+# Run methods that raise an error until wandb.init() replaces them.
+_PREINIT_CALLABLES = (
+    "log",
+    "watch",
+    "unwatch",
+    "save",
+    "use_artifact",
+    "log_artifact",
+    "log_model",
+    "use_model",
+    "link_model",
+    "define_metric",
+    "mark_preempting",
+    "alert",
+    "pin_config_keys",
+)
 
-from wandb.plot import visualize, plot_table
-from wandb.integration.sagemaker import sagemaker_auth
-from wandb.sdk.internal import profiler
-from wandb.sdk.wandb_run import Run
 
-# Artifact import types
-from wandb.sdk.artifacts.artifact_ttl import ArtifactTTL
+def __getattr__(name: str):
+    if name in _PREINIT_CALLABLES:
+        from wandb.sdk.wandb_run import Run
 
+        value = _preinit.PreInitCallable(f"wandb.{name}", getattr(Run, name))
+    elif name == "config":
+        from wandb.sdk.wandb_config import Config
 
-# globals
-Api = PublicApi
-api = InternalApi()
-run: Run | None = None
-config = _preinit.PreInitObject("wandb.config", wandb_sdk.wandb_config.Config)
-summary = _preinit.PreInitObject("wandb.summary", wandb_sdk.wandb_summary.Summary)
-log = _preinit.PreInitCallable("wandb.log", Run.log)  # type: ignore
-watch = _preinit.PreInitCallable("wandb.watch", Run.watch)  # type: ignore
-unwatch = _preinit.PreInitCallable("wandb.unwatch", Run.unwatch)  # type: ignore
-save = _preinit.PreInitCallable("wandb.save", Run.save)  # type: ignore
-restore = wandb_sdk.wandb_run.restore
-use_artifact = _preinit.PreInitCallable(
-    "wandb.use_artifact", Run.use_artifact  # type: ignore
-)
-log_artifact = _preinit.PreInitCallable(
-    "wandb.log_artifact", Run.log_artifact  # type: ignore
-)
-log_model = _preinit.PreInitCallable(
-    "wandb.log_model", Run.log_model  # type: ignore
-)
-use_model = _preinit.PreInitCallable(
-    "wandb.use_model", Run.use_model  # type: ignore
-)
-link_model = _preinit.PreInitCallable(
-    "wandb.link_model", Run.link_model  # type: ignore
-)
-define_metric = _preinit.PreInitCallable(
-    "wandb.define_metric", Run.define_metric  # type: ignore
-)
+        value = _preinit.PreInitObject("wandb.config", Config)
+    elif name == "summary":
+        from wandb.sdk.wandb_summary import Summary
 
-mark_preempting = _preinit.PreInitCallable(
-    "wandb.mark_preempting", Run.mark_preempting  # type: ignore
-)
+        value = _preinit.PreInitObject("wandb.summary", Summary)
+    elif name == "api":
+        from wandb.apis import InternalApi
 
-alert = _preinit.PreInitCallable("wandb.alert", Run.alert)  # type: ignore
-pin_config_keys = _preinit.PreInitCallable(
-    "wandb.pin_config_keys", Run.pin_config_keys  # type: ignore
-)
+        value = InternalApi()
+    else:
+        return _lazy_getattr(name)
+
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted({*_lazy_dir(), *_PREINIT_CALLABLES, "config", "summary", "api"})
+
+
+# globals
+run = None
 
 # record of patched libraries
 patched = {"tensorboard": [], "keras": [], "gym": []}  # type: ignore
@@ -148,6 +161,8 @@ sacred = _lazyloader.LazyLoader("wandb.sacred", globals(), "wandb.integration.sa
 
 def ensure_configured():
     global api
+    from wandb.apis import InternalApi
+
     api = InternalApi()
 
 
@@ -157,7 +172,9 @@ def set_trace():
     pdb.set_trace()
 
 
-if wandb_sdk.lib.ipython.in_notebook():
+from wandb.sdk.lib import ipython as _ipython
+
+if _ipython.in_notebook():
     from IPython import get_ipython  # type: ignore[import-not-found]
 
     jupyter._load_ipython_extension(get_ipython())
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 from collections.abc import Callable
+from typing import TYPE_CHECKING, Any
 
 import wandb
 from wandb import env, util
@@ -40,11 +41,25 @@ if env.ssl_disabled():
     _disable_ssl()
 
 
-reset_path = util.vendor_setup()
+__all__ = ["InternalApi", "PublicApi"]
 
-from .internal import Api as InternalApi  # noqa
-from .public import Api as PublicApi  # noqa
+if TYPE_CHECKING:
+    from .internal import Api as InternalApi
+    from .public import Api as PublicApi
 
-reset_path()
 
-__all__ = ["InternalApi", "PublicApi"]
+def __getattr__(name: str) -> Any:
+    # The APIs are imported on first use, since importing them is slow and
+    # their submodules (like wandb.apis.normalize) are used on their own.
+    if name not in __all__:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    reset_path = util.vendor_setup()
+    try:
+        from .internal import Api as InternalApi
+        from .public import Api as PublicApi
+    finally:
+        reset_path()
+
+    globals().update(InternalApi=InternalApi, PublicApi=PublicApi)
+    return globals()[name]
@@ -123,6 +123,12 @@ class Api:
     def sweep(self, *args, **kwargs):
         return self.api.sweep(*args, **kwargs)
 
+    def sweep_runs(self, *args, **kwargs):
+        return self.api.sweep_runs(*args, **kwargs)
+
+    def runs_sampled_history(self, *args, **kwargs):
+        return self.api.runs_sampled_history(*args, **kwargs)
+
     def upsert_sweep(self, *args, **kwargs):
         return self.api.upsert_sweep(*args, **kwargs)
 
@@ -174,6 +180,9 @@ class Api:
     def get_run_state(self, *args, **kwargs):
         return self.api.get_run_state(*args, **kwargs)
 
+    def get_run_states(self, *args, **kwargs):
+        return self.api.get_run_states(*args, **kwargs)
+
     def entity_is_team(self, *args, **kwargs):
         return self.api.entity_is_team(*args, **kwargs)
 
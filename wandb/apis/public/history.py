@@ -12,20 +12,30 @@ Note:
 from __future__ import annotations
 
 import json
-from collections.abc import Iterator
-from typing import TYPE_CHECKING, Any, TypeAlias
+from collections import deque
+from collections.abc import Iterator, Sequence
+from typing import TYPE_CHECKING, Any, Literal, TypeAlias
 
 from typing_extensions import Self
 
+from wandb import util
 from wandb.proto import wandb_api_pb2 as pb
 
 if TYPE_CHECKING:
+    import numpy as np
+    import pyarrow as pa
+
+    from wandb.sdk.mailbox.mailbox_handle import MailboxHandle
+
     from . import runs
     from .service_api import ServiceApi
 
 _RowDict: TypeAlias = dict[str, Any]
 """Type alias for a single history row as a dict."""
 
+HistoryScanFormat: TypeAlias = Literal["dict", "arrow", "numpy"]
+"""Output formats supported by `Run.scan_history`."""
+
 
 class HistoryScan(Iterator[_RowDict]):
     """Iterator for scanning complete run history."""
@@ -40,12 +50,14 @@ class HistoryScan(Iterator[_RowDict]):
         keys: list[str] | None = None,
         page_size: int = 1_000,
         use_cache: bool = True,
+        prefetch_pages: int = 0,
     ):
         self.run = run
         self.min_step = min_step
         self._stop_step = max_step
         self.keys = keys
         self.page_size = page_size
+        self.prefetch_pages = prefetch_pages
         self._service_api = service_api
 
         # Tell wandb-core to initialize resources to scan the run's history.
@@ -73,6 +85,10 @@ class HistoryScan(Iterator[_RowDict]):
         self.rows: list[_RowDict] = []
         self.keys = keys
 
+        # Page requests sent ahead of the consumer, in step order.
+        self._read_ahead: deque[MailboxHandle[pb.ApiResponse]] = deque()
+        self._read_ahead_offset = self.min_step
+
         # Clean up resources when the object is GC'ed.
         self._service_api.finalize(
             self,
@@ -88,6 +104,12 @@ class HistoryScan(Iterator[_RowDict]):
         self.scan_offset = 0
         self.page_offset = self.min_step
         self.rows = []
+
+        for handle in self._read_ahead:
+            handle.cancel()
+        self._read_ahead.clear()
+        self._read_ahead_offset = self.min_step
+
         return self
 
     def __next__(self) -> _RowDict:
@@ -105,28 +127,57 @@ class HistoryScan(Iterator[_RowDict]):
             self._load_next()
 
     def _load_next(self) -> None:
-        from wandb.proto import wandb_api_pb2 as pb
+        self.rows = [
+            self._convert_history_row_to_dict(row) for row in self._fetch_next_page()
+        ]
+        self.scan_offset = 0
 
-        max_step = min(self.page_offset + self.page_size, self._stop_step)
+    def _fetch_next_page(self) -> Sequence[pb.HistoryRow]:
+        """Read the rows of the next step window and advance `page_offset`.
 
-        read_run_history_request = pb.ReadRunHistoryRequest(
-            scan_run_history=pb.ScanRunHistory(
-                min_step=self.page_offset,
-                max_step=max_step,
-                request_id=self._scan_request_id,
-            ),
-        )
-        api_request = pb.ApiRequest(read_run_history_request=read_run_history_request)
+        With `prefetch_pages` set, up to that many later pages are requested
+        before waiting on this one, so that wandb-core reads them while the
+        caller decodes and consumes this page.
+        """
+        response: pb.ApiResponse
+        if self.prefetch_pages > 0:
+            self._fill_read_ahead()
+            handle = self._read_ahead.popleft()
+            response = self._service_api.wait_api_response(handle)
+        else:
+            response = self._service_api.send_api_request(
+                self._scan_page_request(self.page_offset)
+            )
 
-        response: pb.ApiResponse = self._service_api.send_api_request(api_request)
         run_history: pb.RunHistoryResponse = (
             response.read_run_history_response.run_history
         )
-        self.rows = [
-            self._convert_history_row_to_dict(row) for row in run_history.history_rows
-        ]
         self.page_offset += self.page_size
-        self.scan_offset = 0
+        return run_history.history_rows
+
+    def _fill_read_ahead(self) -> None:
+        """Send page requests until `prefetch_pages` pages are queued ahead."""
+        while (
+            len(self._read_ahead) <= self.prefetch_pages
+            and self._read_ahead_offset < self._stop_step
+        ):
+            self._read_ahead.append(
+                self._service_api.send_api_request_nowait(
+                    self._scan_page_request(self._read_ahead_offset)
+                )
+            )
+            self._read_ahead_offset += self.page_size
+
+    def _scan_page_request(self, min_step: int) -> pb.ApiRequest:
+        """Returns the request for the page of steps starting at min_step."""
+        read_run_history_request = pb.ReadRunHistoryRequest(
+            scan_run_history=pb.ScanRunHistory(
+                min_step=min_step,
+                max_step=min(min_step + self.page_size, self._stop_step),
+                request_id=self._scan_request_id,
+            ),
+        )
+        return pb.ApiRequest(read_run_history_request=read_run_history_request)
 
     @staticmethod
     def _convert_history_row_to_dict(history_row: pb.HistoryRow) -> _RowDict:
@@ -135,6 +186,137 @@ class HistoryScan(Iterator[_RowDict]):
         }
 
 
+class HistoryColumnarScan(HistoryScan):
+    """Iterator for scanning complete run history as columnar batches.
+
+    Yields one batch per non-empty page instead of one dict per row. Values
+    are decoded one column at a time, so no intermediate per-row dicts are
+    built. Rows missing a key hold a null (Arrow) or NaN/None (NumPy) in
+    that key's column.
+    """
+
+    def __init__(
+        self,
+        run: runs.Run,
+        *,
+        service_api: ServiceApi,
+        min_step: int,
+        max_step: int,
+        format: Literal["arrow", "numpy"],
+        keys: list[str] | None = None,
+        page_size: int = 1_000,
+        use_cache: bool = True,
+        prefetch_pages: int = 0,
+    ):
+        if format == "arrow":
+            util.get_module(
+                "pyarrow",
+                required="scan_history(format='arrow') requires pyarrow,"
+                + " install with `pip install pyarrow`",
+                lazy=False,
+            )
+        elif format == "numpy":
+            util.get_module(
+                "numpy",
+                required="scan_history(format='numpy') requires numpy,"
+                + " install with `pip install numpy`",
+                lazy=False,
+            )
+        else:
+            raise ValueError(f"Unsupported history scan format: {format!r}")
+
+        self.format = format
+        super().__init__(
+            run,
+            service_api=service_api,
+            min_step=min_step,
+            max_step=max_step,
+            keys=keys,
+            page_size=page_size,
+            use_cache=use_cache,
+            prefetch_pages=prefetch_pages,
+        )
+
+    def __next__(self) -> Any:  # type: ignore[override]
+        while self.page_offset < self._stop_step:
+            history_rows = self._fetch_next_page()
+            if not history_rows:
+                # As in row mode, empty step ranges don't end the scan.
+                continue
+
+            columns = _decode_columns(history_rows)
+            if self.format == "arrow":
+                return _to_record_batch(columns)
+            return _to_numpy_columns(columns)
+
+        raise StopIteration()
+
+
+def _decode_columns(history_rows: Sequence[pb.HistoryRow]) -> dict[str, list[Any]]:
+    """Decode a page of history rows into one list of values per key.
+
+    All JSON values of a column are parsed with a single `json.loads` call
+    by joining them into one JSON array. Missing cells are None.
+    """
+    n_rows = len(history_rows)
+    encoded: dict[str, list[str]] = {}
+
+    for i, history_row in enumerate(history_rows):
+        for item in history_row.history_items:
+            column = encoded.get(item.key)
+            if column is None:
+                column = encoded[item.key] = ["null"] * n_rows
+            column[i] = item.value_json
+
+    return {
+        key: json.loads("[" + ",".join(values) + "]") for key, values in encoded.items()
+    }
+
+
+def _to_record_batch(columns: dict[str, list[Any]]) -> pa.RecordBatch:
+    import pyarrow as pa
+
+    return pa.RecordBatch.from_pydict(columns)
+
+
+def _to_numpy_columns(columns: dict[str, list[Any]]) -> dict[str, np.ndarray]:
+    """Convert decoded columns to NumPy arrays.
+
+    Numeric columns with missing cells become float arrays with NaN for the
+    missing values. Columns that can't be represented as a flat array of
+    scalars (strings mixed with numbers, nested values) use dtype=object.
+    """
+    import numpy as np
+
+    arrays: dict[str, np.ndarray] = {}
+    for key, values in columns.items():
+        if all(
+            value is None
+            or (isinstance(value, (int, float)) and not isinstance(value, bool))
+            for value in values
+        ):
+            if None in values:
+                arrays[key] = np.array(
+                    [np.nan if value is None else value for value in values],
+                    dtype=np.float64,
+                )
+            else:
+                arrays[key] = np.array(values)
+            continue
+
+        if all(isinstance(value, str) for value in values) or all(
+            isinstance(value, bool) for value in values
+        ):
+            arrays[key] = np.array(values)
+            continue
+
+        array = np.empty(len(values), dtype=object)
+        array[:] = values
+        arrays[key] = array
+
+    return arrays
+
+
 def _scan_cleanup_request(id: int) -> pb.ApiRequest:
     """Returns a ScanRunHistoryCleanup request for the given ID."""
     scan_cleanup_request = pb.ScanRunHistoryCleanup(request_id=id)
@@ -11,7 +11,6 @@ from wandb._strutils import nameof
 from wandb.apis.public.teams import Team
 from wandb.apis.public.users import User
 from wandb.proto import wandb_internal_pb2 as pb
-from wandb.sdk.artifacts._models import RegistryData
 
 from ._freezable_list import AddOnlyArtifactTypesList
 from ._members import (
@@ -29,6 +28,7 @@ if TYPE_CHECKING:
     from wandb.apis.public.api import Api
     from wandb.apis.public.service_api import ServiceApi
     from wandb.sdk.artifacts._generated import RegistryFragment
+    from wandb.sdk.artifacts._models import RegistryData
 
 
 class Registry:
@@ -48,6 +48,9 @@ class Registry:
         name: str,
         attrs: RegistryFragment | None = None,
     ):
+        # Imported here since wandb.sdk.artifacts._models imports this package.
+        from wandb.sdk.artifacts._models import RegistryData
+
         self._service_api = service_api
 
         if attrs is None:
@@ -63,6 +66,8 @@ class Registry:
 
     def _update_attributes(self, fragment: RegistryFragment) -> None:
         """Update instance attributes from a GraphQL fragment."""
+        from wandb.sdk.artifacts._models import RegistryData
+
         saved = RegistryData.from_fragment(fragment)
         self._saved = saved
         self._current = saved.model_copy(deep=True)
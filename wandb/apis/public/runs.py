@@ -57,6 +57,7 @@ from wandb.apis.internal import Api as InternalApi
 from wandb.apis.normalize import normalize_exceptions
 from wandb.apis.paginator import SizedPaginator
 from wandb.apis.public.const import RETRY_TIMEDELTA
+from wandb.apis.public.history import HistoryColumnarScan, HistoryScanFormat
 from wandb.apis.public.service_api import ServiceApi
 from wandb.proto import wandb_api_pb2 as apb
 from wandb.proto import wandb_internal_pb2 as pb
@@ -73,6 +74,12 @@ if TYPE_CHECKING:
 
 WANDB_INTERNAL_KEYS = {"_wandb", "wandb_version"}
 
+_HISTORY_RUNS_PER_QUERY = 20
+"""The number of runs whose history `Runs.histories` reads in one query."""
+
+_HISTORY_MAX_CONCURRENT_QUERIES = 8
+"""The maximum number of history queries `Runs.histories` runs at once."""
+
 RUN_FRAGMENT = """fragment RunFragment on Run {
     id
     tags
@@ -185,6 +192,23 @@ def _convert_to_dict(value: Any) -> dict[str, Any]:
     raise TypeError(f"Unable to convert {value} to a dict")
 
 
+def _validate_history_keys(
+    keys: list[str] | None,
+    stream: Literal["default", "system"],
+) -> bool:
+    """Check the keys passed to a sampled history query, printing any error."""
+    if keys is not None and not isinstance(keys, list):
+        wandb.termerror("keys must be specified in a list")
+        return False
+    if keys is not None and len(keys) > 0 and not isinstance(keys[0], str):
+        wandb.termerror("keys argument must be a list of strings")
+        return False
+    if keys and stream != "default":
+        wandb.termerror("stream must be default when specifying keys")
+        return False
+    return True
+
+
 class Runs(SizedPaginator["Run"]):
     """A lazy iterator of `Run` objects associated with a project and optional filter.
 
@@ -354,6 +378,10 @@ class Runs(SizedPaginator["Run"]):
     ) -> list[dict[str, Any]] | pd.DataFrame | pl.DataFrame:
         """Return sampled history metrics for all runs that fit the filters conditions.
 
+        The histories of many runs are read with a few batched queries that
+        run concurrently, so this is much faster than calling `Run.history`
+        for each run.
+
         Args:
             samples: The number of samples to return per run
             keys: Only return metrics for specific keys
@@ -374,46 +402,34 @@ class Runs(SizedPaginator["Run"]):
                 f"Invalid format: {format}. Must be one of 'default', 'pandas', 'polars'"
             )
 
-        histories = []
+        if not _validate_history_keys(keys, stream):
+            run_histories = []
+        else:
+            run_histories = self._fetch_histories(
+                samples=samples,
+                keys=keys,
+                x_axis=x_axis,
+                stream=stream,
+            )
 
-        if format == "default":
-            for run in self:
-                history_data = run.history(
-                    samples=samples,
-                    keys=keys,
-                    x_axis=x_axis,
-                    pandas=False,
-                    stream=stream,
-                )
-                if not history_data:
-                    continue
-                for entry in history_data:
-                    entry["run_id"] = run.id
-                histories.extend(history_data)
+        # Build the combined records in one pass instead of concatenating
+        # per-run frames.
+        histories: list[dict[str, Any]] = []
+        for run_id, history_data in run_histories:
+            for entry in history_data:
+                entry["run_id"] = run_id
+            histories.extend(history_data)
 
+        if format == "default":
             return histories
 
         if format == "pandas":
             pd = util.get_module(
                 "pandas", required="Exporting pandas DataFrame requires pandas"
             )
-            for run in self:
-                history_data = run.history(
-                    samples=samples,
-                    keys=keys,
-                    x_axis=x_axis,
-                    pandas=False,
-                    stream=stream,
-                )
-                if not history_data:
-                    continue
-                df = pd.DataFrame.from_records(history_data)
-                df["run_id"] = run.id
-                histories.append(df)
             if not histories:
                 return pd.DataFrame()
-            combined_df = pd.concat(histories)
-            combined_df.reset_index(drop=True, inplace=True)
+            combined_df = pd.DataFrame.from_records(histories)
             # sort columns for consistency
             combined_df = combined_df[(sorted(combined_df.columns))]
 
@@ -423,27 +439,120 @@ class Runs(SizedPaginator["Run"]):
             pl = util.get_module(
                 "polars", required="Exporting polars DataFrame requires polars"
             )
-            for run in self:
-                history_data = run.history(
-                    samples=samples,
-                    keys=keys,
-                    x_axis=x_axis,
-                    pandas=False,
-                    stream=stream,
-                )
-                if not history_data:
-                    continue
-                df = pl.from_records(history_data)
-                df = df.with_columns(pl.lit(run.id).alias("run_id"))
-                histories.append(df)
             if not histories:
                 return pl.DataFrame()
-            combined_df = pl.concat(histories, how="vertical")
+            # Runs may log different keys, so infer the schema from all rows.
+            combined_df = pl.from_dicts(histories, infer_schema_length=None)
             # sort columns for consistency
             combined_df = combined_df.select(sorted(combined_df.columns))
 
             return combined_df
 
+    def _fetch_histories(
+        self,
+        *,
+        samples: int,
+        keys: list[str] | None,
+        x_axis: str,
+        stream: Literal["default", "system"],
+    ) -> list[tuple[str, list[dict[str, Any]]]]:
+        """Fetch the sampled history of every run in this collection.
+
+        Runs are packed `_HISTORY_RUNS_PER_QUERY` at a time into aliased
+        GraphQL queries, and up to `_HISTORY_MAX_CONCURRENT_QUERIES` queries
+        run concurrently.
+
+        Returns:
+            (run ID, history rows) pairs in the order of the runs.
+        """
+        run_ids = [run.id for run in self]
+        if not run_ids:
+            return []
+
+        batches = [
+            run_ids[i : i + _HISTORY_RUNS_PER_QUERY]
+            for i in range(0, len(run_ids), _HISTORY_RUNS_PER_QUERY)
+        ]
+
+        def fetch_batch(batch: list[str]) -> list[list[dict[str, Any]]]:
+            return self._fetch_history_batch(
+                batch,
+                samples=samples,
+                keys=keys,
+                x_axis=x_axis,
+                stream=stream,
+            )
+
+        from concurrent.futures import ThreadPoolExecutor
+
+        max_workers = min(len(batches), _HISTORY_MAX_CONCURRENT_QUERIES)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            results = list(executor.map(fetch_batch, batches))
+
+        return [
+            (run_id, history_data)
+            for batch, batch_results in zip(batches, results, strict=True)
+            for run_id, history_data in zip(batch, batch_results, strict=True)
+        ]
+
+    def _fetch_history_batch(
+        self,
+        run_ids: list[str],
+        *,
+        samples: int,
+        keys: list[str] | None,
+        x_axis: str,
+        stream: Literal["default", "system"],
+    ) -> list[list[dict[str, Any]]]:
+        """Fetch the sampled history of several runs in a single query.
+
+        Each run is an aliased `run` field of the project, so the query
+        returns the same data as `Run.history` for each run.
+        """
+        variables: dict[str, Any] = {"entity": self.entity, "project": self.project}
+        variable_defs = ["$project: String!", "$entity: String!"]
+
+        if keys:
+            spec = {"keys": [x_axis] + keys, "samples": samples}
+            variables["specs"] = [json.dumps(spec)]
+            variable_defs.append("$specs: [JSONString!]!")
+            node = "sampledHistory"
+            selection = "sampledHistory(specs: $specs)"
+        else:
+            variables["samples"] = samples
+            variable_defs.append("$samples: Int")
+            node = "history" if stream == "default" else "events"
+            selection = f"{node}(samples: $samples)"
+
+        run_fields = []
+        for i, run_id in enumerate(run_ids):
+            variables[f"name{i}"] = run_id
+            variable_defs.append(f"$name{i}: String!")
+            run_fields.append(f"run{i}: run(name: $name{i}) {{ {selection} }}")
+
+        query = """
+        query RunsHistory({}) {{
+            project(name: $project, entityName: $entity) {{
+                {}
+            }}
+        }}
+        """.format(", ".join(variable_defs), "\n                ".join(run_fields))
+
+        response = self._service_api.execute_graphql(query, variables)
+        project = response.get("project") or {}
+
+        histories: list[list[dict[str, Any]]] = []
+        for i in range(len(run_ids)):
+            run = project.get(f"run{i}") or {}
+            lines = run.get(node) or []
+            if keys:
+                # sampledHistory returns one list per spec, we only send one spec
+                histories.append(lines[0] if lines else [])
+            else:
+                histories.append([json.loads(line) for line in lines])
+
+        return histories
+
     def __repr__(self) -> str:
         return f"<{nameof(type(self))} {self.entity}/{self.project}>"
 
@@ -1299,17 +1408,10 @@ class Run(Attrs):
                 metrics.
             list of dicts: If pandas=False returns a list of dicts of history metrics.
         """
-        if keys is not None and not isinstance(keys, list):
-            wandb.termerror("keys must be specified in a list")
-            return []
-        if keys is not None and len(keys) > 0 and not isinstance(keys[0], str):
-            wandb.termerror("keys argument must be a list of strings")
+        if not _validate_history_keys(keys, stream):
             return []
 
-        if keys and stream != "default":
-            wandb.termerror("stream must be default when specifying keys")
-            return []
-        elif keys:
+        if keys:
             lines = self._sampled_history(keys=keys, x_axis=x_axis, samples=samples)
         else:
             lines = self._full_history(samples=samples, stream=stream)
@@ -1329,6 +1431,8 @@ class Run(Attrs):
         min_step: int = 0,
         max_step: int | None = None,
         use_cache: bool = True,
+        format: HistoryScanFormat = "dict",
+        prefetch_pages: int = 0,
     ) -> public.HistoryScan:
         """Returns an iterable collection of all history records for a run.
 
@@ -1344,6 +1448,15 @@ class Run(Attrs):
             use_cache: When set to True, checks the WANDB_CACHE_DIR for a run history.
                 If the run history is not found in the cache, it will be downloaded from the server.
                 If set to False, the run history will be downloaded every time.
+            format: The shape of the yielded records. "dict" yields one dict per
+                history row. "arrow" yields one `pyarrow.RecordBatch` per page
+                and "numpy" yields one dict of column name to `numpy.ndarray`
+                per page. The columnar formats decode values in bulk and are
+                much faster for large scans.
+            prefetch_pages: The number of pages to request ahead of the page
+                being consumed. Pages are still returned in step order. A value
+                of a few pages lets the service read history while the caller
+                processes rows, which speeds up large scans.
 
         Returns:
             A HistoryScan object,
@@ -1368,14 +1481,28 @@ class Run(Attrs):
         elif max_step > last_step:
             max_step = last_step + 1
 
-        return public.HistoryScan(
+        if format == "dict":
+            return public.HistoryScan(
+                service_api=self._service_api,
+                run=self,
+                min_step=min_step,
+                max_step=max_step,
+                keys=keys,
+                page_size=page_size,
+                use_cache=use_cache,
+                prefetch_pages=prefetch_pages,
+            )
+
+        return HistoryColumnarScan(
             service_api=self._service_api,
             run=self,
             min_step=min_step,
             max_step=max_step,
+            format=format,
             keys=keys,
             page_size=page_size,
             use_cache=use_cache,
+            prefetch_pages=prefetch_pages,
         )
 
     @normalize_exceptions
@@ -24,6 +24,7 @@ from wandb.sdk import wandb_settings, wandb_setup
 from wandb.sdk.lib.service.service_connection import (
     ServiceConnection,
     WandbApiFailedError,
+    wait_api_response,
 )
 from wandb.sdk.mailbox.mailbox_handle import MailboxHandle
 
@@ -267,6 +268,37 @@ class ServiceApi:
         request.api_id = session.api_id
         return await session.connection.api_request_async(request)
 
+    def send_api_request_nowait(
+        self,
+        request: ApiRequest,
+    ) -> MailboxHandle[ApiResponse]:
+        """Send an API request without waiting for the response.
+
+        This allows a synchronous caller to keep several requests in flight.
+        Use `wait_api_response` to get each response.
+        """
+        session = self._get_api_session()
+        request.api_id = session.api_id
+        return session.connection.api_request_nowait(request)
+
+    def wait_api_response(
+        self,
+        handle: MailboxHandle[ApiResponse],
+        timeout: float | None = None,
+    ) -> ApiResponse:
+        """Wait for the response to a request from `send_api_request_nowait`.
+
+        Falls back to the timeout this API was created with when none is
+        given.
+
+        Raises:
+            WandbApiFailedError: The request failed or timed out.
+        """
+        return wait_api_response(
+            handle,
+            timeout=self._timeout if timeout is None else timeout,
+        )
+
     def api_publish(
         self,
         request: ApiRequest,
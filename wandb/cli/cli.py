@@ -683,6 +683,16 @@ def init(ctx, project, entity, reset, mode):
     "--replace-tags",
     help="Rename tags during sync. Use 'old=new' pairs separated by commas.",
 )
+@click.option(
+    "-n",
+    "--parallelism",
+    type=int,
+    default=None,
+    help="""
+        Max number of runs to sync at a time. Defaults to 5, or to 1 in
+        legacy mode.
+    """,
+)
 @click.option(
     "--legacy",
     is_flag=True,
@@ -715,6 +725,7 @@ def sync(
     append: bool,
     skip_console: bool,
     replace_tags: str | None,
+    parallelism: int | None,
     legacy: bool,
 ):
     """Upload existing local W&B run data to the cloud.
@@ -763,6 +774,13 @@ def sync(
 
         $ wandb sync --sync-all
 
+    To sync them up to 8 at a time, in legacy mode:
+
+        $ wandb sync --sync-all -n 8
+
+    In legacy mode, an interrupted sync resumes from the last record it
+    checkpointed instead of uploading the run again.
+
     Use `wandb clean` to delete local data for runs that have been synced. See
 
         $ wandb clean --help
@@ -804,7 +822,7 @@ def sync(
             skip_synced=not include_synced,
             skip_online=not include_online,
             verbose=verbose,
-            parallelism=5,  # same default as wandb beta sync
+            parallelism=parallelism or 5,  # same default as wandb beta sync
         )
         return
 
@@ -921,6 +939,7 @@ def sync(
             append=append,
             skip_console=skip_console,
             replace_tags=replace_tags_dict,
+            parallelism=parallelism or 1,
         )
         for p in _path:
             sm.add(p)
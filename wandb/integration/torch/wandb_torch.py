@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import itertools
+import math
 from functools import reduce
 from operator import mul
 from typing import TYPE_CHECKING
@@ -101,13 +102,15 @@ class TorchHistory:
         def parameter_log_hook(module, input_, output, log_track):
             if not log_track_update(log_track):
                 return
+            tensors = {}
             for name, parameter in module.named_parameters():
                 # for pytorch 0.3 Variables
                 if isinstance(parameter, torch.autograd.Variable):
                     data = parameter.data
                 else:
                     data = parameter
-                self.log_tensor_stats(data.cpu(), "parameters/" + prefix + name)
+                tensors["parameters/" + prefix + name] = data
+            self.log_tensors_stats(tensors)
 
         log_track_params = log_track_init(log_freq)
         try:
@@ -144,6 +147,19 @@ class TorchHistory:
         if not hasattr(module, "_wandb_hook_names"):
             module._wandb_hook_names = []
 
+        if hasattr(torch.autograd.graph, "register_multi_grad_hook"):
+            parameters = {
+                "gradients/" + prefix + name: parameter
+                for name, parameter in module.named_parameters()
+                if parameter.requires_grad
+            }
+            if parameters:
+                module._wandb_hook_names.append("gradients/" + prefix)
+                self._hook_gradients_stats(
+                    parameters, "gradients/" + prefix, log_track_init(log_freq)
+                )
+            return
+
         for name, parameter in module.named_parameters():
             if parameter.requires_grad:
                 log_track_grad = log_track_init(log_freq)
@@ -152,8 +168,92 @@ class TorchHistory:
                     parameter, "gradients/" + prefix + name, log_track_grad
                 )
 
-    def log_tensor_stats(self, tensor, name):  # noqa: C901
+    def log_tensor_stats(self, tensor, name):
         """Add distribution statistics on a tensor's elements to the current History entry."""
+        histogram = self._tensor_histogram(tensor)
+        if histogram is not None:
+            wandb.run._log({name: histogram}, commit=False)
+
+    def log_tensors_stats(self, tensors: dict[str, Tensor]) -> None:
+        """Add distribution statistics on many tensors to the current History entry.
+
+        Dense tensors on the same device are summarized together, so that the
+        ranges and histograms of all of them are copied to the host at once,
+        and all histograms are logged in one call.
+        """
+        histograms = {}
+        by_device: dict[torch.device, list[tuple[str, Tensor]]] = {}
+        for name, tensor in tensors.items():
+            if tensor.is_sparse:
+                histogram = self._tensor_histogram(tensor)
+                if histogram is not None:
+                    histograms[name] = histogram
+            else:
+                by_device.setdefault(tensor.device, []).append((name, tensor))
+
+        for named_tensors in by_device.values():
+            histograms.update(self._batched_histograms(named_tensors))
+
+        if histograms:
+            wandb.run._log(histograms, commit=False)
+
+    def _batched_histograms(
+        self,
+        named_tensors: list[tuple[str, Tensor]],
+    ) -> dict[str, wandb.Histogram]:
+        """Compute histograms of dense tensors on the same device.
+
+        Synchronizes with the device twice rather than several times per
+        tensor: once to copy the range of every tensor to the host, and once
+        to copy every histogram.
+        """
+        flats = {}
+        for name, tensor in named_tensors:
+            flat = tensor.detach().reshape(-1)
+            # Skip logging if the tensor is empty.
+            if flat.numel() == 0:
+                continue
+            # histc requires floating point values.
+            if flat.dtype not in (torch.float32, torch.float64):
+                flat = flat.float()
+            flats[name] = flat
+        if not flats:
+            return {}
+
+        ranges = torch.stack(
+            [torch.stack(torch.aminmax(flat)).double() for flat in flats.values()]
+        ).tolist()
+
+        histograms = {}
+        pending = {}
+        for (name, flat), (tmin, tmax) in zip(flats.items(), ranges, strict=True):
+            if not (math.isfinite(tmin) and math.isfinite(tmax)):
+                # The tensor contains nans or infs, which must be removed first.
+                histogram = self._tensor_histogram(flat)
+                if histogram is not None:
+                    histograms[name] = histogram
+            elif tmin == tmax:
+                histograms[name] = wandb.Histogram(
+                    np_histogram=([float(flat.numel())], [tmin, tmax])
+                )
+            else:
+                pending[name] = (
+                    flat.histc(bins=self._num_bins, min=tmin, max=tmax),
+                    tmin,
+                    tmax,
+                )
+
+        if pending:
+            counts = torch.stack([hist.double() for hist, _, _ in pending.values()])
+            for (name, (_, tmin, tmax)), hist in zip(
+                pending.items(), counts.tolist(), strict=True
+            ):
+                bins = torch.linspace(tmin, tmax, steps=self._num_bins + 1)
+                histograms[name] = wandb.Histogram(np_histogram=(hist, bins.tolist()))
+        return histograms
+
+    def _tensor_histogram(self, tensor) -> wandb.Histogram | None:  # noqa: C901
+        """Compute the histogram of a tensor's finite values, if it has any."""
         # TODO Handle the case of duplicate names.
         if isinstance(tensor, (tuple, list)):
             while isinstance(tensor, (tuple, list)) and isinstance(
@@ -207,7 +307,7 @@ class TorchHistory:
 
         # Skip logging if all values are nan or inf or the tensor is empty.
         if self._no_finite_values(flat):
-            return
+            return None
 
         # Remove nans and infs if present. There's no good way to represent that in histograms.
         flat = self._remove_infs_nans(flat)
@@ -253,10 +353,36 @@ class TorchHistory:
             tensor = torch.Tensor(tensor_np)
             bins = torch.Tensor(bins_np)
 
-        wandb.run._log(
-            {name: wandb.Histogram(np_histogram=(tensor.tolist(), bins.tolist()))},
-            commit=False,
+        return wandb.Histogram(np_histogram=(tensor.tolist(), bins.tolist()))
+
+    def _hook_gradients_stats(self, parameters, name, log_track):
+        """Logs the distribution statistics of parameters' gradients after each backward pass.
+
+        A single hook receives all gradients computed by the backward pass, so
+        that they're summarized and logged together.
+        """
+        handle = self._hook_handles.get(name)
+        if handle is not None and self._torch_hook_handle_is_valid(handle):
+            raise ValueError(f'A hook has already been set under name "{name}"')
+
+        names = list(parameters)
+
+        def _callback(grads):
+            if not log_track_update(log_track):
+                return
+            self.log_tensors_stats(
+                {
+                    name: grad
+                    for name, grad in zip(names, grads, strict=True)
+                    if grad is not None
+                }
+            )
+
+        handle = torch.autograd.graph.register_multi_grad_hook(
+            list(parameters.values()), _callback
         )
+        self._hook_handles[name] = handle
+        return handle
 
     def _hook_variable_gradient_stats(self, var, name, log_track):
         """Logs a Variable's gradient's distribution statistics next time backward() is called on it."""
@@ -289,6 +415,9 @@ class TorchHistory:
         handle.remove()
 
     def _torch_hook_handle_is_valid(self, handle):
+        # Handles of multi-tensor hooks wrap a handle per tensor.
+        if hasattr(handle, "handles"):
+            return any(self._torch_hook_handle_is_valid(h) for h in handle.handles)
         d = handle.hooks_dict_ref()
         if d is None:
             return False
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from collections.abc import Sequence
-from typing import TYPE_CHECKING, TypeVar
+from typing import TYPE_CHECKING, Any, TypeVar
 
 import wandb
 from wandb import util
@@ -13,6 +13,40 @@ if TYPE_CHECKING:
 T = TypeVar("T")
 
 
+def _class_indices(np: Any, labels: Any, n_classes: int) -> Any | None:
+    """Convert labels that index into the class names to an integer array.
+
+    Returns None if any label is not a valid index.
+    """
+    if labels.dtype.kind not in "biuf":
+        return None
+    indices = labels.astype(np.int64, copy=False)
+    if labels.dtype.kind in "bf" and not np.array_equal(indices, labels):
+        return None
+    if len(indices) > 0 and (indices.min() < 0 or indices.max() >= n_classes):
+        return None
+    return indices
+
+
+def _encode_labels(np: Any, labels: Any) -> tuple[Any, int]:
+    """Number the distinct labels in sorted order.
+
+    Returns each label's number and the number of distinct labels.
+    """
+    if labels.dtype.kind in "iu" and len(labels) > 0:
+        low = labels.min()
+        span = int(labels.max()) - int(low) + 1
+        # Integer labels in a small range are numbered without sorting.
+        if span <= max(len(labels), 1 << 16):
+            offsets = (labels - low).astype(np.intp)
+            present = np.bincount(offsets, minlength=span) > 0
+            numbers = np.cumsum(present) - 1
+            return numbers[offsets], int(numbers[-1]) + 1
+
+    classes, numbers = np.unique(labels, return_inverse=True)
+    return numbers, len(classes)
+
+
 def confusion_matrix(
     probs: Sequence[Sequence[float]] | None = None,
     y_true: Sequence[T] | None = None,
@@ -45,7 +79,8 @@ def confusion_matrix(
         ValueError: If both `probs` and `preds` are provided or if the number of
             predictions and true labels are not equal. If the number of unique
             predicted classes exceeds the number of class names or if the number of
-            unique true labels exceeds the number of class names.
+            unique true labels exceeds the number of class names, or if a label
+            is not an index into `class_names`.
         wandb.Error: If numpy is not installed.
 
     Examples:
@@ -135,39 +170,44 @@ def confusion_matrix(
         raise ValueError("Only one of `probs` or `preds` should be provided, not both.")
 
     if probs is not None:
-        preds = np.argmax(probs, axis=1).tolist()
+        preds = np.argmax(probs, axis=1)
 
+    y_true = np.asarray(y_true)
+    preds = np.asarray(preds)
     if len(preds) != len(y_true):
         raise ValueError("The number of predictions and true labels must be equal.")
 
     if class_names is not None:
+        # Labels are indices into class_names.
         n_classes = len(class_names)
-        class_idx = list(range(n_classes))
-        if len(set(preds)) > len(class_names):
+        true_idx = _class_indices(np, y_true, n_classes)
+        pred_idx = _class_indices(np, preds, n_classes)
+
+        if pred_idx is None and len(np.unique(preds)) > n_classes:
             raise ValueError(
                 "The number of unique predicted classes exceeds the number of class names."
             )
-
-        if len(set(y_true)) > len(class_names):
+        if true_idx is None and len(np.unique(y_true)) > n_classes:
             raise ValueError(
                 "The number of unique true labels exceeds the number of class names."
             )
+        if true_idx is None or pred_idx is None:
+            raise ValueError("Labels must be indices into `class_names`.")
     else:
-        class_idx = set(preds).union(set(y_true))
-        n_classes = len(class_idx)
+        idx, n_classes = _encode_labels(np, np.concatenate([y_true, preds]))
+        true_idx, pred_idx = idx[: len(y_true)], idx[len(y_true) :]
         class_names = [f"Class_{i + 1}" for i in range(n_classes)]
 
-    # Create a mapping from class name to index
-    class_mapping = {val: i for i, val in enumerate(sorted(list(class_idx)))}
-
-    counts = np.zeros((n_classes, n_classes))
-    for i in range(len(preds)):
-        counts[class_mapping[y_true[i]], class_mapping[preds[i]]] += 1
+    counts = np.bincount(
+        true_idx * n_classes + pred_idx,
+        minlength=n_classes * n_classes,
+    ).astype(float)
 
     data = [
-        [class_names[i], class_names[j], counts[i, j]]
-        for i in range(n_classes)
-        for j in range(n_classes)
+        [class_names[i], class_names[j], count]
+        for (i, j), count in zip(
+            np.ndindex(n_classes, n_classes), counts.tolist(), strict=True
+        )
     ]
 
     return plot_table(
@@ -7,7 +7,7 @@ from typing import TYPE_CHECKING, TypeVar
 import wandb
 from wandb import util
 from wandb.plot.custom_chart import plot_table
-from wandb.plot.utils import test_missing, test_types
+from wandb.plot.utils import fit_curves, test_missing, test_types
 
 if TYPE_CHECKING:
     from wandb.plot.custom_chart import CustomChart
@@ -103,10 +103,6 @@ def pr_curve(
         "sklearn.metrics",
         "roc requires the scikit library, install with `pip install scikit-learn`",
     )
-    sklearn_utils = util.get_module(
-        "sklearn.utils",
-        "roc requires the scikit library, install with `pip install scikit-learn`",
-    )
 
     def _step(x):
         y = np.array(x)
@@ -149,27 +145,26 @@ def pr_curve(
         indices = np.searchsorted(cur_recall, interp_recall, side="left")
         precision[class_label] = cur_precision[indices]
 
+    recall = {k: interp_recall for k in precision}
+    if sum(len(v) for v in precision.values()) > wandb.Table.MAX_ROWS:
+        wandb.termwarn(
+            f"Table has a limit of {wandb.Table.MAX_ROWS} rows. Simplifying to fit."
+        )
+        curves = fit_curves(
+            {k: (recall[k], precision[k]) for k in precision},
+            max_points=wandb.Table.MAX_ROWS,
+        )
+        recall = {k: x for k, (x, _) in curves.items()}
+        precision = {k: y for k, (_, y) in curves.items()}
+
     df = pd.DataFrame(
         {
             "class": np.hstack([[k] * len(v) for k, v in precision.items()]),
             "precision": np.hstack(list(precision.values())),
-            "recall": np.tile(interp_recall, len(precision)),
+            "recall": np.hstack(list(recall.values())),
         }
     ).round(3)
 
-    if len(df) > wandb.Table.MAX_ROWS:
-        wandb.termwarn(
-            f"Table has a limit of {wandb.Table.MAX_ROWS} rows. Resampling to fit."
-        )
-        # different sampling could be applied, possibly to ensure endpoints are kept
-        df = sklearn_utils.resample(
-            df,
-            replace=False,
-            n_samples=wandb.Table.MAX_ROWS,
-            random_state=42,
-            stratify=df["class"],
-        ).sort_values(["precision", "recall", "class"])
-
     return plot_table(
         data_table=wandb.Table(dataframe=df),
         vega_spec_name="wandb/area-under-curve/v0",
@@ -7,7 +7,7 @@ from typing import TYPE_CHECKING
 import wandb
 from wandb import util
 from wandb.plot.custom_chart import plot_table
-from wandb.plot.utils import test_missing, test_types
+from wandb.plot.utils import fit_curves, test_missing, test_types
 
 if TYPE_CHECKING:
     from wandb.plot.custom_chart import CustomChart
@@ -94,10 +94,6 @@ def roc_curve(
         "sklearn.metrics",
         "roc requires the scikit library, install with `pip install scikit-learn`",
     )
-    sklearn_utils = util.get_module(
-        "sklearn.utils",
-        "roc requires the scikit library, install with `pip install scikit-learn`",
-    )
 
     y_true = np.array(y_true)
     y_probas = np.array(y_probas)
@@ -126,6 +122,17 @@ def roc_curve(
             y_true, y_probas[..., i], pos_label=classes[i]
         )
 
+    if sum(len(v) for v in fpr.values()) > wandb.Table.MAX_ROWS:
+        wandb.termwarn(
+            f"wandb uses only {wandb.Table.MAX_ROWS} data points to create the plots."
+        )
+        curves = fit_curves(
+            {k: (fpr[k], tpr[k]) for k in fpr},
+            max_points=wandb.Table.MAX_ROWS,
+        )
+        fpr = {k: x for k, (x, _) in curves.items()}
+        tpr = {k: y for k, (_, y) in curves.items()}
+
     df = pd.DataFrame(
         {
             "class": np.hstack([[k] * len(v) for k, v in fpr.items()]),
@@ -134,19 +141,6 @@ def roc_curve(
         }
     ).round(3)
 
-    if len(df) > wandb.Table.MAX_ROWS:
-        wandb.termwarn(
-            f"wandb uses only {wandb.Table.MAX_ROWS} data points to create the plots."
-        )
-        # different sampling could be applied, possibly to ensure endpoints are kept
-        df = sklearn_utils.resample(
-            df,
-            replace=False,
-            n_samples=wandb.Table.MAX_ROWS,
-            random_state=42,
-            stratify=df["class"],
-        ).sort_values(["fpr", "tpr", "class"])
-
     return plot_table(
         data_table=wandb.Table(dataframe=df),
         vega_spec_name="wandb/area-under-curve/v0",
@@ -1,8 +1,15 @@
+from __future__ import annotations
+
+import heapq
 from collections.abc import Iterable, Sequence
+from typing import TYPE_CHECKING, Any
 
 import wandb
 from wandb import util
 
+if TYPE_CHECKING:
+    import numpy as np
+
 
 def test_missing(**kwargs):
     np = util.get_module("numpy", required="Logging plots requires numpy")
@@ -180,3 +187,96 @@ def test_types(**kwargs):
             wandb.termerror(f"{k} is not a clusterer. Please try again.")
             test_passed = False
     return test_passed
+
+
+def _farthest_point(
+    x: np.ndarray, y: np.ndarray, start: int, end: int
+) -> tuple[float, int]:
+    """Find the point strictly between start and end farthest from their chord.
+
+    Returns the distance and the index of the point.
+    """
+    np = util.get_module("numpy", required="Logging plots requires numpy")
+
+    dx = x[end] - x[start]
+    dy = y[end] - y[start]
+    px = x[start + 1 : end] - x[start]
+    py = y[start + 1 : end] - y[start]
+
+    chord = np.hypot(dx, dy)
+    if chord == 0:
+        dist = np.hypot(px, py)
+    else:
+        dist = np.abs(dx * py - dy * px) / chord
+
+    i = int(np.argmax(dist))
+    return float(dist[i]), start + 1 + i
+
+
+def simplify_curve(x: np.ndarray, y: np.ndarray, max_points: int) -> np.ndarray:
+    """Choose at most `max_points` points that preserve the shape of a curve.
+
+    A Ramer-Douglas-Peucker simplification with a point budget: starting from
+    the endpoints, the point farthest from the current approximation is added
+    until the budget is reached or the approximation is exact.
+
+    Returns the sorted indices of the chosen points.
+    """
+    np = util.get_module("numpy", required="Logging plots requires numpy")
+
+    n = len(x)
+    if n <= max_points or n <= 2:
+        return np.arange(n)
+
+    keep = [0, n - 1]
+    segments: list[tuple[float, int, int, int]] = []
+
+    def split(start: int, end: int) -> None:
+        if end - start < 2:
+            return
+        dist, i = _farthest_point(x, y, start, end)
+        if dist > 0:
+            heapq.heappush(segments, (-dist, start, end, i))
+
+    split(0, n - 1)
+    while segments and len(keep) < max_points:
+        _, start, end, i = heapq.heappop(segments)
+        keep.append(i)
+        split(start, i)
+        split(i, end)
+
+    return np.sort(np.array(keep))
+
+
+def fit_curves(
+    curves: dict[Any, tuple[np.ndarray, np.ndarray]],
+    max_points: int,
+    decimals: int = 3,
+) -> dict[Any, tuple[np.ndarray, np.ndarray]]:
+    """Reduce a set of curves to at most `max_points` points in total.
+
+    Points are rounded to `decimals` places, after which consecutive duplicate
+    points are dropped. If the curves are still too large, each is simplified
+    to an equal share of the points with `simplify_curve`.
+    """
+    np = util.get_module("numpy", required="Logging plots requires numpy")
+
+    rounded = {}
+    for key, (x, y) in curves.items():
+        x = np.round(x, decimals)
+        y = np.round(y, decimals)
+        if len(x) > 1:
+            changed = np.ones(len(x), dtype=bool)
+            changed[1:] = (np.diff(x) != 0) | (np.diff(y) != 0)
+            x, y = x[changed], y[changed]
+        rounded[key] = (x, y)
+
+    if sum(len(x) for x, _ in rounded.values()) <= max_points:
+        return rounded
+
+    points_per_curve = max(2, max_points // max(len(rounded), 1))
+    simplified = {}
+    for key, (x, y) in rounded.items():
+        indices = simplify_curve(x, y, points_per_curve)
+        simplified[key] = (x[indices], y[indices])
+    return simplified
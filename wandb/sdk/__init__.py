@@ -1,4 +1,13 @@
-"""W&B SDK module."""
+"""W&B SDK module.
+
+Attributes are imported on first use to keep `import wandb` fast.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from .lib import lazyloader as _lazyloader
 
 __all__ = (
     "Config",
@@ -21,16 +30,41 @@ __all__ = (
     "helper",
 )
 
-from . import wandb_helper as helper
-from .artifacts.artifact import Artifact
-from .wandb_alerts import AlertLevel
-from .wandb_config import Config
-from .wandb_init import _attach, init
-from .wandb_login import login
-from .wandb_require import require
-from .wandb_run import finish
-from .wandb_settings import Settings
-from .wandb_setup import setup, teardown
-from .wandb_summary import Summary
-from .wandb_sweep import controller, sweep
-from .wandb_watch import _unwatch, _watch
+if TYPE_CHECKING:
+    from . import wandb_helper as helper
+    from .artifacts.artifact import Artifact
+    from .wandb_alerts import AlertLevel
+    from .wandb_config import Config
+    from .wandb_init import _attach, init
+    from .wandb_login import login
+    from .wandb_require import require
+    from .wandb_run import finish
+    from .wandb_settings import Settings
+    from .wandb_setup import setup, teardown
+    from .wandb_summary import Summary
+    from .wandb_sweep import controller, sweep
+    from .wandb_watch import _unwatch, _watch
+
+__getattr__, __dir__ = _lazyloader.lazy_attributes(
+    __name__,
+    globals(),
+    {
+        "helper": (".wandb_helper", None),
+        "Artifact": (".artifacts.artifact", "Artifact"),
+        "AlertLevel": (".wandb_alerts", "AlertLevel"),
+        "Config": (".wandb_config", "Config"),
+        "_attach": (".wandb_init", "_attach"),
+        "init": (".wandb_init", "init"),
+        "login": (".wandb_login", "login"),
+        "require": (".wandb_require", "require"),
+        "finish": (".wandb_run", "finish"),
+        "Settings": (".wandb_settings", "Settings"),
+        "setup": (".wandb_setup", "setup"),
+        "teardown": (".wandb_setup", "teardown"),
+        "Summary": (".wandb_summary", "Summary"),
+        "controller": (".wandb_sweep", "controller"),
+        "sweep": (".wandb_sweep", "sweep"),
+        "_unwatch": (".wandb_watch", "_unwatch"),
+        "_watch": (".wandb_watch", "_watch"),
+    },
+)
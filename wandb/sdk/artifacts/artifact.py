@@ -15,7 +15,7 @@ import tempfile
 import time
 from collections import deque
 from collections.abc import Generator, Sequence
-from concurrent.futures import Executor, ThreadPoolExecutor, as_completed
+from concurrent.futures import Executor, Future, ThreadPoolExecutor
 from copy import copy
 from dataclasses import asdict, replace
 from datetime import timedelta
@@ -51,7 +51,7 @@ from wandb.sdk.data_types._dtypes import TypeRegistry
 from wandb.sdk.lib import retry, telemetry
 from wandb.sdk.lib.deprecation import warn_and_record_deprecation
 from wandb.sdk.lib.filesystem import check_exists, system_preferred_path
-from wandb.sdk.lib.hashutil import B64MD5, b64_to_hex_id, md5_file_b64
+from wandb.sdk.lib.hashutil import B64MD5, b64_to_hex_id, md5_file_b64, md5_files_b64
 from wandb.sdk.lib.paths import FilePathStr, LogicalPath, StrPath, URIStr
 from wandb.sdk.lib.runid import generate_fast_id, generate_id
 from wandb.sdk.mailbox import MailboxHandle
@@ -71,7 +71,9 @@ from ._validators import (
     validate_artifact_path,
     validate_fspath,
 )
+from .artifact_checksum_index import get_artifact_checksum_index
 from .artifact_download_logger import ArtifactDownloadLogger
+from .artifact_download_scheduler import ArtifactDownloadScheduler
 from .artifact_instance_cache import (
     artifact_instance_cache,
     artifact_instance_cache_by_client_id,
@@ -81,6 +83,13 @@ from .artifact_manifest_entry import ArtifactManifestEntry
 from .artifact_manifests.artifact_manifest_v1 import ArtifactManifestV1
 from .artifact_state import ArtifactState
 from .artifact_ttl import ArtifactTTL
+from .artifact_verification import (
+    ArtifactFileMismatch,
+    ArtifactVerificationReport,
+    VerifyMode,
+    validate_verify_options,
+    verify_files,
+)
 from .exceptions import (
     ArtifactNotLoggedError,
     TooFewItemsError,
@@ -1489,7 +1498,12 @@ class Artifact:
             raise ValueError(f"Path is not a file: {local_path!r}")
 
         name = LogicalPath(name or os.path.basename(local_path))
-        digest = md5_file_b64(local_path)
+
+        checksum_index = get_artifact_checksum_index()
+        st = os.stat(local_path)
+        if not (digest := checksum_index.get(local_path, st)):
+            digest = md5_file_b64(local_path)
+            checksum_index.put(local_path, digest, st)
 
         if is_tmp:
             file_path, file_name = os.path.split(name)
@@ -1552,6 +1566,7 @@ class Artifact:
         start_time = time.monotonic()
 
         paths: deque[tuple[str, str]] = deque()
+        stats: dict[str, os.stat_result] = {}
         logical_root = name or ""  # shared prefix, if any, for logical paths
         for dirpath, _, filenames in os.walk(local_path, followlinks=True):
             for fname in filenames:
@@ -1559,11 +1574,27 @@ class Artifact:
                 logical_path = os.path.relpath(physical_path, start=local_path)
                 logical_path = os.path.join(logical_root, logical_path)
                 paths.append((logical_path, physical_path))
+                with contextlib.suppress(OSError):
+                    stats[os.path.abspath(physical_path)] = os.stat(physical_path)
+
+        # Skip re-hashing files that are unchanged since they were last hashed,
+        # and hash the rest in parallel.
+        checksum_index = get_artifact_checksum_index()
+        digests = checksum_index.get_many(stats)
+        new_digests, hash_stats = md5_files_b64(
+            (path for path in stats if path not in digests),
+            sizes={path: st.st_size for path, st in stats.items()},
+        )
+        checksum_index.put_many(
+            (path, stats[path], digest) for path, digest in new_digests.items()
+        )
+        digests.update(new_digests)
 
         def add_manifest_file(logical_pth: str, physical_pth: str) -> None:
             self._add_local_file(
                 name=logical_pth,
                 path=physical_pth,
+                digest=digests.get(os.path.abspath(physical_pth)),
                 skip_cache=skip_cache,
                 policy=policy,
                 overwrite=merge,
@@ -1575,7 +1606,11 @@ class Artifact:
         pool.close()
         pool.join()
 
-        termlog("Done. %.1fs" % (time.monotonic() - start_time), prefix=False)
+        elapsed = time.monotonic() - start_time
+        if hash_stats.files:
+            termlog(f"Done. {elapsed:.1f}s (hashed {hash_stats})", prefix=False)
+        else:
+            termlog(f"Done. {elapsed:.1f}s", prefix=False)
 
     @ensure_not_finalized
     def add_reference(
@@ -1853,11 +1888,14 @@ class Artifact:
         return entry
 
     @ensure_logged
-    def get(self, name: str) -> WBValue | None:
+    def get(self, name: str, *, lazy_media: bool = False) -> WBValue | None:
         """Get the WBValue object located at the artifact relative `name`.
 
         Args:
             name: The artifact relative name to retrieve.
+            lazy_media: For a `wandb.Table`, create the media objects in its
+                cells when their column is first accessed instead of when
+                the table is loaded.
 
         Returns:
             W&B object that can be logged with `run.log()` and
@@ -1877,7 +1915,7 @@ class Artifact:
             assert self._service_api is not None
             artifact = self._referenced_artifact_from_id(referenced_id)
             assert artifact is not None
-            return artifact.get(uri_from_path(entry.ref))
+            return artifact.get(uri_from_path(entry.ref), lazy_media=lazy_media)
 
         # Special case for wandb.Table. This is intended to be a short term
         # optimization. Since tables are likely to download many other assets in
@@ -1895,7 +1933,10 @@ class Artifact:
         with open(item_path) as file:
             json_obj = json.load(file)
 
-        result = wb_class.from_json(json_obj, self)
+        if issubclass(wb_class, wandb.Table):
+            result = wb_class.from_json(json_obj, self, lazy_media=lazy_media)
+        else:
+            result = wb_class.from_json(json_obj, self)
         result._set_artifact_source(self, name)
         return result
 
@@ -2087,21 +2128,32 @@ class Artifact:
             download_logger.notify_downloaded()
 
         with (
-            ThreadPoolExecutor(max_workers=_FILE_EXECUTOR_WORKERS) as file_executor,
             ThreadPoolExecutor(max_workers=_MP_EXECUTOR_WORKERS) as mp_executor,
+            ThreadPoolExecutor(max_workers=1) as page_executor,
+            ArtifactDownloadScheduler(
+                lambda entry: _download_entry(entry, mp_executor=mp_executor),
+                max_workers=_FILE_EXECUTOR_WORKERS,
+            ) as scheduler,
         ):
             batch_size = env.get_artifact_fetch_file_url_batch_size()
 
-            active_futures = set()
-            cursor, has_more = None, True
-            while has_more:
-                files_page = self._fetch_file_urls(cursor=cursor, per_page=batch_size)
-
-                has_more = files_page.page_info.has_next_page
-                cursor = files_page.page_info.end_cursor
+            # Fetch the next page of file URLs while the current one downloads.
+            next_page: Future[FileWithUrlConnection] | None = page_executor.submit(
+                self._fetch_file_urls, cursor=None, per_page=batch_size
+            )
+            while next_page is not None:
+                files_page = next_page.result()
+                next_page = None
+                if files_page.page_info.has_next_page:
+                    next_page = page_executor.submit(
+                        self._fetch_file_urls,
+                        cursor=files_page.page_info.end_cursor,
+                        per_page=batch_size,
+                    )
 
                 # `File` nodes are formally nullable, so filter them out just in case.
                 file_nodes = (e.node for e in files_page.edges if e.node)
+                entries = []
                 for node in file_nodes:
                     entry = self.get_entry(node.name)
                     # TODO: uncomment once artifact downloads are supported in core
@@ -2110,34 +2162,9 @@ class Artifact:
                     #     continue
                     entry._download_url = node.direct_url
                     if (not path_prefix) or entry.path.startswith(str(path_prefix)):
-                        active_futures.add(
-                            file_executor.submit(
-                                _download_entry, entry, mp_executor=mp_executor
-                            )
-                        )
-
-                # Wait for download threads to catch up.
-                #
-                # Extra context and observations (tonyyli):
-                # - Even though the ThreadPoolExecutor limits the number of
-                #   concurrently-executed tasks, its internal task queue is unbounded.
-                #   The code below seems intended to ensure that at most `batch_size`
-                #   "backlogged" futures are held in memory at any given time.  This seems
-                #   like a reasonable safeguard against unbounded memory consumption.
-                #
-                # - We should probably use a builtin bounded Queue or Semaphore instead.
-                #   Consider this for a future change, or (depending on appetite for risk)
-                #   managing this logic via asyncio instead, if viable.
-                if len(active_futures) > batch_size:
-                    for future in as_completed(active_futures):
-                        future.result()  # check for errors
-                        active_futures.remove(future)
-                        if len(active_futures) <= batch_size:
-                            break
-
-            # Check for errors.
-            for future in as_completed(active_futures):
-                future.result()
+                        entries.append(entry)
+
+                scheduler.submit_page(entries)
 
         if log:
             # If you're wondering if we can display a `timedelta`, note that it
@@ -2232,42 +2259,69 @@ class Artifact:
         return self.download(root=root)
 
     @ensure_logged
-    def verify(self, root: str | None = None) -> None:
+    def verify(
+        self,
+        root: str | None = None,
+        *,
+        mode: VerifyMode = "full",
+        sample_fraction: float = 0.1,
+        raise_on_mismatch: bool = True,
+    ) -> ArtifactVerificationReport:
         """Verify that the contents of an artifact match the manifest.
 
-        All files in the directory are checksummed and the checksums are then
-        cross-referenced against the artifact's manifest. References are not verified.
+        The files in the directory are cross-referenced against the artifact's
+        manifest: every file must be a member of the artifact and have the size
+        and checksum recorded in the manifest. Checksums are computed in
+        parallel, and files that are unchanged since they were downloaded are
+        not hashed again. References are not verified.
 
         Args:
             root: The directory to verify. If None artifact will be downloaded to
                 './artifacts/self.name/'.
+            mode: How thoroughly to check file contents. "full" checks the
+                checksum of every file, "sample" checks the checksums of a
+                random `sample_fraction` of the files, and "size" only checks
+                file sizes.
+            sample_fraction: The fraction of files to checksum in "sample" mode.
+            raise_on_mismatch: Whether to raise an error if any file fails
+                verification. If False, inspect the returned report instead.
+
+        Returns:
+            A report listing every file that failed verification.
 
         Raises:
             ArtifactNotLoggedError: If the artifact is not logged.
-            ValueError: If the verification fails.
+            ValueError: If `mode` or `sample_fraction` is invalid, or if the
+                verification fails and `raise_on_mismatch` is True.
         """
+        validate_verify_options(mode, sample_fraction)
+
         root = root or self._default_root()
 
+        report = verify_files(
+            root,
+            self.manifest.entries.values(),
+            mode=mode,
+            sample_fraction=sample_fraction,
+        )
+
         for dirpath, _, files in os.walk(root):
             for file in files:
                 full_path = os.path.join(dirpath, file)
-                artifact_path = os.path.relpath(full_path, start=root)
-                try:
-                    self.get_entry(artifact_path)
-                except KeyError:
-                    raise ValueError(
-                        f"Found file {full_path} which is not a member of artifact {self.name}"
+                artifact_path = LogicalPath(os.path.relpath(full_path, start=root))
+                if artifact_path not in self.manifest.entries:
+                    report.mismatches.append(
+                        ArtifactFileMismatch(full_path, "untracked")
                     )
 
-        ref_count = 0
-        for entry in self.manifest.entries.values():
-            if entry.ref is None:
-                if md5_file_b64(validate_fspath(root, entry.path)) != entry.digest:
-                    raise ValueError(f"Digest mismatch for file: {entry.path}")
-            else:
-                ref_count += 1
-        if ref_count > 0:
-            termwarn(f"skipped verification of {ref_count} refs")
+        if report.references_skipped > 0:
+            termwarn(f"skipped verification of {report.references_skipped} refs")
+        if raise_on_mismatch and not report.ok:
+            raise ValueError(
+                f"Verification of artifact {self.name} failed:\n"
+                + report.error_message()
+            )
+        return report
 
     @ensure_logged
     def file(self, root: str | None = None) -> StrPath:
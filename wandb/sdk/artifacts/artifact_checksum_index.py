@@ -0,0 +1,201 @@
+"""Persistent index of local file checksums.
+
+The index remembers the MD5 digest of files that were added to or downloaded
+for artifacts, keyed on the file's absolute path and identified by its inode,
+size and modification time. A file whose stat still matches its index row
+doesn't need to be hashed again.
+
+All rows live in a single SQLite database in the artifacts cache directory,
+so looking up the digests of a whole directory is a handful of queries rather
+than one small file read per file.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import sqlite3
+import threading
+from collections.abc import Iterable, Mapping
+from functools import lru_cache
+from pathlib import Path
+
+from wandb.sdk.lib.hashutil import B64MD5
+from wandb.sdk.lib.paths import StrPath
+
+from .artifact_file_cache import artifacts_cache_dir
+
+logger = logging.getLogger(__name__)
+
+# Stay well below SQLite's limit on the number of host parameters.
+_QUERY_BATCH_SIZE = 500
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS checksums (
+    path TEXT PRIMARY KEY,
+    inode INTEGER NOT NULL,
+    size INTEGER NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    digest TEXT NOT NULL
+)
+"""
+
+
+class ArtifactChecksumIndex:
+    """A process- and thread-safe map from file stats to MD5 digests.
+
+    The index is a cache: every failure to read or write it is logged and
+    treated as a miss, so callers fall back to hashing the file.
+    """
+
+    def __init__(self, db_path: StrPath) -> None:
+        self._db_path = Path(db_path)
+        self._lock = threading.Lock()
+        self._conn: sqlite3.Connection | None = None
+        self._conn_pid: int | None = None
+
+    def _connection(self) -> sqlite3.Connection:
+        # SQLite connections must not be shared with a forked child.
+        if self._conn is None or self._conn_pid != os.getpid():
+            self._db_path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(
+                self._db_path,
+                timeout=30,
+                check_same_thread=False,
+                isolation_level=None,
+            )
+            try:
+                # WAL lets concurrent processes read while one of them writes.
+                conn.execute("PRAGMA journal_mode=WAL")
+                conn.execute("PRAGMA synchronous=NORMAL")
+                conn.execute(_SCHEMA)
+            except sqlite3.Error:
+                conn.close()
+                raise
+            self._conn = conn
+            self._conn_pid = os.getpid()
+        return self._conn
+
+    def close(self) -> None:
+        """Close the database connection, if open."""
+        with self._lock:
+            if self._conn is not None and self._conn_pid == os.getpid():
+                self._conn.close()
+            self._conn = None
+            self._conn_pid = None
+
+    def get(self, path: StrPath, st: os.stat_result | None = None) -> B64MD5 | None:
+        """Returns the cached digest of a file, or None if it isn't known.
+
+        Args:
+            path: The path to the file.
+            st: The file's current stat, if the caller already has it.
+        """
+        path = os.path.abspath(path)
+        if st is None:
+            try:
+                st = os.stat(path)
+            except OSError:
+                return None
+        return self.get_many({path: st}).get(path)
+
+    def get_many(
+        self,
+        stats: Mapping[str, os.stat_result],
+    ) -> dict[str, B64MD5]:
+        """Returns the cached digests of files whose stat matches the index.
+
+        Args:
+            stats: The current stat of each file, keyed on its absolute path.
+
+        Returns:
+            The digest of each file with a matching index row. Files that
+            are unknown or have changed are omitted.
+        """
+        paths = list(stats)
+        digests: dict[str, B64MD5] = {}
+
+        try:
+            with self._lock:
+                conn = self._connection()
+                for i in range(0, len(paths), _QUERY_BATCH_SIZE):
+                    batch = paths[i : i + _QUERY_BATCH_SIZE]
+                    rows = conn.execute(
+                        "SELECT path, inode, size, mtime_ns, digest FROM checksums"
+                        + f" WHERE path IN ({','.join('?' * len(batch))})",
+                        batch,
+                    )
+                    for path, inode, size, mtime_ns, digest in rows:
+                        st = stats[path]
+                        if (inode, size, mtime_ns) == _stat_key(st):
+                            digests[path] = B64MD5(digest)
+        except (sqlite3.Error, OSError):
+            logger.debug("Failed to read checksum index", exc_info=True)
+
+        return digests
+
+    def put(
+        self,
+        path: StrPath,
+        digest: B64MD5,
+        st: os.stat_result | None = None,
+    ) -> None:
+        """Record the digest of a file.
+
+        Args:
+            path: The path to the file.
+            digest: The file's MD5 digest.
+            st: The file's stat at the time it was hashed. Defaults to its
+                current stat.
+        """
+        path = os.path.abspath(path)
+        if st is None:
+            try:
+                st = os.stat(path)
+            except OSError:
+                return
+        self.put_many([(path, st, digest)])
+
+    def put_many(
+        self,
+        entries: Iterable[tuple[str, os.stat_result, B64MD5]],
+    ) -> None:
+        """Record the digests of many files in one transaction.
+
+        Args:
+            entries: (absolute path, stat at hashing time, digest) tuples.
+        """
+        rows = [(path, *_stat_key(st), digest) for path, st, digest in entries]
+        if not rows:
+            return
+
+        try:
+            with self._lock:
+                conn = self._connection()
+                conn.execute("BEGIN IMMEDIATE")
+                try:
+                    conn.executemany(
+                        "INSERT OR REPLACE INTO checksums"
+                        + " (path, inode, size, mtime_ns, digest)"
+                        + " VALUES (?, ?, ?, ?, ?)",
+                        rows,
+                    )
+                except BaseException:
+                    conn.execute("ROLLBACK")
+                    raise
+                conn.execute("COMMIT")
+        except (sqlite3.Error, OSError):
+            logger.debug("Failed to write checksum index", exc_info=True)
+
+
+def _stat_key(st: os.stat_result) -> tuple[int, int, int]:
+    return (st.st_ino, st.st_size, st.st_mtime_ns)
+
+
+@lru_cache(maxsize=1)
+def _build_artifact_checksum_index(db_path: Path) -> ArtifactChecksumIndex:
+    return ArtifactChecksumIndex(db_path)
+
+
+def get_artifact_checksum_index() -> ArtifactChecksumIndex:
+    return _build_artifact_checksum_index(artifacts_cache_dir() / "checksums.db")
@@ -0,0 +1,208 @@
+"""Artifact download scheduler."""
+
+from __future__ import annotations
+
+import queue
+import threading
+import time
+from collections.abc import Callable, Iterable
+from types import TracebackType
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .artifact_manifest_entry import ArtifactManifestEntry
+
+# Upper bound on the bytes of queued and running downloads.
+_MAX_BYTES_IN_FLIGHT = 1024 * 1024 * 1024
+
+# Every download is charged at least this many bytes, which bounds the number
+# of queued entries when an artifact has many tiny files.
+_MIN_ENTRY_COST = 64 * 1024
+
+# How often to re-evaluate the number of workers, and by how much to change it.
+_ADAPT_INTERVAL_SECONDS = 1.0
+_ADAPT_STEP = 4
+
+# The relative change in throughput considered an improvement or a regression.
+_ADAPT_THRESHOLD = 0.1
+
+
+class ArtifactDownloadScheduler:
+    """Downloads manifest entries on a pool of worker threads.
+
+    Entries are submitted a page at a time and downloaded smallest first.
+    Submitting blocks while the entries already queued or downloading add up
+    to more than `max_bytes_in_flight`, so memory use doesn't grow with the
+    size of the artifact.
+
+    The pool starts with `min_workers` threads and adds threads while doing so
+    increases throughput, up to `max_workers`. If throughput drops, threads
+    are retired again.
+
+    Use as a context manager. On exit, waits for all submitted downloads and
+    re-raises the first error any of them raised.
+    """
+
+    def __init__(
+        self,
+        download: Callable[[ArtifactManifestEntry], None],
+        *,
+        max_workers: int,
+        min_workers: int = 8,
+        max_bytes_in_flight: int = _MAX_BYTES_IN_FLIGHT,
+        clock_for_testing: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._download = download
+        self._min_workers = max(1, min(min_workers, max_workers))
+        self._max_workers = max_workers
+        self._max_bytes_in_flight = max_bytes_in_flight
+        self._clock = clock_for_testing
+
+        self._queue: queue.Queue[tuple[ArtifactManifestEntry, int] | None]
+        self._queue = queue.Queue()
+
+        self._cond = threading.Condition()
+        self._workers: list[threading.Thread] = []
+        self._target_workers = self._min_workers
+        self._bytes_in_flight = 0
+        self._error: BaseException | None = None
+        self._cancelled = False
+        self._closed = False
+
+        self._window_start = self._clock()
+        self._window_cost = 0
+        self._last_throughput = 0.0
+
+        with self._cond:
+            for _ in range(self._target_workers):
+                self._start_worker()
+
+    def __enter__(self) -> ArtifactDownloadScheduler:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        if exc is not None:
+            self._cancelled = True
+        self._close()
+        if exc is None and self._error is not None:
+            raise self._error
+
+    @property
+    def worker_count(self) -> int:
+        """The current number of worker threads."""
+        with self._cond:
+            return len(self._workers)
+
+    def submit_page(self, entries: Iterable[ArtifactManifestEntry]) -> None:
+        """Queue a page of entries for download, smallest first.
+
+        Blocks until there is room for each entry within the bytes budget.
+
+        Raises:
+            Exception: The first error raised by a download, if any.
+        """
+        for entry in sorted(entries, key=lambda e: e.size or 0):
+            cost = self._cost(entry)
+            with self._cond:
+                # An entry is always admitted when nothing else is in flight,
+                # so that an entry larger than the budget can't block forever.
+                self._cond.wait_for(
+                    lambda: (
+                        self._error is not None
+                        or self._bytes_in_flight == 0
+                        or self._bytes_in_flight + cost <= self._max_bytes_in_flight
+                    )
+                )
+                if self._error is not None:
+                    raise self._error
+                self._bytes_in_flight += cost
+            self._queue.put((entry, cost))
+
+    def _cost(self, entry: ArtifactManifestEntry) -> int:
+        # Charge large files a fraction of the budget so that a few of them
+        # can download alongside smaller ones.
+        return min(
+            max(entry.size or 0, _MIN_ENTRY_COST),
+            max(self._max_bytes_in_flight // 4, 1),
+        )
+
+    def _start_worker(self) -> None:
+        """Start a worker thread. Must be called while holding the lock."""
+        thread = threading.Thread(
+            target=self._work,
+            name="ArtifactDownloadWorker",
+            daemon=True,
+        )
+        self._workers.append(thread)
+        thread.start()
+
+    def _work(self) -> None:
+        while (item := self._queue.get()) is not None:
+            entry, cost = item
+            try:
+                if self._error is None and not self._cancelled:
+                    self._download(entry)
+            except BaseException as e:
+                with self._cond:
+                    if self._error is None:
+                        self._error = e
+            finally:
+                with self._cond:
+                    self._bytes_in_flight -= cost
+                    self._cond.notify_all()
+                    self._adapt(cost)
+                    retire = len(self._workers) > self._target_workers
+                    if retire:
+                        self._workers.remove(threading.current_thread())
+                self._queue.task_done()
+            if retire:
+                return
+
+    def _adapt(self, cost: int) -> None:
+        """Update the target number of workers. Must hold the lock.
+
+        Throughput is measured in charged bytes per second, so that it reflects
+        the rate of small file downloads too.
+        """
+        self._window_cost += cost
+        now = self._clock()
+        elapsed = now - self._window_start
+        if elapsed < _ADAPT_INTERVAL_SECONDS:
+            return
+
+        throughput = self._window_cost / elapsed
+        self._window_start = now
+        self._window_cost = 0
+
+        if throughput >= self._last_throughput * (1 + _ADAPT_THRESHOLD):
+            # Only add workers if they'd have something to do.
+            if self._queue.qsize() > 0 and not self._closed:
+                self._target_workers = min(
+                    self._target_workers + _ADAPT_STEP,
+                    self._max_workers,
+                )
+                while len(self._workers) < self._target_workers:
+                    self._start_worker()
+        elif throughput <= self._last_throughput * (1 - _ADAPT_THRESHOLD):
+            self._target_workers = max(
+                self._target_workers - _ADAPT_STEP,
+                self._min_workers,
+            )
+        self._last_throughput = throughput
+
+    def _close(self) -> None:
+        """Wait for queued downloads to finish and stop the workers."""
+        # Workers may still be added while the queue drains.
+        self._queue.join()
+        with self._cond:
+            self._closed = True
+            workers = list(self._workers)
+        for _ in workers:
+            self._queue.put(None)
+        for worker in workers:
+            worker.join()
@@ -5,8 +5,10 @@ from __future__ import annotations
 import contextlib
 import errno
 import hashlib
+import logging
 import os
 import shutil
+import sqlite3
 import subprocess
 import sys
 from collections.abc import Generator
@@ -22,6 +24,10 @@ from wandb.sdk.lib.filesystem import files_in
 from wandb.sdk.lib.hashutil import B64MD5, ETag, b64_to_hex_id
 from wandb.sdk.lib.paths import FilePathStr, StrPath, URIStr
 
+from .artifact_file_cache_index import ArtifactFileCacheIndex
+
+logger = logging.getLogger(__name__)
+
 
 class Opener(Protocol):
     def __call__(self, mode: str = ...) -> AbstractContextManager[IO]: ...
@@ -46,6 +52,9 @@ class ArtifactFileCache:
         self._cache_dir = Path(cache_dir)
         self._obj_dir = self._cache_dir / "obj"
         self._temp_dir = self._cache_dir / "tmp"
+        self._index = ArtifactFileCacheIndex(
+            self._cache_dir / "index.db", self._obj_dir
+        )
         self._ensure_write_permissions()
 
         # NamedTemporaryFile sets the file mode to 600 [1], we reset to the default.
@@ -93,6 +102,8 @@ class ArtifactFileCache:
     ) -> tuple[FilePathStr, bool, Opener]:
         opener = self._opener(path, size, skip_cache=skip_cache)
         hit = path.is_file() and path.stat().st_size == size
+        if hit and not skip_cache:
+            self._index.touch(path, size)
         return FilePathStr(path), hit, opener
 
     def cleanup(
@@ -151,24 +162,42 @@ class ArtifactFileCache:
                 "Run `wandb artifact cache cleanup --remove-temp` to remove them."
             )
 
-        entries = []
-        for file_entry in files_in(self._obj_dir):
-            total_size += file_entry.stat().st_size
-            entries.append(file_entry)
+        # Objects are evicted using the cache index; if it can't be used, fall
+        # back to scanning the whole cache and evicting by file access time.
+        entries: list[tuple[os.DirEntry, os.stat_result]] | None = None
+        try:
+            obj_size = self._index.total_size()
+        except sqlite3.Error:
+            logger.debug("Failed to read cache index", exc_info=True)
+            entries = self._scan_objects()
+            obj_size = sum(st.st_size for _, st in entries)
+        total_size += obj_size
 
         if target_fraction is not None:
             target_size = int(total_size * target_fraction)
         assert target_size is not None
 
-        for entry in sorted(entries, key=lambda x: x.stat().st_atime):
+        if entries is None:
+            try:
+                reclaimed, obj_size_left = self._index.evict(
+                    target_size - (total_size - obj_size)
+                )
+            except sqlite3.Error:
+                logger.debug("Failed to evict using cache index", exc_info=True)
+                entries = self._scan_objects()
+            else:
+                bytes_reclaimed += reclaimed
+                total_size -= obj_size - obj_size_left
+
+        for entry, st in sorted(entries or (), key=lambda x: x[1].st_atime):
             if total_size <= target_size:
-                return bytes_reclaimed
+                break
             try:
                 os.remove(entry.path)
             except OSError:
-                pass
-            total_size -= entry.stat().st_size
-            bytes_reclaimed += entry.stat().st_size
+                continue
+            total_size -= st.st_size
+            bytes_reclaimed += st.st_size
 
         if total_size > target_size:
             wandb.termerror(
@@ -178,6 +207,16 @@ class ArtifactFileCache:
 
         return bytes_reclaimed
 
+    def _scan_objects(self) -> list[tuple[os.DirEntry, os.stat_result]]:
+        """Return every object in the cache with its stat."""
+        entries = []
+        for entry in files_in(self._obj_dir):
+            try:
+                entries.append((entry, entry.stat()))
+            except OSError:
+                continue
+        return entries
+
     def _free_space(self) -> int:
         """Return the number of bytes of free space in the cache directory."""
         return shutil.disk_usage(self._cache_dir)[2]
@@ -227,6 +266,8 @@ class ArtifactFileCache:
             except Exception:
                 os.remove(temp_file.name)
                 raise
+            if not skip_cache:
+                self._index.record(path, path.stat().st_size)
 
         return atomic_open
 
@@ -0,0 +1,366 @@
+"""Persistent LRU index of the objects in the artifact file cache.
+
+The index records the size and last access time of every object under the
+cache's `obj` directory. It's updated when an object is written or hit, and
+keeps a running total of the objects' size, so that making room in the cache
+only needs to visit the least recently used objects instead of walking and
+sorting the whole directory tree.
+
+Objects can also be written without being recorded, by wandb-core or by
+older versions of the SDK. Before it's used, the index is reconciled with the
+directories under `obj` that were modified since they were last listed.
+
+All rows live in a single SQLite database next to the `obj` directory, which
+lets concurrent processes sharing a cache coordinate evictions.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import sqlite3
+import threading
+import time
+from pathlib import Path
+
+from wandb.sdk.lib.paths import StrPath
+
+logger = logging.getLogger(__name__)
+
+# Number of rows read from the index or scanned from disk at a time.
+_BATCH_SIZE = 500
+
+# Directories modified this recently are listed again on the next reconcile,
+# since a file added in the same clock tick wouldn't change their mtime.
+_MTIME_SETTLE_NS = 2 * 10**9
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS objects (
+    path TEXT PRIMARY KEY,
+    size INTEGER NOT NULL,
+    atime_ns INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS objects_by_atime ON objects (atime_ns, path);
+
+CREATE TABLE IF NOT EXISTS dirs (
+    path TEXT PRIMARY KEY,
+    mtime_ns INTEGER NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value INTEGER NOT NULL
+);
+INSERT OR IGNORE INTO meta (key, value) VALUES ('total_size', 0);
+
+CREATE TRIGGER IF NOT EXISTS objects_insert AFTER INSERT ON objects BEGIN
+    UPDATE meta SET value = value + NEW.size WHERE key = 'total_size';
+END;
+CREATE TRIGGER IF NOT EXISTS objects_delete AFTER DELETE ON objects BEGIN
+    UPDATE meta SET value = value - OLD.size WHERE key = 'total_size';
+END;
+CREATE TRIGGER IF NOT EXISTS objects_update AFTER UPDATE OF size ON objects BEGIN
+    UPDATE meta SET value = value + NEW.size - OLD.size WHERE key = 'total_size';
+END;
+"""
+
+
+class ArtifactFileCacheIndex:
+    """A process- and thread-safe LRU index of cached objects.
+
+    Objects written without being recorded are indexed when the index is
+    next read, with their file access time as their last use. Objects read
+    without being recorded as hit, such as wandb-core's cache hits, are kept
+    by eviction if their file access time shows they were read since.
+
+    Recording writes and hits is best-effort: failures are logged and
+    ignored. Reading the index raises `sqlite3.Error` so that callers can
+    fall back to scanning the cache directory.
+    """
+
+    def __init__(self, db_path: StrPath, obj_dir: StrPath) -> None:
+        self._db_path = Path(db_path)
+        self._obj_dir = Path(obj_dir)
+        self._lock = threading.Lock()
+        self._conn: sqlite3.Connection | None = None
+        self._conn_pid: int | None = None
+
+    def _connection(self) -> sqlite3.Connection:
+        # SQLite connections must not be shared with a forked child.
+        if self._conn is None or self._conn_pid != os.getpid():
+            self._db_path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(
+                self._db_path,
+                timeout=30,
+                check_same_thread=False,
+                isolation_level=None,
+            )
+            try:
+                # WAL lets concurrent processes read while one of them writes.
+                conn.execute("PRAGMA journal_mode=WAL")
+                conn.execute("PRAGMA synchronous=NORMAL")
+                conn.executescript(_SCHEMA)
+            except sqlite3.Error:
+                conn.close()
+                raise
+            self._conn = conn
+            self._conn_pid = os.getpid()
+        return self._conn
+
+    def close(self) -> None:
+        """Close the database connection, if open."""
+        with self._lock:
+            if self._conn is not None and self._conn_pid == os.getpid():
+                self._conn.close()
+            self._conn = None
+            self._conn_pid = None
+
+    def _key(self, path: StrPath) -> str:
+        return Path(path).relative_to(self._obj_dir).as_posix()
+
+    def record(self, path: StrPath, size: int) -> None:
+        """Record that an object was written to the cache.
+
+        Args:
+            path: The object's path under the `obj` directory.
+            size: The object's size in bytes.
+        """
+        try:
+            with self._lock:
+                self._connection().execute(
+                    "INSERT INTO objects (path, size, atime_ns) VALUES (?, ?, ?)"
+                    + " ON CONFLICT (path) DO UPDATE"
+                    + " SET size = excluded.size, atime_ns = excluded.atime_ns",
+                    (self._key(path), size, time.time_ns()),
+                )
+        except sqlite3.Error:
+            logger.debug("Failed to record cache write", exc_info=True)
+
+    def touch(self, path: StrPath, size: int) -> None:
+        """Record that an object in the cache was accessed.
+
+        Objects that aren't indexed yet are added.
+
+        Args:
+            path: The object's path under the `obj` directory.
+            size: The object's size in bytes.
+        """
+        try:
+            with self._lock:
+                self._connection().execute(
+                    "INSERT INTO objects (path, size, atime_ns) VALUES (?, ?, ?)"
+                    + " ON CONFLICT (path) DO UPDATE"
+                    + " SET size = excluded.size, atime_ns = excluded.atime_ns",
+                    (self._key(path), size, time.time_ns()),
+                )
+        except sqlite3.Error:
+            logger.debug("Failed to record cache hit", exc_info=True)
+
+    def total_size(self) -> int:
+        """Returns the total size in bytes of the objects in the cache."""
+        with self._lock:
+            conn = self._connection()
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                self._reconcile(conn)
+                total = self._total_size(conn)
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+            conn.execute("COMMIT")
+        return total
+
+    def evict(self, target_size: int) -> tuple[int, int]:
+        """Remove the least recently used objects until the cache is small enough.
+
+        The index is locked against writes from other processes while
+        evicting, so concurrent cleanups don't remove more than necessary.
+        An object that was rewritten or read since it was indexed is kept.
+
+        Args:
+            target_size: The total object size in bytes to reduce the cache to.
+
+        Returns:
+            The number of bytes reclaimed and the total object size remaining.
+        """
+        bytes_reclaimed = 0
+
+        with self._lock:
+            conn = self._connection()
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                self._reconcile(conn)
+                total_size = self._total_size(conn)
+
+                # Page through the rows in LRU order, resuming after the last
+                # row visited so that objects that can't be removed are only
+                # visited once.
+                cursor: tuple[int, str] = (-1, "")
+                while total_size > target_size:
+                    rows = conn.execute(
+                        "SELECT path, size, atime_ns FROM objects"
+                        + " WHERE (atime_ns, path) > (?, ?)"
+                        + " ORDER BY atime_ns, path LIMIT ?",
+                        (*cursor, _BATCH_SIZE),
+                    ).fetchall()
+                    if not rows:
+                        break
+
+                    removed: list[tuple[str]] = []
+                    refreshed: list[tuple[int, int, str]] = []
+                    for key, size, atime_ns in rows:
+                        if total_size <= target_size:
+                            break
+                        cursor = (atime_ns, key)
+
+                        path = self._obj_dir / key
+                        try:
+                            st = os.stat(path)
+                        except FileNotFoundError:
+                            # Removed outside of the cache; drop the stale row.
+                            removed.append((key,))
+                            total_size -= size
+                            continue
+                        except OSError:
+                            continue
+
+                        used_ns = max(st.st_mtime_ns, st.st_atime_ns)
+                        if used_ns > atime_ns:
+                            # Rewritten or read by a process that hasn't
+                            # recorded it, such as wandb-core.
+                            refreshed.append((st.st_size, used_ns, key))
+                            total_size += st.st_size - size
+                            continue
+
+                        try:
+                            os.remove(path)
+                        except FileNotFoundError:
+                            pass
+                        except OSError:
+                            continue
+                        else:
+                            bytes_reclaimed += st.st_size
+                        removed.append((key,))
+                        total_size -= size
+
+                    conn.executemany("DELETE FROM objects WHERE path = ?", removed)
+                    conn.executemany(
+                        "UPDATE objects SET size = ?, atime_ns = ? WHERE path = ?",
+                        refreshed,
+                    )
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+            conn.execute("COMMIT")
+
+        return bytes_reclaimed, total_size
+
+    def _total_size(self, conn: sqlite3.Connection) -> int:
+        (total,) = conn.execute(
+            "SELECT value FROM meta WHERE key = 'total_size'"
+        ).fetchone()
+        return total
+
+    def _reconcile(self, conn: sqlite3.Connection) -> None:
+        """Index objects that weren't recorded, and drop removed ones.
+
+        Only directories whose mtime changed since they were last listed are
+        listed again, so this stats each directory but not each object.
+        Must be called inside a write transaction.
+        """
+        now_ns = time.time_ns()
+        listed = dict(conn.execute("SELECT path, mtime_ns FROM dirs").fetchall())
+        pending = ["", *listed]
+        visited: set[str] = set()
+        while pending:
+            key = pending.pop()
+            if key in visited:
+                continue
+            visited.add(key)
+
+            try:
+                mtime_ns = os.stat(self._obj_dir / key).st_mtime_ns
+            except FileNotFoundError:
+                self._forget_dir(conn, key)
+                continue
+            except OSError:
+                continue
+            if listed.get(key) == mtime_ns:
+                continue
+
+            files: dict[str, os.DirEntry] = {}
+            try:
+                with os.scandir(self._obj_dir / key) as entries:
+                    for entry in entries:
+                        child = f"{key}/{entry.name}" if key else entry.name
+                        if entry.is_dir(follow_symlinks=False):
+                            pending.append(child)
+                        elif entry.is_file(follow_symlinks=False):
+                            files[child] = entry
+            except OSError:
+                continue
+            self._reconcile_files(conn, key, files)
+
+            if now_ns - mtime_ns < _MTIME_SETTLE_NS:
+                mtime_ns = -1
+            conn.execute(
+                "INSERT INTO dirs (path, mtime_ns) VALUES (?, ?)"
+                + " ON CONFLICT (path) DO UPDATE SET mtime_ns = excluded.mtime_ns",
+                (key, mtime_ns),
+            )
+
+    def _reconcile_files(
+        self,
+        conn: sqlite3.Connection,
+        dir_key: str,
+        files: dict[str, os.DirEntry],
+    ) -> None:
+        """Make the rows for the files directly in a directory match them."""
+        prefix = f"{dir_key}/" if dir_key else ""
+        indexed = {
+            key
+            for (key,) in conn.execute(
+                "SELECT path FROM objects WHERE path >= ? AND path < ?",
+                (prefix, f"{dir_key}0" if dir_key else "\U0010ffff"),
+            )
+            if "/" not in key[len(prefix) :]
+        }
+        conn.executemany(
+            "DELETE FROM objects WHERE path = ?",
+            [(key,) for key in indexed - files.keys()],
+        )
+
+        rows: list[tuple[str, int, int]] = []
+        for key in files.keys() - indexed:
+            try:
+                st = files[key].stat()
+            except OSError:
+                continue
+            rows.append((key, st.st_size, st.st_atime_ns))
+            if len(rows) >= _BATCH_SIZE:
+                self._insert_if_missing(conn, rows)
+                rows = []
+        self._insert_if_missing(conn, rows)
+
+    def _forget_dir(self, conn: sqlite3.Connection, dir_key: str) -> None:
+        """Drop the rows for a removed directory and everything in it."""
+        if not dir_key:
+            conn.execute("DELETE FROM objects")
+            conn.execute("DELETE FROM dirs")
+            return
+        # "0" sorts right after "/", so this matches the paths under the dir.
+        bounds = (f"{dir_key}/", f"{dir_key}0")
+        conn.execute("DELETE FROM objects WHERE path >= ? AND path < ?", bounds)
+        conn.execute("DELETE FROM dirs WHERE path >= ? AND path < ?", bounds)
+        conn.execute("DELETE FROM dirs WHERE path = ?", (dir_key,))
+
+    def _insert_if_missing(
+        self,
+        conn: sqlite3.Connection,
+        rows: list[tuple[str, int, int]],
+    ) -> None:
+        conn.executemany(
+            "INSERT INTO objects (path, size, atime_ns) VALUES (?, ?, ?)"
+            + " ON CONFLICT (path) DO NOTHING",
+            rows,
+        )
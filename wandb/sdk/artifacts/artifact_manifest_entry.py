@@ -6,9 +6,7 @@
 from __future__ import annotations
 
 import concurrent.futures
-import hashlib
 import logging
-import os
 from contextlib import suppress
 from os.path import getsize
 from typing import TYPE_CHECKING, Annotated, Any, Dict, Final, Optional, Union
@@ -43,46 +41,18 @@ logger = logging.getLogger(__name__)
 _WB_ARTIFACT_SCHEME: Final[str] = "wandb-artifact"
 
 
-def _checksum_cache_path(file_path: str) -> str:
-    """Get path for checksum in central cache directory."""
-    from wandb.sdk.artifacts.artifact_file_cache import artifacts_cache_dir
-
-    # Create a unique cache key based on the file's absolute path
-    abs_path = os.path.abspath(file_path)
-    path_hash = hashlib.sha256(abs_path.encode()).hexdigest()
-
-    # Store in wandb cache directory under checksums subdirectory
-    cache_dir = artifacts_cache_dir() / "checksums"
-    cache_dir.mkdir(parents=True, exist_ok=True)
-
-    return str(cache_dir / f"{path_hash}.checksum")
-
-
 def _read_cached_checksum(file_path: str) -> str | None:
-    """Read checksum from cache if it exists and is valid."""
-    checksum_path = _checksum_cache_path(file_path)
+    """Read checksum from cache if it exists and the file is unchanged."""
+    from .artifact_checksum_index import get_artifact_checksum_index
 
-    try:
-        with open(file_path) as f, open(checksum_path) as f_checksum:
-            if os.path.getmtime(f_checksum.name) < os.path.getmtime(f.name):
-                # File was modified after checksum was written
-                return None
-            # Read and return the cached checksum
-            return f_checksum.read().strip()
-    except OSError:
-        # File doesn't exist or couldn't be opened
-        return None
+    return get_artifact_checksum_index().get(file_path)
 
 
 def _write_cached_checksum(file_path: str, checksum: str) -> None:
-    """Write checksum to cache directory."""
-    checksum_path = _checksum_cache_path(file_path)
-    try:
-        with open(checksum_path, "w") as f:
-            f.write(checksum)
-    except OSError:
-        # Non-critical failure, just log it
-        logger.debug(f"Failed to write checksum cache for {file_path!r}")
+    """Write checksum to cache."""
+    from .artifact_checksum_index import get_artifact_checksum_index
+
+    get_artifact_checksum_index().put(file_path, B64MD5(checksum))
 
 
 class ArtifactManifestEntry(ArtifactsBase):
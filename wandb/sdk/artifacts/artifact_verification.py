@@ -0,0 +1,180 @@
+"""Verification of downloaded artifact files against a manifest."""
+
+from __future__ import annotations
+
+import math
+import os
+import random
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Literal, get_args
+
+from wandb.sdk.lib.hashutil import md5_files_b64
+
+from ._validators import validate_fspath
+from .artifact_checksum_index import get_artifact_checksum_index
+
+if TYPE_CHECKING:
+    from .artifact_manifest_entry import ArtifactManifestEntry
+
+VerifyMode = Literal["full", "sample", "size"]
+
+MismatchReason = Literal["missing", "size", "digest", "untracked"]
+
+
+@dataclass(frozen=True)
+class ArtifactFileMismatch:
+    """A file that doesn't match the artifact's manifest."""
+
+    path: str
+    """The local path of the file."""
+
+    reason: MismatchReason
+    """Whether the file is missing, has the wrong size or digest, or is not
+    part of the artifact."""
+
+    expected: str | int | None = None
+    """The size or digest recorded in the manifest."""
+
+    actual: str | int | None = None
+    """The size or digest of the local file."""
+
+    def __str__(self) -> str:
+        if self.reason == "missing":
+            return f"Missing file: {self.path}"
+        if self.reason == "size":
+            return (
+                f"Size mismatch for file: {self.path}"
+                f" (expected {self.expected}, found {self.actual})"
+            )
+        if self.reason == "digest":
+            return f"Digest mismatch for file: {self.path}"
+        return f"Found file {self.path} which is not a member of the artifact"
+
+
+@dataclass
+class ArtifactVerificationReport:
+    """The result of verifying an artifact's files."""
+
+    mismatches: list[ArtifactFileMismatch] = field(default_factory=list)
+    """Every file that failed verification."""
+
+    files_checked: int = 0
+    """The number of manifest entries that were checked."""
+
+    files_hashed: int = 0
+    """The number of files whose digest was computed."""
+
+    files_cached: int = 0
+    """The number of files whose digest was known from a previous hash."""
+
+    references_skipped: int = 0
+    """The number of reference entries, which are not verified."""
+
+    @property
+    def ok(self) -> bool:
+        """Whether every checked file matched the manifest."""
+        return not self.mismatches
+
+    def error_message(self, max_lines: int = 10) -> str:
+        """Summarize the mismatches for an error message."""
+        lines = [str(m) for m in self.mismatches[:max_lines]]
+        if (more := len(self.mismatches) - max_lines) > 0:
+            lines.append(f"...and {more} more")
+        return "\n".join(lines)
+
+
+def validate_verify_options(mode: str, sample_fraction: float) -> None:
+    """Check the options of a verification before any work is done.
+
+    Raises:
+        ValueError: If `mode` is unknown or `sample_fraction` is not in (0, 1].
+    """
+    if mode not in get_args(VerifyMode):
+        raise ValueError(
+            f"Invalid verification mode {mode!r}, expected one of "
+            + ", ".join(repr(m) for m in get_args(VerifyMode))
+        )
+    if not 0 < sample_fraction <= 1:
+        raise ValueError("sample_fraction must be greater than 0 and at most 1")
+
+
+def verify_files(
+    root: str,
+    entries: Iterable[ArtifactManifestEntry],
+    *,
+    mode: VerifyMode = "full",
+    sample_fraction: float = 0.1,
+) -> ArtifactVerificationReport:
+    """Check the files under `root` against manifest entries.
+
+    Every file's size is checked first. Depending on `mode`, the digests of
+    all files ("full"), a random subset of them ("sample"), or none of them
+    ("size") are then checked. Digests recorded in the checksum index for
+    files that haven't changed since they were downloaded are reused rather
+    than recomputed, and the remaining files are hashed in parallel.
+
+    Raises:
+        ValueError: If `mode` or `sample_fraction` is invalid, or an entry's
+            path is not a valid relative path.
+    """
+    validate_verify_options(mode, sample_fraction)
+
+    report = ArtifactVerificationReport()
+
+    # Local path to the entry it should match, and its stat.
+    to_check: dict[str, ArtifactManifestEntry] = {}
+    stats: dict[str, os.stat_result] = {}
+    for entry in entries:
+        if entry.ref is not None:
+            report.references_skipped += 1
+            continue
+
+        report.files_checked += 1
+        path = os.path.abspath(validate_fspath(root, entry.path))
+        try:
+            st = os.stat(path)
+        except FileNotFoundError:
+            report.mismatches.append(ArtifactFileMismatch(path, "missing"))
+            continue
+
+        if entry.size is not None and st.st_size != entry.size:
+            report.mismatches.append(
+                ArtifactFileMismatch(path, "size", entry.size, st.st_size)
+            )
+            continue
+
+        to_check[path] = entry
+        stats[path] = st
+
+    if mode == "size" or not to_check:
+        return report
+
+    checksum_index = get_artifact_checksum_index()
+    digests = checksum_index.get_many(stats)
+    report.files_cached = len(digests)
+
+    uncached = [path for path in to_check if path not in digests]
+    if mode == "sample":
+        sample_size = math.ceil(len(to_check) * sample_fraction)
+        uncached = random.sample(uncached, min(len(uncached), sample_size))
+
+    if uncached:
+        hashed, _ = md5_files_b64(
+            uncached,
+            sizes={path: stats[path].st_size for path in uncached},
+        )
+        checksum_index.put_many(
+            (path, stats[path], digest) for path, digest in hashed.items()
+        )
+        digests.update(hashed)
+        report.files_hashed = len(hashed)
+
+    for path, entry in to_check.items():
+        digest = digests.get(path)
+        if digest is not None and digest != entry.digest:
+            report.mismatches.append(
+                ArtifactFileMismatch(path, "digest", entry.digest, digest)
+            )
+
+    return report
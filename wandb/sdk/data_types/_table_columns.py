@@ -0,0 +1,214 @@
+"""Column-oriented storage for `wandb.Table` data."""
+
+from __future__ import annotations
+
+import itertools
+from collections.abc import Callable, Sequence
+from typing import TYPE_CHECKING, Any
+
+from wandb import util
+
+from . import _dtypes
+
+if TYPE_CHECKING:
+    import numpy as np
+
+# NumPy dtype kinds stored as arrays: booleans, integers and floats.
+_NUMERIC_KINDS = "biuf"
+
+
+def _is_numeric_array(values: Any) -> bool:
+    return (
+        util.is_numpy_array(values)
+        and values.ndim == 1
+        and values.dtype.kind in _NUMERIC_KINDS
+    )
+
+
+def to_column_chunk(values: Sequence[Any]) -> np.ndarray | list[Any]:
+    """Convert a batch of cell values to the form stored in a column.
+
+    One-dimensional numeric arrays are kept as they are. Lists of Python
+    bools, ints or floats of a single type are converted to an array if
+    NumPy is installed. Everything else is stored as a list of cells.
+    """
+    if _is_numeric_array(values):
+        return values
+    if util.is_numpy_array(values):
+        # Each element of a multi-dimensional array is itself a cell.
+        return list(values)
+
+    values = list(values)
+    if not values:
+        return values
+
+    first_type = values[0].__class__
+    if first_type not in (bool, int, float) or any(
+        v.__class__ is not first_type for v in values
+    ):
+        return values
+
+    np = util.get_module("numpy")
+    if np is None:
+        return values
+    try:
+        array = np.array(values, dtype=first_type)
+    except OverflowError:
+        # Integers beyond 64 bits.
+        return values
+
+    # Python float NaNs are typed as None rather than as numbers (see
+    # `TypeRegistry.type_of`), so such columns are typed cell by cell.
+    if array.dtype.kind == "f" and np.isnan(array).any():
+        return values
+    return array
+
+
+def chunk_type(chunk: np.ndarray | list[Any]) -> _dtypes.Type | None:
+    """Infer the type of all cells in a chunk at once, if possible.
+
+    Matches the type `TypeRegistry.type_of` assigns to each cell. Returns None
+    if the cells must be typed individually.
+    """
+    if len(chunk) == 0:
+        return None
+    if _is_numeric_array(chunk):
+        if chunk.dtype.kind == "b":
+            return _dtypes.BooleanType()
+        return _dtypes.NumberType()
+
+    if all(v.__class__ is str for v in chunk):
+        return _dtypes.StringType()
+    return None
+
+
+class ColumnarData:
+    """Table rows stored as a sequence of chunks per column.
+
+    Numeric columns are stored as NumPy arrays, which are much smaller than
+    lists of Python numbers and can be serialized in bulk.
+    """
+
+    def __init__(self, ncols: int = 0) -> None:
+        self._chunks: list[list[np.ndarray | list[Any]]] = [[] for _ in range(ncols)]
+        # Whether each column is stored as at most one chunk in its final form.
+        self._merged = [True] * ncols
+        self._nrows = 0
+
+    def __len__(self) -> int:
+        return self._nrows
+
+    def append(self, columns: Sequence[np.ndarray | list[Any]]) -> None:
+        """Append a batch of rows given as one chunk per column.
+
+        All chunks must have the same length. Lists are appended to a list at
+        the end of the column, so that rows added one at a time don't each
+        make a chunk.
+        """
+        assert len(columns) == len(self._chunks)
+        nrows = {len(chunk) for chunk in columns}
+        assert len(nrows) <= 1, "Columns must have the same length"
+        if not nrows or not nrows.pop():
+            return
+
+        for ndx, (chunks, chunk) in enumerate(zip(self._chunks, columns, strict=True)):
+            if chunks and isinstance(chunks[-1], list) and isinstance(chunk, list):
+                chunks[-1].extend(chunk)
+            else:
+                chunks.append(chunk)
+            self._merged[ndx] = False
+        self._nrows += len(columns[0])
+
+    def add_column(self, chunk: np.ndarray | list[Any]) -> None:
+        """Add a column with a value for each row."""
+        assert len(chunk) == self._nrows or not self._chunks
+        if not self._chunks:
+            self._nrows = len(chunk)
+        self._chunks.append([chunk])
+        self._merged.append(True)
+
+    def remove_last_column(self) -> None:
+        self._chunks.pop()
+        self._merged.pop()
+        if not self._chunks:
+            self._nrows = 0
+
+    def column(self, ndx: int) -> np.ndarray | list[Any]:
+        """Return all values of a column.
+
+        The result is an array if the column only contains numbers of the
+        same dtype, and a list of Python values otherwise.
+        """
+        chunks = self._chunks[ndx]
+        if self._merged[ndx]:
+            return chunks[0] if chunks else []
+
+        # Lists of numbers, such as rows added one at a time, become arrays.
+        chunks = [to_column_chunk(c) if isinstance(c, list) else c for c in chunks]
+        if len(chunks) == 1:
+            merged = chunks[0]
+        elif all(_is_numeric_array(c) for c in chunks) and (
+            len({c.dtype for c in chunks}) == 1
+        ):
+            np = util.get_module("numpy", required=True)
+            merged = np.concatenate(chunks)
+        else:
+            # Values are Python numbers, as with row storage, rather than
+            # NumPy scalars.
+            merged = list(
+                itertools.chain.from_iterable(
+                    c.tolist() if _is_numeric_array(c) else c for c in chunks
+                )
+            )
+
+        # Cache the merged column.
+        self._chunks[ndx] = [merged]
+        self._merged[ndx] = True
+        return merged
+
+    def is_numeric(self, ndx: int) -> bool:
+        """Whether a column is stored as a numeric array."""
+        return _is_numeric_array(self.column(ndx))
+
+    def column_values(self, ndx: int, start: int = 0, stop: int | None = None) -> list:
+        """Return a range of a column's values as a list.
+
+        Numeric values are converted to Python numbers in bulk.
+        """
+        column = self.column(ndx)[start:stop]
+        return column.tolist() if util.is_numpy_array(column) else list(column)
+
+    def rows(self, start: int = 0, stop: int | None = None) -> list[list[Any]]:
+        """Return a range of rows as lists of values."""
+        columns = [self.column_values(i, start, stop) for i in range(len(self._chunks))]
+        if not columns:
+            return [[] for _ in range(len(range(self._nrows))[start:stop])]
+        return [list(row) for row in zip(*columns, strict=True)]
+
+    def json_rows(
+        self,
+        to_json: Callable[[Any], Any],
+        start: int = 0,
+        stop: int | None = None,
+        skip: set[int] | None = None,
+    ) -> list[list[Any]]:
+        """Serialize a range of rows.
+
+        Numeric columns are converted in bulk; other cells are passed through
+        `to_json` one at a time. Columns in `skip` are serialized as None.
+        """
+        skip = skip or set()
+        nrows = len(range(self._nrows)[start:stop])
+
+        columns: list[list[Any]] = []
+        for ndx in range(len(self._chunks)):
+            if ndx in skip:
+                columns.append([None] * nrows)
+            elif self.is_numeric(ndx):
+                columns.append(self.column_values(ndx, start, stop))
+            else:
+                columns.append([to_json(v) for v in self.column(ndx)[start:stop]])
+
+        if not columns:
+            return [[] for _ in range(nrows)]
+        return [list(row) for row in zip(*columns, strict=True)]
@@ -6,11 +6,10 @@ import pathlib
 from typing import TYPE_CHECKING
 
 from wandb import util
-from wandb.sdk.lib import filesystem, runid
+from wandb.sdk.lib import filesystem
 
 from . import _dtypes
-from ._private import MEDIA_TMP
-from .base_types.media import BatchableMedia
+from .base_types.media import BatchableMedia, _HashingBuffer
 
 if TYPE_CHECKING:
     import numpy as np
@@ -58,12 +57,11 @@ class Audio(BatchableMedia):
                 required='Raw audio requires the soundfile package. To get it, run "pip install soundfile"',
             )
 
-            tmp_path = os.path.join(MEDIA_TMP.name, runid.generate_id() + ".wav")
-
-            soundfile.write(tmp_path, data_or_path, sample_rate)
+            buffer = _HashingBuffer()
+            soundfile.write(buffer, data_or_path, sample_rate, format="WAV")
             self._duration = len(data_or_path) / float(sample_rate)
 
-            self._set_file(tmp_path, is_tmp=True)
+            self._set_buffer(buffer, ".wav")
 
     @classmethod
     def get_media_subdir(cls):
@@ -91,7 +89,7 @@ class Audio(BatchableMedia):
 
         <!-- lazydoc-ignore -->
         """
-        if self.path_is_reference(self._path):
+        if self.path_is_reference(self._file_path):
             raise ValueError(
                 "Audio media created by a reference to external storage cannot currently be added to a run"
             )
@@ -183,7 +181,9 @@ class Audio(BatchableMedia):
         return None
 
     def __eq__(self, other):
-        if self.path_is_reference(self._path) or self.path_is_reference(other._path):
+        if self.path_is_reference(self._file_path) or self.path_is_reference(
+            other._file_path
+        ):
             # one or more of these objects is an unresolved reference -- we'll compare
             # their reference paths instead of their SHAs:
             return (
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import hashlib
+import io
 import os
 import pathlib
 import re
@@ -10,12 +11,15 @@ from typing import TYPE_CHECKING, Any, cast
 
 import wandb
 from wandb import util
-from wandb.sdk.lib import filesystem
+from wandb.sdk.lib import filesystem, runid
 from wandb.sdk.lib.paths import LogicalPath
 
+from .._private import MEDIA_TMP
 from .wb_value import WBValue
 
 if TYPE_CHECKING:  # pragma: no cover
+    import _hashlib  # type: ignore[import-not-found]
+
     import numpy as np
 
     from wandb.sdk.artifacts.artifact import Artifact
@@ -48,14 +52,56 @@ def _wb_filename(key: str | int, step: str | int, id: str | int, extension: str)
     return f"{str(key)}_{str(step)}_{str(id)}{extension}"
 
 
+_HASH_CHUNK_SIZE = 1024 * 1024
+"""Chunk size (in bytes) for hashing media files."""
+
+
+def _sha256_file(path: str) -> str:
+    """Compute the SHA256 of a file without reading all of it into memory."""
+    sha256 = hashlib.sha256()
+    with open(path, "rb") as f:
+        while chunk := f.read(_HASH_CHUNK_SIZE):
+            sha256.update(chunk)
+    return sha256.hexdigest()
+
+
+class _HashingBuffer(io.BytesIO):
+    """An in-memory file that computes the SHA256 of its contents as they're written.
+
+    Encoders that seek back to rewrite earlier bytes, such as for file
+    headers, are supported: the hash is then computed from the full contents.
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._sha256: _hashlib.HASH | None = hashlib.sha256()
+        self._hashed = 0
+
+    def write(self, b: Any) -> int:
+        if self._sha256 is not None and self.tell() != self._hashed:
+            self._sha256 = None
+
+        n = super().write(b)
+        if self._sha256 is not None:
+            self._sha256.update(b)
+            self._hashed += n
+        return n
+
+    def sha256(self) -> str:
+        """The SHA256 of the buffer's contents."""
+        if self._sha256 is None or self._hashed != len(self.getbuffer()):
+            return hashlib.sha256(self.getvalue()).hexdigest()
+        return self._sha256.hexdigest()
+
+
 class Media(WBValue):
     """A WBValue stored as a file outside JSON that can be rendered in a media panel.
 
     If necessary, we move or copy the file into the Run's media directory so that it
-    gets uploaded.
+    gets uploaded. Media encoded in memory is written directly to the Run's media
+    directory instead.
     """
 
-    _path: str | None
     _run: wandb.Run | None
     _caption: str | None
     _is_tmp: bool | None
@@ -63,6 +109,10 @@ class Media(WBValue):
     _sha256: str | None
     _size: int | None
 
+    # The file's contents if they have not been written to disk yet.
+    _buffer: bytes | None = None
+    _file_path: str | None = None
+
     def __init__(self, caption: str | None = None) -> None:
         super().__init__()
         self._path = None
@@ -83,9 +133,47 @@ class Media(WBValue):
             f'Media file extension "{extension}" must occur at the end of path "{path}".'
         )
 
-        with open(self._path, "rb") as f:
-            self._sha256 = hashlib.sha256(f.read()).hexdigest()
-        self._size = os.path.getsize(self._path)
+        self._sha256 = _sha256_file(path)
+        self._size = os.path.getsize(path)
+
+    def _set_buffer(self, buffer: _HashingBuffer, extension: str) -> None:
+        """Use the contents of an in-memory file as the media file.
+
+        Nothing is written to disk until the object is bound to a run, which
+        writes the file directly to the run's media directory, or until its
+        path is needed.
+        """
+        self._file_path = None
+        self._buffer = buffer.getvalue()
+        self._is_tmp = True
+        self._extension = extension
+        self._sha256 = buffer.sha256()
+        self._size = len(self._buffer)
+
+    @property
+    def _path(self) -> str | None:
+        """The path of the media file.
+
+        For media encoded in memory, this writes the file to a temporary
+        directory.
+        """
+        if self._buffer is not None:
+            self._write_buffer(
+                os.path.join(MEDIA_TMP.name, runid.generate_id() + self._extension)
+            )
+        return self._file_path
+
+    @_path.setter
+    def _path(self, path: str | None) -> None:
+        self._buffer = None
+        self._file_path = path
+
+    def _write_buffer(self, path: str) -> None:
+        assert self._buffer is not None
+        with open(path, "wb") as f:
+            f.write(self._buffer)
+        self._buffer = None
+        self._file_path = path
 
     @classmethod
     def get_media_subdir(cls: type[Media]) -> str:
@@ -104,7 +192,9 @@ class Media(WBValue):
         return self._run is not None
 
     def file_is_set(self) -> bool:
-        return self._path is not None and self._sha256 is not None
+        return (
+            self._buffer is not None or self._file_path is not None
+        ) and self._sha256 is not None
 
     def bind_to_run(
         self,
@@ -121,16 +211,16 @@ class Media(WBValue):
         """
         assert self.file_is_set(), "bind_to_run called before _set_file"
 
-        # The following two assertions are guaranteed to pass
-        # by definition file_is_set, but are needed for
-        # mypy to understand that these are strings below.
-        assert isinstance(self._path, str)
+        # The following assertion is guaranteed to pass
+        # by definition file_is_set, but is needed for
+        # mypy to understand that this is a string below.
         assert isinstance(self._sha256, str)
 
         assert run is not None, 'Argument "run" must not be None.'
         self._run = run
 
         if self._extension is None:
+            assert isinstance(self._path, str)
             _, extension = os.path.splitext(os.path.basename(self._path))
         else:
             extension = self._extension
@@ -143,11 +233,16 @@ class Media(WBValue):
         new_path = os.path.join(self._run.dir, media_path)
         filesystem.mkdir_exists_ok(os.path.dirname(new_path))
 
-        if self._is_tmp:
+        if self._buffer is not None:
+            self._write_buffer(new_path)
+            self._is_tmp = False
+        elif self._is_tmp:
+            assert isinstance(self._path, str)
             shutil.move(self._path, new_path)
             self._path = new_path
             self._is_tmp = False
         elif run._settings.allow_media_symlink:
+            assert isinstance(self._path, str)
             filesystem.link_or_copy(
                 run._settings,
                 pathlib.Path(self._path).resolve(),
@@ -155,6 +250,7 @@ class Media(WBValue):
             )
             self._path = new_path
         else:
+            assert isinstance(self._path, str)
             try:
                 shutil.copy(self._path, new_path)
             except shutil.SameFileError:
@@ -6,10 +6,8 @@ from typing import TYPE_CHECKING
 
 import wandb
 from wandb import util
-from wandb.sdk.lib import runid
 
-from .._private import MEDIA_TMP
-from ..base_types.media import Media
+from ..base_types.media import Media, _HashingBuffer
 
 if TYPE_CHECKING:  # pragma: no cover
     from wandb.sdk.artifacts.artifact import Artifact
@@ -166,7 +164,6 @@ class ImageMask(Media):
             self._key = key
 
             ext = "." + self.type_name() + ".png"
-            tmp_path = os.path.join(MEDIA_TMP.name, runid.generate_id() + ext)
 
             pil_image = util.get_module(
                 "PIL.Image",
@@ -174,8 +171,9 @@ class ImageMask(Media):
             )
             image = pil_image.fromarray(val["mask_data"].astype(np.int8)).convert("L")
 
-            image.save(tmp_path, transparency=None)
-            self._set_file(tmp_path, is_tmp=True, extension=ext)
+            buffer = _HashingBuffer()
+            image.save(buffer, format="PNG", transparency=None)
+            self._set_buffer(buffer, ext)
 
     def bind_to_run(
         self,
@@ -13,12 +13,11 @@ from packaging.version import parse as parse_version
 
 import wandb
 from wandb import util
-from wandb.sdk.lib import hashutil, runid
+from wandb.sdk.lib import hashutil
 from wandb.sdk.lib.paths import LogicalPath
 
 from . import _dtypes
-from ._private import MEDIA_TMP
-from .base_types.media import BatchableMedia, Media
+from .base_types.media import BatchableMedia, Media, _HashingBuffer
 from .helper_types.bounding_boxes_2d import BoundingBoxes2D
 from .helper_types.classes import Classes
 from .helper_types.image_mask import ImageMask
@@ -364,7 +363,8 @@ class Image(BatchableMedia):
         self._height = wbimage._height
         self._image = wbimage._image
         self._classes = wbimage._classes
-        self._path = wbimage._path
+        self._file_path = wbimage._file_path
+        self._buffer = wbimage._buffer
         self._is_tmp = wbimage._is_tmp
         self._extension = wbimage._extension
         self._sha256 = wbimage._sha256
@@ -416,8 +416,6 @@ class Image(BatchableMedia):
         if self.format not in accepted_formats:
             raise ValueError(f"file_type must be one of {accepted_formats}")
 
-        tmp_path = os.path.join(MEDIA_TMP.name, runid.generate_id() + "." + self.format)
-
         if util.is_matplotlib_typename(util.get_full_typename(data)):
             buf = BytesIO()
             util.ensure_matplotlib_figure(data).savefig(buf, format=self.format)
@@ -456,8 +454,14 @@ class Image(BatchableMedia):
             self._image = pil_image.fromarray(data).convert(mode)
 
         assert self._image is not None
-        self._image.save(tmp_path, transparency=None)
-        self._set_file(tmp_path, is_tmp=True)
+        extension = "." + self.format
+        buffer = _HashingBuffer()
+        self._image.save(
+            buffer,
+            format=pil_image.registered_extensions()[extension],
+            transparency=None,
+        )
+        self._set_buffer(buffer, extension)
 
     @classmethod
     def from_json(cls: type[Image], json_obj: dict, source_artifact: Artifact) -> Image:
@@ -526,7 +530,7 @@ class Image(BatchableMedia):
         # space, but there are also custom charts, and maybe others. Let's
         # commit to getting all that fixed up before moving this to  the top
         # level Media class.
-        if self.path_is_reference(self._path):
+        if self.path_is_reference(self._file_path):
             raise ValueError(
                 "Image media created by a reference to external storage cannot currently be added to a run"
             )
@@ -792,8 +796,8 @@ class Image(BatchableMedia):
         if not isinstance(other, Image):
             return False
         else:
-            if self.path_is_reference(self._path) and self.path_is_reference(
-                other._path
+            if self.path_is_reference(self._file_path) and self.path_is_reference(
+                other._file_path
             ):
                 return self._path == other._path
             self_image = self.image
@@ -826,21 +830,25 @@ class Image(BatchableMedia):
         return res
 
     def _free_ram(self) -> None:
-        if self._path is not None:
+        if self._buffer is not None or self._file_path is not None:
             self._image = None
 
     @property
     def image(self) -> PILImage | None:
-        if (
-            self._image is None
-            and self._path is not None
-            and not self.path_is_reference(self._path)
+        if self._image is None and (
+            self._buffer is not None
+            or (
+                self._file_path is not None
+                and not self.path_is_reference(self._file_path)
+            )
         ):
             pil_image = util.get_module(
                 "PIL.Image",
                 required='wandb.Image needs the PIL package. To get it, run "pip install pillow".',
             )
-            self._image = pil_image.open(self._path)
+            self._image = pil_image.open(
+                BytesIO(self._buffer) if self._buffer is not None else self._file_path
+            )
             self._image.load()
         return self._image
 
@@ -3,7 +3,9 @@ from __future__ import annotations
 import base64
 import binascii
 import codecs
+import collections
 import datetime
+import itertools
 import json
 import logging
 import os
@@ -16,6 +18,7 @@ from wandb.sdk.lib import runid, telemetry
 
 from . import _dtypes
 from ._private import MEDIA_TMP
+from ._table_columns import ColumnarData, chunk_type, to_column_chunk
 from .base_types.media import Media, _numpy_arrays_to_lists
 from .base_types.wb_value import WBValue
 from .table_decorators import (
@@ -37,6 +40,8 @@ if TYPE_CHECKING:
 LogMode = Literal["IMMUTABLE", "MUTABLE", "INCREMENTAL"]
 _SUPPORTED_LOGGING_MODES = list(get_args(LogMode))
 
+StorageMode = Literal["rows", "columnar"]
+
 # A column identifier: either a string name or an integer index.
 ColumnKey = str | int
 
@@ -45,6 +50,10 @@ InputRow = Iterable[Any]
 
 _T = TypeVar("_T")
 
+# Limits for loading the increments of an incremental table.
+_INCREMENT_MAX_WORKERS = 8
+_INCREMENT_READ_AHEAD = 16
+
 
 class _TableLinkMixin:
     def set_table(self, table):
@@ -222,6 +231,7 @@ class Table(Media):
 
     MAX_ROWS = 10000
     MAX_ARTIFACT_ROWS = 200000
+
     _MAX_EMBEDDING_DIMENSIONS = 150
     _log_type = "table"
 
@@ -235,6 +245,7 @@ class Table(Media):
         optional: bool | list[bool] = True,
         allow_mixed_types: bool = False,
         log_mode: LogMode | None = "IMMUTABLE",
+        storage: StorageMode = "rows",
     ) -> None:
         """Initializes a Table object.
 
@@ -273,9 +284,22 @@ class Table(Media):
                 a new artifact version each time it's logged.
                 - "INCREMENTAL": Table data is logged incrementally, with each log creating
                 a new artifact entry containing the new data since the last log.
+            storage: How the Table holds its data in memory.
+                Options:
+                - "rows" (default): a list of rows.
+                - "columnar": one array or list per column. Numeric columns are
+                stored as NumPy arrays, and types are inferred and values
+                serialized a column at a time, which is much faster for large
+                numeric tables. Accessing `Table.data` converts the table to
+                row storage.
         """
         super().__init__()
-        self.data: list[list[Any]]
+        assert storage in get_args(StorageMode), f"Invalid storage: {storage}"
+        self._storage: StorageMode = storage
+        self._rows: list[list[Any]] = []
+        self._columnar: ColumnarData | None = None
+        self._unloaded_media_columns: set[int] = set()
+        self._media_source_artifact: artifact.Artifact | None = None
         self.columns: list[ColumnKey]
         self._column_types: _dtypes.Type
         self._validate_log_mode(log_mode)
@@ -341,6 +365,45 @@ class Table(Media):
         """
         return self._run is not None or self._artifact_target is not None
 
+    @property
+    def data(self) -> list[list[Any]]:
+        """The rows of the table.
+
+        For a table with columnar storage, this converts the table to row
+        storage.
+        """
+        if self._columnar is not None:
+            self._rows = self._columnar.rows()
+            self._columnar = None
+        if self._unloaded_media_columns:
+            self._load_media_columns(set(self._unloaded_media_columns))
+        return self._rows
+
+    @data.setter
+    def data(self, rows: list[list[Any]]) -> None:
+        self._columnar = None
+        self._unloaded_media_columns = set()
+        self._rows = rows
+
+    def _clear_data(self) -> None:
+        if self._storage == "columnar":
+            self._rows = []
+            self._unloaded_media_columns = set()
+            self._columnar = ColumnarData(len(self.columns))
+        else:
+            self.data = []
+
+    def _nrows(self) -> int:
+        if self._columnar is not None:
+            return len(self._columnar)
+        return len(self._rows)
+
+    def _column_values(self, col_ndx: int) -> Iterable[Any]:
+        if self._columnar is not None:
+            return self._columnar.column(col_ndx)
+        self._load_media_columns({col_ndx})
+        return (row[col_ndx] for row in self._rows)
+
     @staticmethod
     def _assert_valid_columns(columns: list[ColumnKey]) -> None:
         valid_col_types = [str, int]
@@ -357,12 +420,11 @@ class Table(Media):
         dtype: Any = None,
     ) -> None:
         assert isinstance(data, list), "data argument expects a `list` object"
-        self.data = []
         self._assert_valid_columns(columns)
         self.columns = columns
+        self._clear_data()
         self._make_column_types(dtype, optional)
-        for row in data:
-            self.add_data(*row)
+        self._add_rows(data)
 
     def _init_from_ndarray(
         self,
@@ -374,12 +436,11 @@ class Table(Media):
         assert util.is_numpy_array(ndarray), (
             "ndarray argument expects a `numpy.ndarray` object"
         )
-        self.data = []
         self._assert_valid_columns(columns)
         self.columns = columns
+        self._clear_data()
         self._make_column_types(dtype, optional)
-        for row in ndarray:
-            self.add_data(*row)
+        self._add_rows(ndarray)
 
     def _init_from_dataframe(
         self,
@@ -391,13 +452,25 @@ class Table(Media):
         assert util.is_pandas_data_frame(dataframe), (
             "dataframe argument expects a `pandas.core.frame.DataFrame` object"
         )
-        self.data = []
         columns = list(dataframe.columns)
         self._assert_valid_columns(columns)
         self.columns = columns
+        self._clear_data()
         self._make_column_types(dtype, optional)
-        for row in range(len(dataframe)):
-            self.add_data(*tuple(dataframe[col].values[row] for col in self.columns))
+        if (
+            type(self).add_data is not Table.add_data
+            or self._pk_col is not None
+            or self._fk_cols
+        ):
+            for row in range(len(dataframe)):
+                self.add_data(
+                    *tuple(dataframe[col].values[row] for col in self.columns)
+                )
+            return
+        if len(dataframe):
+            # `values` rather than `to_numpy()`, which returns timezone-aware
+            # datetimes as Timestamp objects instead of datetime64 values.
+            self._add_column_batch([dataframe[col].values for col in self.columns])
 
     def _to_per_column(self, value: _T | list[_T]) -> list[_T]:
         """Canonicalizes to a list of values per column.
@@ -519,11 +592,19 @@ class Table(Media):
 
         # Cast each value in the row, raising an error if there are invalid entries.
         col_ndx = self.columns.index(col_name)
-        for row in self.data:
-            result_type = wbtype.assign(row[col_ndx])
+        values = self._column_values(col_ndx)
+        if self._columnar is not None and (batch_type := chunk_type(values)):
+            # Type the whole column at once if possible, and fall back to
+            # typing each value to explain why the cast is invalid.
+            result_type = wbtype.assign_type(batch_type)
+            if not isinstance(result_type, _dtypes.InvalidType):
+                values = ()
+                wbtype = result_type
+        for value in values:
+            result_type = wbtype.assign(value)
             if isinstance(result_type, _dtypes.InvalidType):
                 raise TypeError(
-                    f"Existing data {row[col_ndx]}, of type {_dtypes.TypeRegistry.type_of(row[col_ndx])} cannot be cast to {wbtype}"
+                    f"Existing data {value}, of type {_dtypes.TypeRegistry.type_of(value)} cannot be cast to {wbtype}"
                 )
             wbtype = result_type
 
@@ -605,6 +686,121 @@ class Table(Media):
 
         The length of the data should match the length of the table column.
         """
+        self._add_data(data)
+
+    @allow_relogging_after_mutation
+    @allow_incremental_logging_after_append
+    def add_rows(self, rows: Iterable[InputRow] | np.ndarray) -> None:
+        """Adds many rows of data to the table.
+
+        Equivalent to calling `add_data` for each row. For a table with
+        columnar storage, column types are inferred once per column for the
+        whole batch.
+
+        Args:
+            rows: A list of rows, or a 2D NumPy array.
+        """
+        self._add_rows(rows)
+
+    def _add_rows(self, rows: Iterable[InputRow] | np.ndarray) -> None:
+        if type(self).add_data is not Table.add_data:
+            # Subclasses may validate or transform each row in `add_data`.
+            for row in rows:
+                self.add_data(*row)
+            return
+
+        if self._pk_col is not None or self._fk_cols:
+            for row in rows:
+                self._add_data(tuple(row))
+            return
+
+        if util.is_numpy_array(rows):
+            if TYPE_CHECKING:
+                rows = cast("np.ndarray", rows)
+            if rows.ndim < 2:
+                raise ValueError(
+                    f"Expected an array of rows with at least 2 dimensions, found {rows.ndim}D"
+                )
+            if rows.shape[1] != len(self.columns):
+                raise ValueError(
+                    f"This table expects {len(self.columns)} columns: {self.columns}, found {rows.shape[1]}"
+                )
+            if rows.shape[0]:
+                self._add_column_batch(
+                    [rows[:, ndx] for ndx in range(rows.shape[1])]
+                )
+            return
+
+        if self._columnar is None:
+            for row in rows:
+                self._add_data(tuple(row))
+            return
+
+        rows = [tuple(row) for row in rows]
+        for row in rows:
+            if len(row) != len(self.columns):
+                raise ValueError(
+                    f"This table expects {len(self.columns)} columns: {self.columns}, found {len(row)}"
+                )
+        if rows:
+            self._add_column_batch([list(col) for col in zip(*rows, strict=True)])
+
+    def _add_column_batch(
+        self,
+        columns: Sequence[Sequence[Any]],
+        convert: bool = True,
+    ) -> None:
+        """Append rows given as a sequence of values per column.
+
+        Types are inferred per column for the whole batch, and nothing is
+        added if any value has an incompatible type. Numeric NumPy columns are
+        typed by their dtype; other columns are typed cell by cell unless all
+        of their values are strings.
+
+        With `convert=False`, columnar tables store the values as lists
+        until the column is read, rather than converting them to arrays now.
+        """
+
+        # Columns containing keys need to be cast, as in `add_data`.
+        if any(
+            isinstance(value, _TableLinkMixin)
+            for values in columns
+            if not util.is_numpy_array(values) or values.dtype.kind == "O"
+            for value in values
+        ):
+            for row in zip(*columns, strict=True):
+                self._add_data(row)
+            return
+
+        if self._columnar is not None and convert:
+            chunks = [to_column_chunk(values) for values in columns]
+        else:
+            chunks = list(columns)
+        type_map = dict(self._column_types.params["type_map"])
+        for col_key, chunk in zip(self.columns, chunks, strict=True):
+            col_type = type_map[col_key]
+            result_type = _dtypes.InvalidType()
+            if batch_type := chunk_type(chunk):
+                result_type = col_type.assign_type(batch_type)
+            if isinstance(result_type, _dtypes.InvalidType):
+                result_type = col_type
+                for value in chunk:
+                    next_type = result_type.assign(value)
+                    if isinstance(next_type, _dtypes.InvalidType):
+                        raise TypeError(
+                            f"Data in column {col_key!r} contained incompatible types:\n"
+                            + result_type.explain(value)
+                        )
+                    result_type = next_type
+            type_map[col_key] = result_type
+
+        self._column_types = _dtypes.TypedDictType(type_map)
+        if self._columnar is not None:
+            self._columnar.append(chunks)
+        else:
+            self._rows.extend(list(row) for row in zip(*chunks, strict=True))
+
+    def _add_data(self, data: Sequence[Any]) -> None:
         if len(data) != len(self.columns):
             raise ValueError(
                 f"This table expects {len(self.columns)} columns: {self.columns}, found {len(data)}"
@@ -620,6 +816,11 @@ class Table(Media):
                     optional=False,
                 )
 
+        if self._columnar is not None and self._pk_col is None and not self._fk_cols:
+            # Single rows are buffered in lists at the end of each column.
+            self._add_column_batch([[value] for value in data], convert=False)
+            return
+
         # Update the table's column types
         result_type = self._get_updated_result_type(data)
         self._column_types = result_type
@@ -655,7 +856,15 @@ class Table(Media):
         # separate this method for easier testing
         if max_rows is None:
             max_rows = Table.MAX_ROWS
-        n_rows = len(self.data)
+        self._check_row_limit(max_rows, warn)
+
+        start, stop = self._row_range(max_rows)
+        if self._columnar is not None:
+            return {"columns": self.columns, "data": self._columnar.rows(start, stop)}
+        return {"columns": self.columns, "data": self.data[start:stop]}
+
+    def _check_row_limit(self, max_rows: int, warn: bool) -> None:
+        n_rows = self._nrows()
         if n_rows > max_rows and warn:
             # NOTE: Never raises for reinit="create_new" runs.
             #   Since this is called by bind_to_run(), this can be fixed by
@@ -674,15 +883,13 @@ class Table(Media):
                 )
             logging.warning(f"Truncating wandb.Table object to {max_rows} rows.")
 
+    def _row_range(self, max_rows: int) -> tuple[int, int]:
+        """Returns the start and end of the rows to serialize."""
         if self.log_mode == "INCREMENTAL" and self._last_logged_idx is not None:
-            return {
-                "columns": self.columns,
-                "data": self.data[
-                    self._last_logged_idx + 1 : self._last_logged_idx + 1 + max_rows
-                ],
-            }
+            start = self._last_logged_idx + 1
         else:
-            return {"columns": self.columns, "data": self.data[:max_rows]}
+            start = 0
+        return start, start + max_rows
 
     def bind_to_run(self, *args, **kwargs):
         """Bind this object to a run.
@@ -714,57 +921,21 @@ class Table(Media):
         cls,
         json_obj: dict[str, Any],
         source_artifact: artifact.Artifact,
+        lazy_media: bool = False,
     ) -> Table:
         """Deserialize JSON object into it's class representation.
 
+        If `lazy_media` is set, media objects (images, audio, nested tables,
+        ...) are created when their column is first accessed rather than when
+        the table is loaded.
+
         <!-- lazydoc-ignore -->
         """
         data: list[InputRow] = []
-        column_types = None
-        np_deserialized_columns = {}
-        timestamp_column_indices = set()
         log_mode = json_obj.get("log_mode", "IMMUTABLE")
-        if json_obj.get("column_types") is not None:
-            column_types = _dtypes.TypeRegistry.type_from_dict(
-                json_obj["column_types"], source_artifact
-            )
-            for col_name in column_types.params["type_map"]:
-                col_type = column_types.params["type_map"][col_name]
-                ndarray_type = None
-                if isinstance(col_type, _dtypes.NDArrayType):
-                    ndarray_type = col_type
-                elif isinstance(col_type, _dtypes.UnionType):
-                    for t in col_type.params["allowed_types"]:
-                        if isinstance(t, _dtypes.NDArrayType):
-                            ndarray_type = t
-                        elif isinstance(t, _dtypes.TimestampType):
-                            timestamp_column_indices.add(
-                                json_obj["columns"].index(col_name)
-                            )
-
-                elif isinstance(col_type, _dtypes.TimestampType):
-                    timestamp_column_indices.add(json_obj["columns"].index(col_name))
-
-                if (
-                    ndarray_type is not None
-                    and ndarray_type._get_serialization_path() is not None
-                ):
-                    serialization_path = ndarray_type._get_serialization_path()
-
-                    if serialization_path is None:
-                        continue
-
-                    np = util.get_module(
-                        "numpy",
-                        required="Deserializing NumPy columns requires NumPy to be installed.",
-                    )
-                    deserialized = np.load(
-                        source_artifact.get_entry(serialization_path["path"]).download()
-                    )
-                    np_deserialized_columns[json_obj["columns"].index(col_name)] = (
-                        deserialized[serialization_path["key"]]
-                    )
-                    ndarray_type._clear_serialization_path()
+        column_types, timestamp_column_indices, np_deserialized_columns = (
+            _load_special_columns(json_obj, source_artifact)
+        )
 
         if log_mode == "INCREMENTAL":
             unprocessed_table_data = _get_data_from_increments(
@@ -773,6 +944,22 @@ class Table(Media):
         else:
             unprocessed_table_data = json_obj["data"]
 
+        # The stored column types describe the stored data, so the rows can be
+        # adopted without inferring their types again. Subclasses may validate
+        # or transform rows in `add_data`, so they're added one at a time.
+        if column_types is not None and cls.add_data is Table.add_data:
+            new_obj = cls(columns=json_obj["columns"], log_mode=log_mode)
+            new_obj._column_types = column_types
+            new_obj._adopt_rows(
+                unprocessed_table_data,
+                timestamp_column_indices,
+                np_deserialized_columns,
+                source_artifact,
+                lazy_media,
+            )
+            new_obj._update_keys()
+            return new_obj
+
         for r_ndx, row in enumerate(unprocessed_table_data):
             data.append(
                 _process_table_row(
@@ -801,6 +988,108 @@ class Table(Media):
         new_obj._update_keys()
         return new_obj
 
+    @classmethod
+    def iter_json_rows(
+        cls,
+        json_obj: dict[str, Any],
+        source_artifact: artifact.Artifact,
+    ) -> Iterator[list[Any]]:
+        """Iterate over the rows of a serialized table without loading it.
+
+        Rows are deserialized as in `from_json`. For incremental tables,
+        increments are downloaded in the background and rows are yielded as
+        soon as their increment is available.
+
+        <!-- lazydoc-ignore -->
+        """
+        _, timestamp_column_indices, np_deserialized_columns = (
+            _load_special_columns(json_obj, source_artifact)
+        )
+
+        if json_obj.get("log_mode", "IMMUTABLE") == "INCREMENTAL":
+            increments: Iterable[list[Any]] = _iter_increments(
+                json_obj, source_artifact
+            )
+        else:
+            increments = [json_obj["data"]]
+
+        r_ndx = 0
+        for rows in increments:
+            for row in rows:
+                yield _process_table_row(
+                    row,
+                    timestamp_column_indices,
+                    np_deserialized_columns,
+                    source_artifact,
+                    r_ndx,
+                )
+                r_ndx += 1
+
+    def _adopt_rows(
+        self,
+        rows: list[list[Any]],
+        timestamp_column_indices: set[int],
+        np_deserialized_columns: dict[int, Any],
+        source_artifact: artifact.Artifact,
+        lazy_media: bool,
+    ) -> None:
+        """Use deserialized rows as the table's data, without type checks.
+
+        The rows are modified in place. Special columns are converted a column
+        at a time, as in `_process_table_row`, and columns whose type only
+        allows plain JSON values are left as they are. If `lazy_media` is set,
+        media objects are created when their column is first used.
+        """
+        for row in rows:
+            if len(row) != len(self.columns):
+                raise ValueError(
+                    f"This table expects {len(self.columns)} columns: {self.columns}, found {len(row)}"
+                )
+
+        self.data = rows
+        self._media_source_artifact = source_artifact
+
+        type_map = self._column_types.params["type_map"]
+        for col_ndx, col_name in enumerate(self.columns):
+            if col_ndx in np_deserialized_columns:
+                values = np_deserialized_columns[col_ndx]
+                for row_ndx, row in enumerate(rows):
+                    row[col_ndx] = values[row_ndx]
+                continue
+
+            if col_ndx in timestamp_column_indices:
+                for row in rows:
+                    if isinstance(value := row[col_ndx], (int, float)):
+                        row[col_ndx] = datetime.datetime.fromtimestamp(
+                            value / 1000, tz=datetime.timezone.utc
+                        )
+
+            if not _is_plain_json_type(type_map[str(col_name)]):
+                self._unloaded_media_columns.add(col_ndx)
+
+        if not lazy_media:
+            self._load_media_columns(set(self._unloaded_media_columns))
+
+    def _load_media_columns(self, col_ndxs: set[int]) -> None:
+        """Create the media objects in columns loaded with `lazy_media`."""
+        col_ndxs &= self._unloaded_media_columns
+        if not col_ndxs:
+            return
+
+        self._unloaded_media_columns -= col_ndxs
+        for col_ndx in sorted(col_ndxs):
+            for row in self._rows:
+                if (
+                    isinstance(value := row[col_ndx], dict)
+                    and "_type" in value
+                    and (
+                        obj := WBValue.init_from_json(
+                            value, self._media_source_artifact
+                        )
+                    )
+                ):
+                    row[col_ndx] = obj
+
     def to_json(self, run_or_artifact: Any) -> dict[str, Any]:
         """Returns the JSON representation expected by the backend.
 
@@ -836,15 +1125,13 @@ class Table(Media):
                 {
                     "_type": wbvalue_type,
                     "ncols": len(self.columns),
-                    "nrows": len(self.data),
+                    "nrows": self._nrows(),
                     "log_mode": self.log_mode,
                 }
             )
 
         elif isinstance(run_or_artifact, wandb.Artifact):
             artifact = run_or_artifact
-            mapped_data = []
-            data = self._to_table_json(Table.MAX_ARTIFACT_ROWS)["data"]
 
             ndarray_col_ndxs = set()
             for col_ndx, col_name in enumerate(self.columns):
@@ -891,14 +1178,7 @@ class Table(Media):
                     ndarray_type._set_serialization_path(entry.path, str(col_name))
                     ndarray_col_ndxs.add(col_ndx)
 
-            for row in data:
-                mapped_row: list[Any] = []
-                for ndx, v in enumerate(row):
-                    if ndx in ndarray_col_ndxs:
-                        mapped_row.append(None)
-                    else:
-                        mapped_row.append(_json_helper(v, artifact))
-                mapped_data.append(mapped_row)
+            mapped_data = self._to_artifact_json_data(artifact, ndarray_col_ndxs)
 
             json_dict.update(
                 {
@@ -916,6 +1196,35 @@ class Table(Media):
 
         return json_dict
 
+    def _to_artifact_json_data(
+        self,
+        artifact: artifact.Artifact,
+        skip_col_ndxs: set[int],
+    ) -> list[list[Any]]:
+        """Serialize the rows logged to an artifact.
+
+        Columns in `skip_col_ndxs` are serialized separately and left as None.
+        """
+        if self._columnar is not None:
+            self._check_row_limit(Table.MAX_ARTIFACT_ROWS, warn=True)
+            # Serialize numeric columns in bulk rather than cell by cell.
+            return self._columnar.json_rows(
+                lambda v: _json_helper(v, artifact),
+                *self._row_range(Table.MAX_ARTIFACT_ROWS),
+                skip=skip_col_ndxs,
+            )
+
+        mapped_data = []
+        for row in self._to_table_json(Table.MAX_ARTIFACT_ROWS)["data"]:
+            mapped_row: list[Any] = []
+            for ndx, v in enumerate(row):
+                if ndx in skip_col_ndxs:
+                    mapped_row.append(None)
+                else:
+                    mapped_row.append(_json_helper(v, artifact))
+            mapped_data.append(mapped_row)
+        return mapped_data
+
     def iterrows(self) -> Iterator[tuple[_TableIndex, list[Any]]]:
         """Returns the table data by row, showing the index of the row and the relevant data.
 
@@ -927,10 +1236,10 @@ class Table(Media):
 
         <!-- lazydoc-ignore -->
         """
-        for ndx in range(len(self.data)):
+        for ndx, row in enumerate(self.data):
             index = _TableIndex(ndx)
             index.set_table(self)
-            yield index, self.data[ndx]
+            yield index, row
 
     @allow_relogging_after_mutation
     def set_pk(self, col_name: ColumnKey) -> None:
@@ -1064,10 +1373,21 @@ class Table(Media):
         assert isinstance(data, list) or is_np
         assert isinstance(optional, bool)
         is_first_col = len(self.columns) == 0
-        assert is_first_col or len(data) == len(self.data), (
-            f"Expected length {len(self.data)}, found {len(data)}"
+        assert is_first_col or len(data) == self._nrows(), (
+            f"Expected length {self._nrows()}, found {len(data)}"
         )
 
+        if self._columnar is not None:
+            self._columnar.add_column(to_column_chunk(data))
+            self.columns.append(name)
+            try:
+                self.cast(name, _dtypes.UnknownType(), optional=optional)
+            except TypeError:
+                self._columnar.remove_last_column()
+                self.columns.pop()
+                raise
+            return
+
         # Add the new data
         for ndx in range(max(len(data), len(self.data))):
             if is_first_col:
@@ -1092,6 +1412,42 @@ class Table(Media):
                 self.columns = self.columns[:-1]
             raise
 
+    @ensure_not_incremental
+    @allow_relogging_after_mutation
+    def add_columns(
+        self,
+        columns: dict[str, list[Any] | np.ndarray],
+        optional: bool = False,
+    ) -> None:
+        """Adds several columns of data to the table.
+
+        Equivalent to calling `add_column` for each column. Columns are added
+        in order, and if any column's data is invalid, no columns are added.
+
+        Args:
+            columns: The data of each new column, keyed by its unique name.
+            optional: If null-like values are permitted.
+        """
+        added: list[str] = []
+        try:
+            for name, data in columns.items():
+                self.add_column(name, data, optional=optional)
+                added.append(name)
+        except (AssertionError, TypeError):
+            for name in reversed(added):
+                self._remove_last_column(name)
+            raise
+
+    def _remove_last_column(self, name: str) -> None:
+        assert self.columns[-1] == name
+        if self._columnar is not None:
+            self._columnar.remove_last_column()
+        else:
+            for row in self.data:
+                row.pop()
+        self.columns.pop()
+        del self._column_types.params["type_map"][name]
+
     @overload
     def get_column(
         self,
@@ -1125,8 +1481,10 @@ class Table(Media):
             )
         col: list[Any] = []
         col_ndx = self.columns.index(name)
-        for row in self.data:
-            item = row[col_ndx]
+        if self._columnar is not None and self._columnar.is_numeric(col_ndx):
+            values = self._columnar.column(col_ndx)
+            return values.copy() if convert_to == "numpy" else values.tolist()
+        for item in self._column_values(col_ndx):
             if convert_to is not None and isinstance(item, WBValue):
                 item = item.to_data_array()
             col.append(item)
@@ -1139,7 +1497,7 @@ class Table(Media):
     def get_index(self):
         """Returns an array of row indexes for use in other tables to create links."""
         ndxs = []
-        for ndx in range(len(self.data)):
+        for ndx in range(self._nrows()):
             index = _TableIndex(ndx)
             index.set_table(self)
             ndxs.append(index)
@@ -1151,6 +1509,12 @@ class Table(Media):
             "pandas",
             required="Converting to pandas.DataFrame requires installing pandas",
         )
+        if self._columnar is not None:
+            df = pd.DataFrame(
+                {ndx: self._columnar.column(ndx) for ndx in range(len(self.columns))}
+            )
+            df.columns = self.columns
+            return df
         return pd.DataFrame.from_records(self.data, columns=self.columns)
 
     def index_ref(self, index: int) -> _TableIndex:
@@ -1158,7 +1522,7 @@ class Table(Media):
 
         <!-- lazydoc-ignore -->
         """
-        assert index < len(self.data)
+        assert index < self._nrows()
         _index = _TableIndex(index)
         _index.set_table(self)
         return _index
@@ -1493,6 +1857,67 @@ _dtypes.TypeRegistry.add(_PrimaryKeyType)
 _dtypes.TypeRegistry.add(_ForeignIndexType)
 
 
+def _load_special_columns(
+    json_obj: dict[str, Any], source_artifact: artifact.Artifact
+) -> tuple[_dtypes.Type | None, set[int], dict[int, Any]]:
+    """Read the stored column types of a serialized table.
+
+    Args:
+        json_obj: The JSON object containing table metadata.
+        source_artifact: The source artifact containing the table data.
+
+    Returns:
+        The stored column types, if any, the indices of timestamp columns,
+        and the NPZ-backed ndarray columns by index.
+    """
+    column_types: _dtypes.Type | None = None
+    np_deserialized_columns: dict[int, Any] = {}
+    timestamp_column_indices: set[int] = set()
+    if json_obj.get("column_types") is not None:
+        column_types = _dtypes.TypeRegistry.type_from_dict(
+            json_obj["column_types"], source_artifact
+        )
+        for col_name in column_types.params["type_map"]:
+            col_type = column_types.params["type_map"][col_name]
+            ndarray_type = None
+            if isinstance(col_type, _dtypes.NDArrayType):
+                ndarray_type = col_type
+            elif isinstance(col_type, _dtypes.UnionType):
+                for t in col_type.params["allowed_types"]:
+                    if isinstance(t, _dtypes.NDArrayType):
+                        ndarray_type = t
+                    elif isinstance(t, _dtypes.TimestampType):
+                        timestamp_column_indices.add(
+                            json_obj["columns"].index(col_name)
+                        )
+
+            elif isinstance(col_type, _dtypes.TimestampType):
+                timestamp_column_indices.add(json_obj["columns"].index(col_name))
+
+            if (
+                ndarray_type is not None
+                and ndarray_type._get_serialization_path() is not None
+            ):
+                serialization_path = ndarray_type._get_serialization_path()
+
+                if serialization_path is None:
+                    continue
+
+                np = util.get_module(
+                    "numpy",
+                    required="Deserializing NumPy columns requires NumPy to be installed.",
+                )
+                deserialized = np.load(
+                    source_artifact.get_entry(serialization_path["path"]).download()
+                )
+                np_deserialized_columns[json_obj["columns"].index(col_name)] = (
+                    deserialized[serialization_path["key"]]
+                )
+                ndarray_type._clear_serialization_path()
+
+    return column_types, timestamp_column_indices, np_deserialized_columns
+
+
 def _get_data_from_increments(
     json_obj: dict[str, Any], source_artifact: artifact.Artifact
 ) -> list[Any]:
@@ -1505,6 +1930,28 @@ def _get_data_from_increments(
     Returns:
         List of table rows from all increments.
     """
+    data: list[Any] = []
+    for rows in _iter_increments(json_obj, source_artifact):
+        data.extend(rows)
+    return data
+
+
+def _iter_increments(
+    json_obj: dict[str, Any], source_artifact: artifact.Artifact
+) -> Iterator[list[Any]]:
+    """Yield the rows of each increment of an incremental table, in order.
+
+    Increments are downloaded and parsed by up to
+    `_INCREMENT_MAX_WORKERS` threads, and at most `_INCREMENT_READ_AHEAD`
+    increments are held in memory ahead of the consumer.
+
+    Args:
+        json_obj: The JSON object containing table metadata.
+        source_artifact: The source artifact containing the table data.
+
+    Yields:
+        The rows of each increment.
+    """
     if "latest" not in source_artifact.aliases:
         wandb.termwarn(
             (
@@ -1513,10 +1960,8 @@ def _get_data_from_increments(
             ),
             repeat=False,
         )
-    data: list[Any] = []
-    increment_num = json_obj.get("increment_num")
-    if increment_num is None:
-        return data
+    if json_obj.get("increment_num") is None:
+        return
 
     # Sort by increment number first, then by timestamp if present
     # Format of name is: "{incr_num}-{timestamp_ms}.{key}.table.json"
@@ -1548,14 +1993,54 @@ def _get_data_from_increments(
 
     sorted_increment_keys.sort(key=get_sort_key)
 
-    for entry_key in sorted_increment_keys:
+    def load_increment(entry_key: str) -> list[Any]:
         try:
             with open(source_artifact.manifest.entries[entry_key].download()) as f:
-                table_data = json.load(f)
-            data.extend(table_data["data"])
+                return json.load(f)["data"]
         except (json.JSONDecodeError, KeyError) as e:
             raise wandb.Error(f"Invalid table file {entry_key}") from e
-    return data
+
+    if len(sorted_increment_keys) <= 1:
+        for entry_key in sorted_increment_keys:
+            yield load_increment(entry_key)
+        return
+
+    from concurrent.futures import Future, ThreadPoolExecutor
+
+    keys = iter(sorted_increment_keys)
+    pending: collections.deque[Future[list[Any]]] = collections.deque()
+    max_workers = min(len(sorted_increment_keys), _INCREMENT_MAX_WORKERS)
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        try:
+            for entry_key in itertools.islice(keys, _INCREMENT_READ_AHEAD):
+                pending.append(executor.submit(load_increment, entry_key))
+            while pending:
+                rows = pending.popleft().result()
+                for entry_key in itertools.islice(keys, 1):
+                    pending.append(executor.submit(load_increment, entry_key))
+                yield rows
+        finally:
+            # Don't download the remaining increments if the consumer stops
+            # early or an increment is invalid.
+            for future in pending:
+                future.cancel()
+
+
+# Types whose values are never media objects.
+_PLAIN_JSON_TYPES = (
+    _dtypes.NoneType,
+    _dtypes.StringType,
+    _dtypes.NumberType,
+    _dtypes.BooleanType,
+    _dtypes.TimestampType,
+)
+
+
+def _is_plain_json_type(wb_type: _dtypes.Type) -> bool:
+    """Whether a column's values are never serialized media objects."""
+    if isinstance(wb_type, _dtypes.UnionType):
+        return all(_is_plain_json_type(t) for t in wb_type.params["allowed_types"])
+    return isinstance(wb_type, _PLAIN_JSON_TYPES)
 
 
 def _process_table_row(
@@ -18,6 +18,7 @@ from wandb.sdk.mailbox import HandleAbandonedError, MailboxHandle
 from wandb.util import (
     WandBJSONEncoderOld,
     get_h5_typename,
+    json_dumps_history_scalars,
     json_dumps_safer,
     json_dumps_safer_history,
     json_friendly,
@@ -27,6 +28,7 @@ from wandb.util import (
 
 from ..data_types.utils import history_dict_to_json, val_to_json
 from . import summary_record as sr
+from .partial_history import PartialHistoryCoalescer
 
 MANIFEST_FILE_SIZE_THRESHOLD = 100_000
 
@@ -68,9 +70,11 @@ class InterfaceBase(abc.ABC):
     """
 
     _drop: bool
+    _partial_history_coalescer: PartialHistoryCoalescer | None
 
     def __init__(self) -> None:
         self._drop = False
+        self._partial_history_coalescer = None
 
     @abc.abstractmethod
     async def deliver_async(
@@ -678,9 +682,33 @@ class InterfaceBase(abc.ABC):
     def _publish_environment(self, environment: pb.EnvironmentRecord) -> None:
         raise NotImplementedError
 
-    @abc.abstractmethod
     def deliver_history_step(self) -> MailboxHandle[pb.HistoryStepResponse]:
         """Get the W&B step number of the next `log()` call."""
+        self.flush_partial_history()
+        return self._deliver_history_step()
+
+    @abc.abstractmethod
+    def _deliver_history_step(self) -> MailboxHandle[pb.HistoryStepResponse]:
+        raise NotImplementedError
+
+    def coalesce_partial_history(self, *, shared: bool) -> PartialHistoryCoalescer:
+        """Merge partial history requests that don't commit a row before sending.
+
+        Args:
+            shared: Whether the run is in shared mode, where the service
+                ignores steps in partial history requests.
+        """
+        if not self._partial_history_coalescer:
+            self._partial_history_coalescer = PartialHistoryCoalescer(
+                self._publish_partial_history,
+                shared=shared,
+            )
+        return self._partial_history_coalescer
+
+    def flush_partial_history(self) -> None:
+        """Send partial history requests held back by coalescing."""
+        if self._partial_history_coalescer:
+            self._partial_history_coalescer.flush()
 
     def publish_partial_history(
         self,
@@ -691,7 +719,6 @@ class InterfaceBase(abc.ABC):
         flush: bool | None = None,
         publish_step: bool = True,
     ) -> None:
-        data = history_dict_to_json(run, data, step=user_step, ignore_copy_err=True)
         data.pop("_step", None)
 
         # add timestamp to the history request, if not already present
@@ -699,17 +726,26 @@ class InterfaceBase(abc.ABC):
         if "_timestamp" not in data:
             data["_timestamp"] = time.time()
 
+        # Most training loops log only scalars, which don't need the
+        # media-aware conversion below and can be encoded in bulk.
+        values_json = json_dumps_history_scalars(data)
+        if values_json is None:
+            data = history_dict_to_json(run, data, step=user_step, ignore_copy_err=True)
+            values_json = [json_dumps_safer_history(v) for v in data.values()]
+
         partial_history = pb.PartialHistoryRequest()
-        for k, v in data.items():
-            item = partial_history.item.add()
-            item.key = k
-            item.value_json = json_dumps_safer_history(v)
+        for k, v in zip(data, values_json, strict=True):
+            partial_history.item.add(key=k, value_json=v)
 
         if publish_step and step is not None:
             partial_history.step.num = step
         if flush is not None:
             partial_history.action.flush = flush
-        self._publish_partial_history(partial_history)
+
+        if self._partial_history_coalescer:
+            self._partial_history_coalescer.publish(partial_history)
+        else:
+            self._publish_partial_history(partial_history)
 
     @abc.abstractmethod
     def _publish_partial_history(self, history: pb.PartialHistoryRequest) -> None:
@@ -1007,6 +1043,7 @@ class InterfaceBase(abc.ABC):
         raise NotImplementedError
 
     def deliver_get_summary(self) -> MailboxHandle[pb.Result]:
+        self.flush_partial_history()
         get_summary = pb.GetSummaryRequest()
         return self._deliver_get_summary(get_summary)
 
@@ -1028,6 +1065,9 @@ class InterfaceBase(abc.ABC):
         raise NotImplementedError
 
     def deliver_exit(self, exit_code: int | None) -> MailboxHandle[pb.Result]:
+        if self._partial_history_coalescer:
+            self._partial_history_coalescer.close()
+
         exit_data = self._make_exit(exit_code)
         return self._deliver_exit(exit_data)
 
@@ -1050,6 +1090,7 @@ class InterfaceBase(abc.ABC):
         raise NotImplementedError
 
     def deliver_request_sampled_history(self) -> MailboxHandle[pb.Result]:
+        self.flush_partial_history()
         sampled_history = pb.SampledHistoryRequest()
         return self._deliver_request_sampled_history(sampled_history)
 
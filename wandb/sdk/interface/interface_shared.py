@@ -98,7 +98,7 @@ class InterfaceShared(InterfaceBase, abc.ABC):
         self._publish(rec)
 
     @override
-    def deliver_history_step(self) -> MailboxHandle[pb.HistoryStepResponse]:
+    def _deliver_history_step(self) -> MailboxHandle[pb.HistoryStepResponse]:
         rec = pb.Record()
         rec.request.history_step.SetInParent()
         return self._deliver(rec).map(lambda r: r.response.history_step_response)
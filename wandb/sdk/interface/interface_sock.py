@@ -37,13 +37,11 @@ class InterfaceSock(InterfaceShared):
     @override
     def _publish(self, record: pb.Record, *, nowait: bool = False) -> None:
         self._assign(record)
-        request = spb.ServerRequest()
-        request.record_publish.CopyFrom(record)
 
-        if nowait:
-            self._asyncer.run_soon(lambda: self._client.publish(request))
-        else:
-            self._asyncer.run(lambda: self._client.publish(request))
+        # The record is queued rather than sent in the asyncio thread, which
+        # would block until it's written. With nowait, the call is allowed
+        # in the asyncio thread, so it must not wait for space in the queue.
+        self._client.publish_record(record, block=not nowait)
 
     @override
     def _deliver(self, record: pb.Record) -> MailboxHandle[pb.Result]:
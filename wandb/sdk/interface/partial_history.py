@@ -0,0 +1,205 @@
+"""Coalescing of partial history requests.
+
+`run.log()` sends one PartialHistoryRequest per call. Calls that don't commit
+a row, such as several `run.log(..., commit=False)` or `run.log(..., step=i)`
+calls for the same step, are only merged by the service, so they can be
+merged before they're sent instead, saving a message per call.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from collections.abc import Callable
+
+from wandb.proto import wandb_internal_pb2 as pb
+
+logger = logging.getLogger(__name__)
+
+# Bounds after which buffered values are sent even if the step is unchanged.
+_MAX_ITEMS = 1000
+_MAX_BYTES = 1024 * 1024
+_MAX_AGE_SECONDS = 1.0
+
+
+class PartialHistoryCoalescer:
+    """Merges consecutive partial history requests that don't commit a row.
+
+    Requests are buffered while they have the same step and don't flush the
+    row, with later values replacing earlier ones for the same key, as the
+    service would. The buffer is sent as one request when a request flushes
+    the row or has a different step, when it grows past `max_items` values
+    or `max_bytes` of JSON, or when it's older than `max_age` seconds.
+
+    Call `flush()` before any request that depends on the service having
+    seen every partial history request, such as the current step or exit.
+    """
+
+    def __init__(
+        self,
+        send: Callable[[pb.PartialHistoryRequest], None],
+        *,
+        shared: bool = False,
+        max_items: int = _MAX_ITEMS,
+        max_bytes: int = _MAX_BYTES,
+        max_age: float = _MAX_AGE_SECONDS,
+    ) -> None:
+        self._send = send
+        self._shared = shared
+        self._max_items = max_items
+        self._max_bytes = max_bytes
+        self._max_age = max_age
+
+        # Sending happens under the lock so that requests keep their order.
+        self._lock = threading.Lock()
+        self._wakeup = threading.Condition(self._lock)
+        self._closed = False
+        self._timer: threading.Thread | None = None
+
+        self._items: dict[tuple[str, tuple[str, ...]], pb.HistoryItem] = {}
+        self._bytes = 0
+        self._step: pb.HistoryStep | None = None
+        self._action: pb.HistoryAction | None = None
+        self._buffered_at = 0.0
+
+        self.requests_received = 0
+        self.requests_sent = 0
+
+    @property
+    def requests_saved(self) -> int:
+        """The number of requests that were merged into another request."""
+        return self.requests_received - self.requests_sent
+
+    def publish(self, request: pb.PartialHistoryRequest) -> None:
+        """Buffer or send a partial history request."""
+        with self._lock:
+            self.requests_received += 1
+            if self._closed:
+                self._send_request(request)
+                return
+
+            if self._items and not self._same_step(request):
+                self._send_buffer()
+
+            if not self._flushes(request):
+                self._merge(request)
+                if (
+                    len(self._items) >= self._max_items
+                    or self._bytes >= self._max_bytes
+                    or time.monotonic() - self._buffered_at >= self._max_age
+                ):
+                    self._send_buffer()
+            elif self._items:
+                self._merge(request)
+                self._send_buffer()
+            else:
+                self._send_request(request)
+
+    def flush(self) -> None:
+        """Send any buffered values."""
+        with self._lock:
+            self._send_buffer()
+
+    def close(self) -> None:
+        """Send any buffered values and stop the age timer."""
+        with self._lock:
+            self._send_buffer()
+            self._closed = True
+            self._wakeup.notify()
+
+        if self._timer and self._timer is not threading.current_thread():
+            self._timer.join()
+
+        logger.info(
+            "Coalesced %d partial history requests into %d.",
+            self.requests_received,
+            self.requests_sent,
+        )
+
+    def _flushes(self, request: pb.PartialHistoryRequest) -> bool:
+        """Whether the service commits the row upon receiving the request."""
+        if request.HasField("action"):
+            return request.action.flush
+
+        # Without an explicit action, a request with a step only sets values
+        # for that step, except in shared mode where steps are ignored.
+        return self._shared or not request.HasField("step")
+
+    def _same_step(self, request: pb.PartialHistoryRequest) -> bool:
+        if self._shared:
+            return True
+        if self._step is None:
+            return not request.HasField("step")
+        return request.HasField("step") and request.step.num == self._step.num
+
+    def _merge(self, request: pb.PartialHistoryRequest) -> None:
+        if not self._items:
+            self._buffered_at = time.monotonic()
+            self._start_timer()
+            self._wakeup.notify()
+
+        for item in request.item:
+            key = (item.key, tuple(item.nested_key))
+            old = self._items.get(key)
+            if old is not None:
+                self._bytes -= len(old.value_json)
+            self._items[key] = item
+            self._bytes += len(item.value_json)
+
+        self._step = request.step if request.HasField("step") else None
+        self._action = request.action if request.HasField("action") else None
+
+    def _send_buffer(self) -> None:
+        if not self._items:
+            return
+
+        request = pb.PartialHistoryRequest()
+        request.item.extend(self._items.values())
+        if self._step is not None:
+            request.step.CopyFrom(self._step)
+        if self._action is not None:
+            request.action.CopyFrom(self._action)
+
+        self._items = {}
+        self._bytes = 0
+        self._step = None
+        self._action = None
+        self._send_request(request)
+
+    def _send_request(self, request: pb.PartialHistoryRequest) -> None:
+        self.requests_sent += 1
+        self._send(request)
+
+    def _start_timer(self) -> None:
+        if self._timer or self._closed:
+            return
+
+        self._timer = threading.Thread(
+            target=self._send_old_buffers,
+            name="PartialHistoryCoalescer",
+            daemon=True,
+        )
+        self._timer.start()
+
+    def _send_old_buffers(self) -> None:
+        """Send buffered values once they're `max_age` seconds old.
+
+        Without this, values logged for a step would wait for the next
+        `run.log()` call, which may be much later.
+        """
+        with self._lock:
+            while not self._closed:
+                if not self._items:
+                    self._wakeup.wait()
+                    continue
+
+                remaining = self._buffered_at + self._max_age - time.monotonic()
+                if remaining > 0:
+                    self._wakeup.wait(remaining)
+                    continue
+
+                try:
+                    self._send_buffer()
+                except Exception:
+                    logger.exception("Failed to send partial history.")
@@ -18,11 +18,14 @@ header :=
 
 from __future__ import annotations
 
+import functools
 import logging
+import mmap
 import os
 import struct
 import zlib
-from typing import TYPE_CHECKING
+from collections.abc import Iterator
+from typing import TYPE_CHECKING, NamedTuple
 
 if TYPE_CHECKING:
     from typing import IO, Any
@@ -57,6 +60,19 @@ except Exception:
     strtobytes = str
 
 
+def _check_header(header: bytes) -> None:
+    assert len(header) == LEVELDBLOG_HEADER_LEN, (
+        f"header is {len(header)} bytes instead of the expected {LEVELDBLOG_HEADER_LEN}"
+    )
+    ident, magic, version = struct.unpack("<4sHB", header)
+    if ident != strtobytes(LEVELDBLOG_HEADER_IDENT):
+        raise Exception("Invalid header")
+    if magic != LEVELDBLOG_HEADER_MAGIC:
+        raise Exception("Invalid header")
+    if version != LEVELDBLOG_HEADER_VERSION:
+        raise Exception("Invalid header")
+
+
 class DataStore:
     _index: int
     _flush_offset: int
@@ -151,20 +167,19 @@ class DataStore:
         assert dtype == LEVELDBLOG_FIRST, (
             f"expected record to be type {LEVELDBLOG_FIRST} but found {dtype}"
         )
+        fragments = [data]
         while True:
-            offset = self._index % LEVELDBLOG_BLOCK_LEN
             record = self.scan_record()
             if record is None:  # eof
                 return None
             dtype, new_data = record
+            fragments.append(new_data)
             if dtype == LEVELDBLOG_LAST:
-                data += new_data
                 break
             assert dtype == LEVELDBLOG_MIDDLE, (
                 f"expected record to be type {LEVELDBLOG_MIDDLE} but found {dtype}"
             )
-            data += new_data
-        return data
+        return b"".join(fragments)
 
     def _write_header(self):
         data = struct.pack(
@@ -181,16 +196,7 @@ class DataStore:
 
     def _read_header(self):
         header = self._fp.read(LEVELDBLOG_HEADER_LEN)
-        assert len(header) == LEVELDBLOG_HEADER_LEN, (
-            f"header is {len(header)} bytes instead of the expected {LEVELDBLOG_HEADER_LEN}"
-        )
-        ident, magic, version = struct.unpack("<4sHB", header)
-        if ident != strtobytes(LEVELDBLOG_HEADER_IDENT):
-            raise Exception("Invalid header")
-        if magic != LEVELDBLOG_HEADER_MAGIC:
-            raise Exception("Invalid header")
-        if version != LEVELDBLOG_HEADER_VERSION:
-            raise Exception("Invalid header")
+        _check_header(header)
         self._index += len(header)
 
     def _write_record(self, s, dtype=None):
@@ -281,3 +287,206 @@ class DataStore:
         if self._fp is not None:
             logger.info("close: %s", self._fname)
             self._fp.close()
+
+
+_RECORD_HEADER = struct.Struct("<IHB")
+
+
+class RecordIndexEntry(NamedTuple):
+    """The location of a record in a transaction log."""
+
+    offset: int
+    """The offset at which to scan the record."""
+
+    record_type: str | None
+    """The name of the record's `record_type` field, if set."""
+
+
+class MmapDataStore:
+    """Scans a transaction log through a memory map.
+
+    Unlike `DataStore`, reads no data into memory up front: a record stored
+    in a single block is returned as a memoryview into the map, and a record
+    split across blocks is copied once when its fragments are joined.
+
+    The file must not be written to while it is scanned. Returned memoryviews
+    are valid until the store is closed.
+    """
+
+    def __init__(self) -> None:
+        self._mm: mmap.mmap | None = None
+        self._view = memoryview(b"")
+        self._index = 0
+        self._size_bytes = 0
+
+        self._crc = [0] * (LEVELDBLOG_LAST + 1)
+        for x in range(1, LEVELDBLOG_LAST + 1):
+            self._crc[x] = zlib.crc32(strtobytes(chr(x))) & 0xFFFFFFFF
+
+    def open_for_scan(self, fname: str) -> None:
+        self._fname = fname
+        logger.info("open for scan: %s", fname)
+        with open(fname, "rb") as fp:
+            self._size_bytes = os.fstat(fp.fileno()).st_size
+            # Empty files can't be mapped.
+            if self._size_bytes < LEVELDBLOG_HEADER_LEN:
+                _check_header(fp.read())
+            self._mm = mmap.mmap(fp.fileno(), 0, access=mmap.ACCESS_READ)
+        self._view = memoryview(self._mm)
+
+        _check_header(self._view[:LEVELDBLOG_HEADER_LEN].tobytes())
+        self._index = LEVELDBLOG_HEADER_LEN
+
+    def seek(self, offset: int) -> None:
+        self._index = offset
+
+    def get_offset(self) -> int:
+        return self._index
+
+    def in_last_block(self) -> bool:
+        """Determine if we're in the last block to handle in-progress writes."""
+        return self._index > self._size_bytes - LEVELDBLOG_DATA_LEN
+
+    def scan_record(self) -> tuple[int, memoryview] | None:
+        if self._index >= self._size_bytes:
+            return None
+        header_end = self._index + LEVELDBLOG_HEADER_LEN
+        assert header_end <= self._size_bytes, (
+            f"record header is {self._size_bytes - self._index} bytes instead of the expected {LEVELDBLOG_HEADER_LEN}"
+        )
+        checksum, dlength, dtype = _RECORD_HEADER.unpack_from(self._view, self._index)
+        data = self._view[header_end : header_end + dlength]
+        checksum_computed = zlib.crc32(data, self._crc[dtype]) & 0xFFFFFFFF
+        assert checksum == checksum_computed, (
+            "record checksum is invalid, data may be corrupt"
+        )
+        self._index = header_end + dlength
+        return dtype, data
+
+    def scan_data(self) -> memoryview | bytes | None:
+        """Scan the next record's data.
+
+        Returns:
+            The data, or None at the end of the file.
+        """
+        offset = self._index % LEVELDBLOG_BLOCK_LEN
+        space_left = LEVELDBLOG_BLOCK_LEN - offset
+        if space_left < LEVELDBLOG_HEADER_LEN:
+            pad = self._view[self._index : self._index + space_left]
+            assert pad == bytes(space_left), "invalid padding"
+            self._index += space_left
+
+        record = self.scan_record()
+        if record is None:  # eof
+            return None
+        dtype, data = record
+        if dtype == LEVELDBLOG_FULL:
+            return data
+
+        assert dtype == LEVELDBLOG_FIRST, (
+            f"expected record to be type {LEVELDBLOG_FIRST} but found {dtype}"
+        )
+        fragments = [data]
+        while True:
+            record = self.scan_record()
+            if record is None:  # eof
+                return None
+            dtype, data = record
+            fragments.append(data)
+            if dtype == LEVELDBLOG_LAST:
+                break
+            assert dtype == LEVELDBLOG_MIDDLE, (
+                f"expected record to be type {LEVELDBLOG_MIDDLE} but found {dtype}"
+            )
+        return b"".join(fragments)
+
+    def __iter__(self) -> Iterator[memoryview | bytes]:
+        """Scan the remaining records' data."""
+        while (data := self.scan_data()) is not None:
+            yield data
+
+    def read_at(self, offset: int) -> memoryview | bytes | None:
+        """Scan the data of the record at an offset from `build_index`."""
+        self.seek(offset)
+        return self.scan_data()
+
+    def build_index(self) -> list[RecordIndexEntry]:
+        """Index the offset and type of every record in the file.
+
+        Record types are read from the serialized records without parsing
+        them. Scanning continues from the start of the file afterward.
+        """
+        self.seek(LEVELDBLOG_HEADER_LEN)
+        index = []
+        while True:
+            offset = self._index
+            data = self.scan_data()
+            if data is None:
+                break
+            index.append(RecordIndexEntry(offset, peek_record_type(data)))
+        self.seek(LEVELDBLOG_HEADER_LEN)
+        return index
+
+    def close(self) -> None:
+        if self._mm is None:
+            return
+        logger.info("close: %s", self._fname)
+        self._view.release()
+        try:
+            self._mm.close()
+        except BufferError:
+            # Memoryviews of records are still in use; the map is closed
+            # once they are garbage collected.
+            pass
+        self._mm = None
+
+
+@functools.cache
+def _record_type_fields() -> dict[int, str]:
+    from wandb.proto.wandb_internal_pb2 import Record
+
+    oneof = Record.DESCRIPTOR.oneofs_by_name["record_type"]
+    return {field.number: field.name for field in oneof.fields}
+
+
+def _read_varint(data: memoryview | bytes, pos: int) -> tuple[int, int]:
+    value = 0
+    shift = 0
+    while True:
+        byte = data[pos]
+        pos += 1
+        value |= (byte & 0x7F) << shift
+        if not byte & 0x80:
+            return value, pos
+        shift += 7
+
+
+def peek_record_type(data: memoryview | bytes) -> str | None:
+    """Return the name of the `record_type` field set in a serialized Record.
+
+    Only reads the record's top-level field tags and skips over the values
+    of other fields, so the record is not parsed.
+    """
+    fields = _record_type_fields()
+    pos = 0
+    try:
+        while pos < len(data):
+            tag, pos = _read_varint(data, pos)
+            field_number, wire_type = tag >> 3, tag & 0x7
+            if field_number in fields:
+                return fields[field_number]
+
+            if wire_type == 0:  # varint
+                _, pos = _read_varint(data, pos)
+            elif wire_type == 1:  # 64-bit
+                pos += 8
+            elif wire_type == 2:  # length-delimited
+                length, pos = _read_varint(data, pos)
+                pos += length
+            elif wire_type == 5:  # 32-bit
+                pos += 4
+            else:
+                return None
+    except IndexError:
+        pass
+    return None
@@ -305,6 +305,9 @@ class FileStreamApi:
         artifact_id: str
         save_name: str
 
+    class Flush(NamedTuple):
+        callback: Callable[[], None]
+
     MAX_ITEMS_PER_PUSH = 10000
 
     def __init__(
@@ -409,10 +412,13 @@ class FileStreamApi:
         uploaded: set[str] = set()
         finished: FileStreamApi.Finish | None = None
         while finished is None:
+            flushes: list[FileStreamApi.Flush] = []
             items = self._read_queue()
             for item in items:
                 if isinstance(item, self.Finish):
                     finished = item
+                elif isinstance(item, self.Flush):
+                    flushes.append(item)
                 elif isinstance(item, self.Preempting):
                     request_with_retry(
                         self._client.post,
@@ -434,7 +440,9 @@ class FileStreamApi:
             cur_time = time.time()
 
             if ready_chunks and (
-                finished or cur_time - posted_data_time > self.rate_limit_seconds()
+                finished
+                or flushes
+                or cur_time - posted_data_time > self.rate_limit_seconds()
             ):
                 posted_data_time = cur_time
                 posted_anything_time = cur_time
@@ -443,6 +451,13 @@ class FileStreamApi:
                 if success:
                     uploaded = set()
 
+            # Everything pushed before a flush has now been posted. Dropped
+            # chunks are lost for good, so flushes are only confirmed if none
+            # were ever dropped.
+            if self._dropped_chunks == 0:
+                for flush in flushes:
+                    flush.callback()
+
             # If there aren't ready chunks or uploaded files, we still want to
             # send regular heartbeats so the backend doesn't erroneously mark this
             # run as crashed.
@@ -579,6 +594,16 @@ class FileStreamApi:
         """
         self._queue.put(self.PushSuccess(artifact_id, save_name))
 
+    def flush(self, callback: Callable[[], None]) -> None:
+        """Post all pushed chunks now, and confirm once they were received.
+
+        Args:
+            callback: Called from the file stream thread once every chunk
+                pushed before this call was posted. It's not called if any
+                chunk was dropped.
+        """
+        self._queue.put(self.Flush(callback))
+
     def finish(self, exitcode: int) -> None:
         """Clean up.
 
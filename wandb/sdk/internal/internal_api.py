@@ -770,6 +770,7 @@ class Api:
         specs: str,
         project: str | None = None,
         entity: str | None = None,
+        include_runs: bool = True,
     ) -> dict[str, Any]:
         """Retrieve sweep.
 
@@ -778,12 +779,19 @@ class Api:
             specs (str): history specs
             project (str, optional): The project to scope this sweep to.
             entity (str, optional): The entity to scope this sweep to.
+            include_runs (bool, optional): Whether to retrieve the sweep's runs.
 
         Returns:
                 [{"id","name","repo","dockerImage","description"}]
         """
         query = """
-        query SweepWithRuns($entity: String, $project: String, $sweep: String!, $specs: [JSONString!]!) {
+        query SweepWithRuns(
+            $entity: String,
+            $project: String,
+            $sweep: String!,
+            $specs: [JSONString!]!,
+            $includeRuns: Boolean!,
+        ) {
             project(name: $project, entityName: $entity) {
                 sweep(sweepName: $sweep) {
                     id
@@ -799,7 +807,7 @@ class Api:
                     bestLoss
                     controller
                     scheduler
-                    runs {
+                    runs @include(if: $includeRuns) {
                         edges {
                             node {
                                 name
@@ -829,15 +837,151 @@ class Api:
                 "project": project,
                 "sweep": sweep,
                 "specs": specs,
+                "includeRuns": include_runs,
             },
         )
         if response["project"] is None or response["project"]["sweep"] is None:
             raise ValueError(f"Sweep {entity}/{project}/{sweep} not found")
         data: dict[str, Any] = response["project"]["sweep"]
-        if data:
+        if data and include_runs:
             data["runs"] = self._flatten_edges(data["runs"])
         return data
 
+    @normalize_exceptions
+    def sweep_runs(
+        self,
+        sweep: str,
+        updated_since: str | None = None,
+        project: str | None = None,
+        entity: str | None = None,
+        per_page: int = 200,
+    ) -> list[dict[str, Any]]:
+        """Retrieve the runs of a sweep, without their history.
+
+        Args:
+            sweep (str): The sweep to get runs for
+            updated_since (str, optional): Only retrieve runs updated at or after
+                this time, as returned in a run's `updatedAt` field.
+            project (str, optional): The project to scope this sweep to.
+            entity (str, optional): The entity to scope this sweep to.
+            per_page (int, optional): The number of runs to retrieve per request.
+
+        Returns:
+                [{"name","state","config","summaryMetrics","updatedAt",...}]
+        """
+        query = """
+        query SweepRuns(
+            $entity: String,
+            $project: String!,
+            $filters: JSONString,
+            $cursor: String,
+            $perPage: Int,
+        ) {
+            project(name: $project, entityName: $entity) {
+                runs(filters: $filters, after: $cursor, first: $perPage) {
+                    pageInfo {
+                        hasNextPage
+                        endCursor
+                    }
+                    edges {
+                        node {
+                            name
+                            state
+                            config
+                            exitcode
+                            heartbeatAt
+                            updatedAt
+                            shouldStop
+                            failed
+                            stopped
+                            running
+                            summaryMetrics
+                        }
+                    }
+                }
+            }
+        }
+        """
+        filters: dict[str, Any] = {"sweep": sweep}
+        if updated_since is not None:
+            filters["updatedAt"] = {"$gte": updated_since}
+        variables: dict[str, Any] = {
+            "entity": entity or self.settings("entity"),
+            "project": project or self.settings("project"),
+            "filters": json.dumps(filters),
+            "cursor": None,
+            "perPage": per_page,
+        }
+
+        runs: list[dict[str, Any]] = []
+        while True:
+            response = self.execute(query, variables=variables)
+            if response["project"] is None:
+                raise ValueError(
+                    f"Project {variables['entity']}/{variables['project']} not found"
+                )
+            page = response["project"]["runs"]
+            runs.extend(self._flatten_edges(page))
+            if not page["pageInfo"]["hasNextPage"]:
+                return runs
+            variables["cursor"] = page["pageInfo"]["endCursor"]
+
+    @normalize_exceptions
+    def runs_sampled_history(
+        self,
+        runs: list[str],
+        specs: str,
+        project: str | None = None,
+        entity: str | None = None,
+        batch_size: int = 50,
+    ) -> dict[str, list[Any]]:
+        """Retrieve the sampled history of several runs.
+
+        Args:
+            runs (list[str]): The names of the runs
+            specs (str): history specs
+            project (str, optional): The project the runs belong to.
+            entity (str, optional): The entity the project belongs to.
+            batch_size (int, optional): The number of runs to query at once.
+
+        Returns:
+                A mapping from run name to the run's `sampledHistory`.
+        """
+        histories: dict[str, list[Any]] = {}
+        for start in range(0, len(runs), batch_size):
+            batch = runs[start : start + batch_size]
+            variables: dict[str, Any] = {
+                "entity": entity or self.settings("entity"),
+                "project": project or self.settings("project"),
+                "specs": specs,
+            }
+            variable_defs = ["$entity: String", "$project: String!"]
+            variable_defs.append("$specs: [JSONString!]!")
+            run_fields = []
+            for i, name in enumerate(batch):
+                variables[f"name{i}"] = name
+                variable_defs.append(f"$name{i}: String!")
+                run_fields.append(
+                    f"run{i}: run(name: $name{i}) {{ sampledHistory(specs: $specs) }}"
+                )
+
+            query = """
+            query RunsSampledHistory({}) {{
+                project(name: $project, entityName: $entity) {{
+                    {}
+                }}
+            }}
+            """.format(
+                ", ".join(variable_defs), "\n                    ".join(run_fields)
+            )
+
+            response = self.execute(query, variables=variables)
+            project_obj = response["project"] or {}
+            for i, name in enumerate(batch):
+                run_obj = project_obj.get(f"run{i}") or {}
+                histories[name] = run_obj.get("sampledHistory") or []
+        return histories
+
     @normalize_exceptions
     def list_runs(
         self, project: str, entity: str | None = None
@@ -1936,6 +2080,72 @@ class Api:
         run_state: str = res["project"]["run"]["state"]
         return run_state
 
+    @normalize_exceptions
+    def get_run_states(
+        self,
+        entity: str,
+        project: str,
+        names: list[str],
+        per_page: int = 200,
+    ) -> dict[str, dict[str, Any]]:
+        """Retrieve the state and summary of many runs at once.
+
+        Args:
+            entity (str): The entity of the runs
+            project (str): The project of the runs
+            names (list): The names of the runs
+            per_page (int, optional): The number of runs to retrieve per request.
+
+        Returns:
+            {name: {"state","summaryMetrics"}} for each run that was found.
+        """
+        query = """
+        query RunStates(
+            $entity: String!,
+            $project: String!,
+            $filters: JSONString,
+            $cursor: String,
+            $perPage: Int,
+        ) {
+            project(name: $project, entityName: $entity) {
+                runs(filters: $filters, after: $cursor, first: $perPage) {
+                    pageInfo {
+                        hasNextPage
+                        endCursor
+                    }
+                    edges {
+                        node {
+                            name
+                            state
+                            summaryMetrics
+                        }
+                    }
+                }
+            }
+        }
+        """
+        runs: dict[str, dict[str, Any]] = {}
+        if not names:
+            return runs
+
+        variables: dict[str, Any] = {
+            "entity": entity,
+            "project": project,
+            "filters": json.dumps({"name": {"$in": names}}),
+            "cursor": None,
+            "perPage": per_page,
+        }
+        while True:
+            res = self.execute(query, variables)
+            if res.get("project") is None:
+                raise CommError(f"Error fetching run states for {entity}/{project}.")
+            page = res["project"]["runs"]
+            for run in self._flatten_edges(page):
+                runs[run.pop("name")] = run
+            if not page["pageInfo"]["hasNextPage"]:
+                return runs
+            variables["cursor"] = page["pageInfo"]["endCursor"]
+
     @normalize_exceptions
     def upload_urls(
         self,
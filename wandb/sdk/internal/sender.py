@@ -13,7 +13,7 @@ import threading
 import time
 import traceback
 from collections import defaultdict
-from collections.abc import Generator
+from collections.abc import Callable, Generator
 from datetime import datetime
 from queue import Queue
 from typing import TYPE_CHECKING, Any, Literal
@@ -339,6 +339,11 @@ class SendManager:
     def __len__(self) -> int:
         return self._record_q.qsize()
 
+    @property
+    def resume_step(self) -> int:
+        """The first history step the resumed run doesn't have yet."""
+        return self._resume_state.step
+
     def __enter__(self) -> SendManager:
         return self
 
@@ -382,6 +387,15 @@ class SendManager:
         if self._fs:
             self._fs.enqueue_preempting()
 
+    def flush_file_stream(self, callback: Callable[[], None]) -> None:
+        """Call back once everything sent so far was received by the file stream.
+
+        The callback is never called if streamed data was lost, or if console
+        output is waiting for the end of its line.
+        """
+        if self._fs and not any(self._partial_output.values()):
+            self._fs.flush(callback)
+
     def send_request_sender_mark(self, _: Record) -> None:
         self._maybe_report_status(always=True)
 
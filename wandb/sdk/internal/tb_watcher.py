@@ -12,14 +12,18 @@ import threading
 import time
 from typing import TYPE_CHECKING, Any
 
+from google.protobuf.message import DecodeError
+
 import wandb
 from wandb import util
 from wandb.plot import CustomChart
 from wandb.sdk.lib import filesystem
 
 from . import run as internal_run
+from .tfevents_reader import TFEventsDirTailer
 
 if TYPE_CHECKING:
+    from collections.abc import Iterator
     from queue import PriorityQueue
 
     from tensorboard.backend.event_processing.event_file_loader import EventFileLoader
@@ -37,6 +41,8 @@ if TYPE_CHECKING:
 SHUTDOWN_DELAY = 5
 ERROR_DELAY = 5
 REMOTE_FILE_TOKEN = "://"
+# The most queued events TBEventConsumer handles before publishing history.
+MAX_EVENT_BATCH = 1000
 logger = logging.getLogger(__name__)
 
 
@@ -208,9 +214,31 @@ class TBDirWatcher:
             "tensorboard.compat", required="Please install tensorboard package"
         )
         self._tbwatcher = tbwatcher
-        self._generator = self.directory_watcher.DirectoryWatcher(
-            logdir, self._loader(save, namespace), self._is_our_tfevents_file
-        )
+        self._save = save
+        # Local directories are tailed by byte offset; remote ones are read
+        # through tensorboard's filesystem support.
+        self._tailer: TFEventsDirTailer | None = None
+        if REMOTE_FILE_TOKEN in logdir:
+            self._generator = self.directory_watcher.DirectoryWatcher(
+                logdir, self._loader(save, namespace), self._is_our_tfevents_file
+            )
+        else:
+            self._event_pb2 = util.get_module(
+                "tensorboard.compat.proto.event_pb2",
+                required="Please install tensorboard package",
+            )
+            # The compat layers tensorboard's EventFileLoader applies.
+            self._data_compat = util.get_module(
+                "tensorboard.data_compat",
+                required="Please install tensorboard package",
+            )
+            self._dataclass_compat = util.get_module(
+                "tensorboard.dataclass_compat",
+                required="Please install tensorboard package",
+            )
+            # The metadata of each tag's first event, per file.
+            self._initial_metadata: dict[str, dict[str, Any]] = {}
+            self._tailer = TFEventsDirTailer(logdir, self._is_our_tfevents_file)
         self._thread = threading.Thread(target=self._thread_except_body)
         self._first_event_timestamp = None
         self._shutdown = threading.Event()
@@ -237,12 +265,29 @@ class TBDirWatcher:
                 path, self._hostname, self._tbwatcher._settings.x_start_time
             )
 
+    def _save_file(self, file_path: str, namespace: str | None) -> None:
+        if REMOTE_FILE_TOKEN in file_path:
+            logger.warning("Not persisting remote tfevent file: %s", file_path)
+            return
+
+        # TODO: save plugins?
+        logdir = os.path.dirname(file_path)
+        parts = list(os.path.split(logdir))
+        if namespace and parts[-1] == namespace:
+            parts.pop()
+            logdir = os.path.join(*parts)
+        _link_and_save_file(
+            path=file_path,
+            base_path=logdir,
+            interface=self._tbwatcher._interface,
+            settings=self._tbwatcher._settings,
+        )
+
     def _loader(
         self, save: bool = True, namespace: str | None = None
     ) -> EventFileLoader:
         """Incredibly hacky class generator to optionally save / prefix tfevent files."""
-        _loader_interface = self._tbwatcher._interface
-        _loader_settings = self._tbwatcher._settings
+        save_file = self._save_file
         try:
             from tensorboard.backend.event_processing import event_file_loader
         except ImportError:
@@ -252,29 +297,47 @@ class TBDirWatcher:
             def __init__(self, file_path: str) -> None:
                 super().__init__(file_path)
                 if save:
-                    if REMOTE_FILE_TOKEN in file_path:
-                        logger.warning(
-                            "Not persisting remote tfevent file: %s", file_path
-                        )
-                    else:
-                        # TODO: save plugins?
-                        logdir = os.path.dirname(file_path)
-                        parts = list(os.path.split(logdir))
-                        if namespace and parts[-1] == namespace:
-                            parts.pop()
-                            logdir = os.path.join(*parts)
-                        _link_and_save_file(
-                            path=file_path,
-                            base_path=logdir,
-                            interface=_loader_interface,
-                            settings=_loader_settings,
-                        )
+                    save_file(file_path, namespace)
+
+            def Load(self) -> Iterator[ProtoEvent]:  # noqa: N802
+                for event in super().Load():
+                    _add_initial_metadata(event, self._initial_metadata)
+                    yield event
 
         return EventFileLoader
 
+    def _tail_events(self) -> None:
+        """Process the events appended to local tfevents files."""
+        assert self._tailer
+        for path in self._tailer.scan():
+            if self._save:
+                self._save_file(path, self._namespace)
+
+        # Events are migrated as in tensorboard's EventFileLoader, so legacy
+        # histogram and image summaries become tensor summaries.
+        parse_event = self._event_pb2.Event.FromString
+        while files := self._tailer.read_records_by_file():
+            for path, records in files:
+                initial_metadata = self._initial_metadata.setdefault(path, {})
+                for record in records:
+                    try:
+                        event = parse_event(record)
+                    except DecodeError:
+                        logger.warning("Skipping corrupt tfevents record")
+                        continue
+                    event = self._data_compat.migrate_event(event)
+                    for migrated in self._dataclass_compat.migrate_event(
+                        event, initial_metadata
+                    ):
+                        _add_initial_metadata(migrated, initial_metadata)
+                        self.process_event(migrated)
+
     def _process_events(self, shutdown_call: bool = False) -> None:
         try:
             with self._process_events_lock:
+                if self._tailer:
+                    self._tail_events()
+                    return
                 for event in self._generator.Load():
                     self.process_event(event)
         except (
@@ -328,6 +391,21 @@ class TBDirWatcher:
         self._thread.join()
 
 
+def _add_initial_metadata(event: ProtoEvent, initial_metadata: dict) -> None:
+    """Add each tag's plugin metadata to the summary values that lack it.
+
+    TF2 only writes the metadata on a tag's first event, but the plugin name
+    determines how each value is logged.
+    """
+    if not event.HasField("summary"):
+        return
+    for value in event.summary.value:
+        if not value.HasField("metadata") and value.tag in initial_metadata:
+            value.metadata.plugin_data.CopyFrom(
+                initial_metadata[value.tag].plugin_data
+            )
+
+
 class Event:
     """An event wrapper to enable priority queueing."""
 
@@ -382,15 +460,8 @@ class TBEventConsumer:
         self._delay = 0
         self._shutdown.set()
         self._thread.join()
-        while not self._queue.empty():
-            event = self._queue.get(True, 1)
-            if event:
-                self._handle_event(event, history=self.tb_history)
-                items = self.tb_history._get_and_reset()
-                for item in items:
-                    self._save_row(
-                        item,
-                    )
+        while events := self._get_queued_events():
+            self._handle_events(events)
 
     def _thread_except_body(self) -> None:
         try:
@@ -400,32 +471,42 @@ class TBEventConsumer:
             raise
 
     def _thread_body(self) -> None:
+        # Wait self._delay seconds from consumer start before logging events
+        self._shutdown.wait(max(0, self._start_time + self._delay - time.time()))
+
         while True:
             try:
                 event = self._queue.get(True, 1)
-                # Wait self._delay seconds from consumer start before logging events
-                if (
-                    time.time() < self._start_time + self._delay
-                    and not self._shutdown.is_set()
-                ):
-                    self._queue.put(event)
-                    time.sleep(0.1)
-                    continue
             except queue.Empty:
-                event = None
                 if self._shutdown.is_set():
                     break
-            if event:
-                self._handle_event(event, history=self.tb_history)
-                items = self.tb_history._get_and_reset()
-                for item in items:
-                    self._save_row(
-                        item,
-                    )
+                continue
+            self._handle_events([event, *self._get_queued_events()])
         # flush uncommitted data
         self.tb_history._flush()
-        items = self.tb_history._get_and_reset()
-        for item in items:
+        self._save_rows()
+
+    def _get_queued_events(self) -> list[Event]:
+        """Take up to MAX_EVENT_BATCH events from the queue without blocking."""
+        events = []
+        while len(events) < MAX_EVENT_BATCH:
+            try:
+                events.append(self._queue.get_nowait())
+            except queue.Empty:
+                break
+        return events
+
+    def _handle_events(self, events: list[Event]) -> None:
+        """Log a batch of events, then publish the history rows they completed.
+
+        Events for the same step are merged into a single row by `TBHistory`.
+        """
+        for event in events:
+            self._handle_event(event, history=self.tb_history)
+        self._save_rows()
+
+    def _save_rows(self) -> None:
+        for item in self.tb_history._get_and_reset():
             self._save_row(item)
 
     def _handle_event(
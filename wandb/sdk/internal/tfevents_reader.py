@@ -0,0 +1,201 @@
+"""Incremental reading of tfevents files.
+
+A tfevents file is a sequence of TFRecords, each laid out as:
+
+    length: uint64       // little-endian
+    length_crc: uint32   // masked crc32c of length
+    data: bytes[length]  // a serialized Event proto
+    data_crc: uint32     // masked crc32c of data
+
+Files are read from the offset where the previous read stopped, so each
+byte is read once no matter how often a file is polled.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import struct
+import time
+from collections.abc import Callable
+
+logger = logging.getLogger(__name__)
+
+_HEADER = struct.Struct("<QI")
+_FOOTER_SIZE = 4
+
+# The most bytes to read from a file at once, unless a single record is larger.
+_MAX_READ_BYTES = 16 * 1024 * 1024
+
+# A directory modified this recently is listed even if its modification time
+# is unchanged, since a file may have been added within the same clock tick
+# as the previous listing.
+_MTIME_SETTLE_NS = 2 * 1_000_000_000
+
+
+def _make_crc32c_table() -> list[int]:
+    table = []
+    for i in range(256):
+        crc = i
+        for _ in range(8):
+            crc = (crc >> 1) ^ 0x82F63B78 if crc & 1 else crc >> 1
+        table.append(crc)
+    return table
+
+
+_CRC32C_TABLE = _make_crc32c_table()
+
+
+def masked_crc32c(data: bytes) -> int:
+    """Compute the masked CRC-32C checksum that TFRecords use."""
+    crc = 0xFFFFFFFF
+    for byte in data:
+        crc = _CRC32C_TABLE[(crc ^ byte) & 0xFF] ^ (crc >> 8)
+    crc ^= 0xFFFFFFFF
+    return (((crc >> 15) | (crc << 17)) + 0xA282EAD8) & 0xFFFFFFFF
+
+
+class TFRecordTailer:
+    """Reads the records appended to a TFRecord file since the last read.
+
+    Only the checksum of each record's length is verified, which is enough
+    to detect a misframed or corrupt file. Computing the checksum of every
+    record's data in Python would cost more than decoding it.
+    """
+
+    def __init__(self, path: str, *, max_read_bytes: int = _MAX_READ_BYTES) -> None:
+        self.path = path
+        self.offset = 0
+        self.corrupt = False
+        self._max_read_bytes = max(max_read_bytes, _HEADER.size)
+
+    def read_records(self) -> list[bytes]:
+        """Return complete records written since the last call.
+
+        A record that is still being written is returned by a later call.
+        At most about `max_read_bytes` of records are returned at once; call
+        again until the result is empty to read everything available.
+        """
+        if self.corrupt:
+            return []
+
+        try:
+            available = os.stat(self.path).st_size - self.offset
+            if available < _HEADER.size:
+                return []
+
+            with open(self.path, "rb") as f:
+                f.seek(self.offset)
+                buf = f.read(min(available, self._max_read_bytes))
+                records, consumed = self._parse(buf)
+
+                if not records and not self.corrupt:
+                    # The first record may be larger than a single read.
+                    length, _ = _HEADER.unpack_from(buf)
+                    record_size = _HEADER.size + length + _FOOTER_SIZE
+                    if len(buf) < record_size <= available:
+                        buf += f.read(record_size - len(buf))
+                        records, consumed = self._parse(buf)
+        except OSError as e:
+            logger.debug("Failed to read tfevents file %s: %s", self.path, e)
+            return []
+
+        self.offset += consumed
+        return records
+
+    def _parse(self, buf: bytes) -> tuple[list[bytes], int]:
+        """Split a buffer into records.
+
+        Returns the records and the number of bytes they occupy.
+        """
+        records = []
+        pos = 0
+        while pos + _HEADER.size <= len(buf):
+            length, length_crc = _HEADER.unpack_from(buf, pos)
+            if masked_crc32c(buf[pos : pos + 8]) != length_crc:
+                logger.warning(
+                    "Corrupt record in %s at offset %d, ignoring the rest of the file",
+                    self.path,
+                    self.offset + pos,
+                )
+                self.corrupt = True
+                break
+
+            start = pos + _HEADER.size
+            end = start + length + _FOOTER_SIZE
+            if end > len(buf):
+                break
+            records.append(buf[start : start + length])
+            pos = end
+        return records, pos
+
+
+class TFEventsDirTailer:
+    """Reads the records appended to the tfevents files in a directory.
+
+    The directory is only listed again when its modification time changes,
+    and files are only read when they have grown.
+    """
+
+    def __init__(self, logdir: str, path_filter: Callable[[str], bool]) -> None:
+        self.logdir = logdir
+        self._path_filter = path_filter
+        self._tailers: dict[str, TFRecordTailer] = {}
+        self._dir_mtime_ns: int | None = None
+
+    def scan(self) -> list[str]:
+        """Start reading files added since the last scan.
+
+        Returns the paths of the new files.
+        """
+        try:
+            mtime_ns = os.stat(self.logdir).st_mtime_ns
+        except OSError:
+            # The directory may not have been created yet.
+            return []
+
+        if (
+            mtime_ns == self._dir_mtime_ns
+            and time.time_ns() - mtime_ns > _MTIME_SETTLE_NS
+        ):
+            return []
+
+        new_paths = []
+        try:
+            with os.scandir(self.logdir) as entries:
+                for entry in entries:
+                    if entry.path in self._tailers or not entry.is_file():
+                        continue
+                    if self._path_filter(entry.path):
+                        new_paths.append(entry.path)
+        except OSError as e:
+            logger.debug("Failed to list tfevents directory %s: %s", self.logdir, e)
+            return []
+
+        self._dir_mtime_ns = mtime_ns
+        new_paths.sort()
+        for path in new_paths:
+            self._tailers[path] = TFRecordTailer(path)
+        return new_paths
+
+    def read_records(self) -> list[bytes]:
+        """Return records written to any file since the last call.
+
+        Call again until the result is empty to read everything available.
+        """
+        return [
+            record
+            for _, records in self.read_records_by_file()
+            for record in records
+        ]
+
+    def read_records_by_file(self) -> list[tuple[str, list[bytes]]]:
+        """Like `read_records`, but grouped by the file they were read from.
+
+        Only files with new records are included.
+        """
+        by_file = []
+        for path in sorted(self._tailers):
+            if records := self._tailers[path].read_records():
+                by_file.append((path, records))
+        return by_file
@@ -5,6 +5,7 @@ from __future__ import annotations
 import asyncio
 import base64
 import copy
+import json
 import logging
 import os
 import socket
@@ -13,7 +14,7 @@ import time
 import traceback
 from abc import ABC, abstractmethod
 from collections.abc import Iterator
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from enum import Enum
 from typing import TYPE_CHECKING, Any
 
@@ -99,6 +100,19 @@ class SweepRun:
     logs: list[str] | None = None
 
 
+@dataclass
+class _RunMetrics:
+    """The values of a metric read from a run's history so far."""
+
+    name: str
+    values: list[Any] = field(default_factory=list)
+    # The step of the last value read
+    last_step: int = -1
+    # The run's latest polled step when its history was last read
+    read_at_step: int | None = None
+    api_run: Run | None = None
+
+
 class Scheduler(ABC):
     """A controller/agent that populates a Launch RunQueue from a hyperparameter sweep."""
 
@@ -161,6 +175,10 @@ class Scheduler(ABC):
         self._runs: dict[str, SweepRun] = {}
         # Threading lock to ensure thread-safe access to the runs dictionary
         self._threading_lock: threading.Lock = threading.Lock()
+        # State and summary of each run from the latest batched poll
+        self._polled_runs: dict[str, dict[str, Any]] = {}
+        # Metric values read from each run's history, see _get_metrics_from_run
+        self._run_metrics: dict[str, _RunMetrics] = {}
         self._polling_sleep = (
             polling_sleep if polling_sleep is not None else DEFAULT_POLLING_SLEEP
         )
@@ -465,6 +483,8 @@ class Scheduler(ABC):
             for run_id in runs_to_remove:
                 wandb.termlog(f"{LOG_PREFIX}Cleaning up finished run ({run_id})")
                 del self._runs[run_id]
+                self._polled_runs.pop(run_id, None)
+                self._run_metrics.pop(run_id, None)
 
     def _stop_runs(self) -> None:
         to_delete = []
@@ -543,9 +563,16 @@ class Scheduler(ABC):
 
         Get state from backend and deletes runs if not in running state. Threadsafe.
         """
+        with self._threading_lock:
+            run_ids = list(self._runs)
+        polled_runs = self._poll_runs(run_ids)
+
         runs_to_remove: list[str] = []
         for run_id, run in self._yield_runs():
-            run.state = self._get_run_state(run_id, run.state)
+            if run_id in polled_runs:
+                run.state = self._parse_run_state(run_id, polled_runs[run_id]["state"])
+            else:
+                run.state = self._get_run_state(run_id, run.state)
 
             try:
                 rqi_state = run.queued_run.state if run.queued_run else None
@@ -558,25 +585,80 @@ class Scheduler(ABC):
                 runs_to_remove.append(run_id)
         self._cleanup_runs(runs_to_remove)
 
+    def _poll_runs(self, run_ids: list[str]) -> dict[str, dict[str, Any]]:
+        """Get the states and summaries of runs in a single paginated query.
+
+        The result is kept until the next poll. Runs missing from it, for
+        example because the query failed, are polled one at a time.
+        """
+        try:
+            self._polled_runs = self._api.get_run_states(
+                self._entity, self._project, run_ids
+            )
+        except Exception as e:
+            _logger.debug(f"[_poll_runs] {e}")
+            self._polled_runs = {}
+        return self._polled_runs
+
+    def _get_polled_step(self, run_id: str) -> int | None:
+        """The latest step of a run as of the last poll, or None if unknown."""
+        polled_run = self._polled_runs.get(run_id)
+        if polled_run is None:
+            return None
+        try:
+            summary = json.loads(polled_run.get("summaryMetrics") or "{}")
+        except ValueError:
+            return None
+        step = summary.get("_step", -1)
+        return step if isinstance(step, int) else None
+
     def _get_metrics_from_run(self, run_id: str) -> list[Any]:
         """Use the public api to get metrics from a run.
 
         Uses the metric name found in the sweep config, any
-        misspellings will result in an empty list.
+        misspellings will result in an empty list. Values are cached
+        between calls, and only the history logged since the last call
+        is read. History is not read at all if the run's step has not
+        changed since the last poll.
         """
         try:
             queued_run: QueuedRun | None = self._runs[run_id].queued_run
             if not queued_run:
                 return []
 
-            api_run: Run = self._public_api.run(
-                f"{queued_run.entity}/{queued_run.project}/{run_id}"
-            )
             metric_name = self._sweep_config["metric"]["name"]
-            history = api_run.scan_history(keys=["_step", metric_name])
-            metrics = [x[metric_name] for x in history]
+            metrics = self._run_metrics.get(run_id)
+            if metrics is None or metrics.name != metric_name:
+                metrics = _RunMetrics(metric_name)
+                self._run_metrics[run_id] = metrics
+
+            step = self._get_polled_step(run_id)
+            if (
+                step is not None
+                and metrics.read_at_step is not None
+                and step <= metrics.read_at_step
+            ):
+                return list(metrics.values)
 
-            return metrics
+            if metrics.api_run is None:
+                metrics.api_run = self._public_api.run(
+                    f"{queued_run.entity}/{queued_run.project}/{run_id}"
+                )
+            # The summary can be ahead of the stored history, so only steps
+            # that can already be read count as read.
+            history_step = metrics.api_run.lastHistoryStep
+            history = metrics.api_run.scan_history(
+                keys=["_step", metric_name],
+                min_step=metrics.last_step + 1,
+                max_step=history_step + 1,
+            )
+            for row in history:
+                metrics.values.append(row[metric_name])
+                metrics.last_step = row["_step"]
+            if step is not None:
+                metrics.read_at_step = min(step, history_step)
+
+            return list(metrics.values)
         except Exception as e:
             _logger.debug(f"[_get_metrics_from_run] {e}")
         return []
@@ -618,6 +700,14 @@ class Scheduler(ABC):
             run_state = RunState.UNKNOWN
         return run_state
 
+    def _parse_run_state(self, run_id: str, state: str) -> RunState:
+        """Convert a state from the backend to a RunState."""
+        try:
+            return RunState(state)
+        except ValueError:
+            wandb.termwarn(f"Bad state ({state}) for run ({run_id}).")
+            return RunState.UNKNOWN
+
     def _create_run(self) -> dict[str, Any]:
         """Use the public api to create a blank run."""
         try:
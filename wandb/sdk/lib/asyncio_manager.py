@@ -198,6 +198,29 @@ class AsyncioManager:
 
         _ = self._schedule(fn_wrap_exceptions, daemon=daemon, name=name)
 
+    def call_soon_threadsafe(self, fn: Callable[[], None]) -> None:
+        """Call a function in the asyncio thread without waiting for it.
+
+        This is much cheaper than run_soon() as it doesn't create a task,
+        but fn must not block. Like a daemon task, fn may not run if join()
+        was called.
+
+        Raises:
+            AlreadyJoinedError: If join() was already called.
+        """
+        self._ensure_not_in_fork()
+        self._ready_event.wait()
+
+        with self._lock:
+            if self._joined:
+                raise AlreadyJoinedError(
+                    "Cannot schedule tasks after join()."  #
+                    + " Did you call wandb.teardown()?"
+                )
+
+            # The loop keeps running until after _joined is set.
+            self._loop.call_soon_threadsafe(fn)
+
     def _schedule(
         self,
         fn: Callable[[], Awaitable[_T]],
@@ -13,10 +13,12 @@ import tempfile
 import threading
 from collections.abc import Generator, Iterable
 from pathlib import Path, PurePath
-from typing import IO, Any, BinaryIO, Literal, NewType, TypedDict
+from typing import IO, TYPE_CHECKING, Any, BinaryIO, Literal, NewType, TypedDict
 
 from wandb.sdk.lib.paths import StrPath
-from wandb.sdk.wandb_settings import Settings
+
+if TYPE_CHECKING:
+    from wandb.sdk.wandb_settings import Settings
 
 GlobStr = NewType("GlobStr", str)
 
@@ -4,7 +4,12 @@ import base64
 import hashlib
 import logging
 import mmap
+import os
+import threading
 import time
+from collections.abc import Iterable, Mapping
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from typing import TYPE_CHECKING, TypeAlias
 
 from wandb.sdk.lib.paths import StrPath
@@ -96,3 +101,139 @@ def _md5_file_hasher(*paths: StrPath) -> _hashlib.HASH:
                 pass
 
     return md5_hash
+
+
+_MB: int = 1_000_000
+
+_BATCH_MAX_BYTES: int = 16 * _MB
+"""The most bytes of small files to hash in a single task."""
+
+_BATCH_MAX_FILES: int = 256
+"""The most small files to hash in a single task."""
+
+_READ_BUFFER_SIZE: int = 1_024 * _KB
+"""Size of the per-thread buffer used to read files that are hashed in chunks."""
+
+_read_buffer = threading.local()
+
+
+@dataclass(frozen=True)
+class HashStats:
+    """Statistics from hashing a set of files."""
+
+    files: int
+    """The number of files hashed."""
+
+    bytes: int
+    """The total size of the files hashed."""
+
+    seconds: float
+    """Wall time spent hashing."""
+
+    @property
+    def mb_per_second(self) -> float:
+        """Hashing throughput in megabytes (10^6 bytes) per second."""
+        if self.seconds <= 0:
+            return 0.0
+        return self.bytes / _MB / self.seconds
+
+    def __str__(self) -> str:
+        return (
+            f"{self.files} files, {self.bytes / _MB:.1f}MB"
+            f" in {self.seconds:.2f}s ({self.mb_per_second:.1f}MB/s)"
+        )
+
+
+def md5_files_b64(
+    paths: Iterable[StrPath],
+    *,
+    sizes: Mapping[str, int] | None = None,
+    max_workers: int | None = None,
+) -> tuple[dict[str, B64MD5], HashStats]:
+    """Compute the MD5 of each of many files in parallel.
+
+    Small files are grouped into batches so that each task amortizes its
+    scheduling overhead over many files, and large files are hashed as
+    separate tasks. hashlib releases the GIL while hashing any buffer larger
+    than a couple of kilobytes, so a thread per core keeps all cores busy
+    without the cost of sending data to other processes.
+
+    Args:
+        paths: The files to hash.
+        sizes: Known sizes of the files, keyed on path, to avoid a stat call
+            for each file.
+        max_workers: The number of hashing threads. Defaults to the number of
+            CPU cores available to this process.
+
+    Returns:
+        The base64-encoded MD5 of each file, keyed on its path as a string,
+        and statistics for reporting throughput.
+    """
+    start_time = time.monotonic()
+
+    known_sizes = sizes or {}
+    file_sizes: dict[str, int] = {}
+    for path in map(str, paths):
+        size = known_sizes.get(path)
+        file_sizes[path] = os.path.getsize(path) if size is None else size
+
+    batches: list[list[str]] = []
+    batch: list[str] = []
+    batch_bytes = 0
+    # Smallest files first, so that batches are filled with similar files.
+    for path in sorted(file_sizes, key=file_sizes.__getitem__):
+        size = file_sizes[path]
+        if batch and (
+            batch_bytes + size > _BATCH_MAX_BYTES or len(batch) >= _BATCH_MAX_FILES
+        ):
+            batches.append(batch)
+            batch, batch_bytes = [], 0
+        batch.append(path)
+        batch_bytes += size
+    if batch:
+        batches.append(batch)
+
+    digests: dict[str, B64MD5] = {}
+    if batches:
+        max_workers = min(max_workers or _available_cpus(), len(batches))
+        with ThreadPoolExecutor(
+            max_workers=max_workers,
+            thread_name_prefix="wandb-md5",
+        ) as executor:
+            # Largest batches first, so that a big file doesn't start last.
+            for batch_digests in executor.map(_md5_batch_b64, reversed(batches)):
+                digests.update(batch_digests)
+
+    stats = HashStats(
+        files=len(file_sizes),
+        bytes=sum(file_sizes.values()),
+        seconds=time.monotonic() - start_time,
+    )
+    logger.debug("Computed MD5 hashes for files. %s", stats)
+    return digests, stats
+
+
+def _md5_batch_b64(paths: list[str]) -> dict[str, B64MD5]:
+    return {path: _b64_from_hasher(_md5_file_chunked(path)) for path in paths}
+
+
+def _md5_file_chunked(path: str) -> _hashlib.HASH:
+    """Hash a file by reading it into a reused per-thread buffer."""
+    try:
+        buffer = _read_buffer.buffer
+    except AttributeError:
+        buffer = _read_buffer.buffer = bytearray(_READ_BUFFER_SIZE)
+    view = memoryview(buffer)
+
+    md5_hash = _md5()
+    with open(path, "rb", buffering=0) as f:
+        while n := f.readinto(buffer):
+            md5_hash.update(view[:n])
+    return md5_hash
+
+
+def _available_cpus() -> int:
+    try:
+        return len(os.sched_getaffinity(0))
+    except AttributeError:  # not available on macOS and Windows
+        return os.cpu_count() or 1
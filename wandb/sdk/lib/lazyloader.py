@@ -1,8 +1,12 @@
 """module lazyloader."""
 
+from __future__ import annotations
+
 import importlib
 import sys
 import types
+from collections.abc import Callable
+from typing import Any
 
 
 class LazyLoader(types.ModuleType):
@@ -61,3 +65,50 @@ class LazyLoader(types.ModuleType):
         # print("dir")
         module = self._load()
         return dir(module)
+
+
+def lazy_attributes(
+    package: str,
+    package_globals: dict[str, Any],
+    attrs: dict[str, tuple[str, str | None]],
+) -> tuple[Callable[[str], Any], Callable[[], list[str]]]:
+    """Make a package import its attributes on first use.
+
+    Returns functions to assign to the package's `__getattr__` and `__dir__`
+    (PEP 562). Each loaded attribute is stored in the package's globals, so
+    the import only happens on the first lookup. Names that are not in
+    `attrs` are imported as submodules of the package if they exist.
+
+    Args:
+        package: The name of the package, usually `__name__`.
+        package_globals: The package's `globals()`.
+        attrs: Maps each attribute to the (possibly relative) module that
+            defines it and its name in that module, or None for the module
+            itself.
+    """
+
+    def __getattr__(name: str) -> Any:  # noqa: N807
+        if name in attrs:
+            module_name, attr = attrs[name]
+            module = importlib.import_module(module_name, package)
+            value = module if attr is None else getattr(module, attr)
+        elif not name.startswith("__"):
+            submodule = f"{package}.{name}"
+            try:
+                value = importlib.import_module(submodule)
+            except ModuleNotFoundError as e:
+                if e.name != submodule:
+                    raise
+                raise AttributeError(
+                    f"module {package!r} has no attribute {name!r}"
+                ) from None
+        else:
+            raise AttributeError(f"module {package!r} has no attribute {name!r}")
+
+        package_globals[name] = value
+        return value
+
+    def __dir__() -> list[str]:  # noqa: N807
+        return sorted(set(package_globals) | set(attrs))
+
+    return __getattr__, __dir__
@@ -18,46 +18,12 @@ import struct
 import sys
 import threading
 import time
-from collections import defaultdict
 from collections.abc import Callable, Iterable
 from typing import Literal
 
 import wandb
 from wandb.sdk.lib import console_capture
 
-
-class _Numpy:  # fallback in case numpy is not available
-    def where(self, x):
-        return ([i for i in range(len(x)) if x[i]],)
-
-    def diff(self, x):
-        return [x[i + 1] - x[i] for i in range(len(x) - 1)]
-
-    def arange(self, x):
-        class Arr(list):
-            def __getitem__(self, s):
-                if isinstance(s, slice):
-                    self._start = s.start
-                    return self
-                return super().__getitem__(s)
-
-            def __getslice__(self, i, j):
-                self._start = i
-                return self
-
-            def __iadd__(self, i):  # type: ignore
-                for j in range(self._start, len(self)):
-                    self[j] += i
-
-        return Arr(range(x))
-
-
-try:
-    import numpy as np  # type: ignore
-except ImportError:
-    np = _Numpy()  # type: ignore
-
-
 logger = logging.getLogger("wandb")
 
 
@@ -187,16 +153,157 @@ class Cursor:
         self.char = char
 
 
+# The style attributes of a character, in the order in which changes to them
+# are written out: (fg, bg, bold, italics, underscore, blink, strikethrough,
+# reverse).
+_Style = tuple
+
+_STYLE_ATTRS = Char.__slots__[1:]
+
+
+def _style_of(char: Char) -> _Style:
+    return tuple(char[k] for k in _STYLE_ATTRS)
+
+
+_DEFAULT_STYLE = _style_of(_defchar)
+
+
+def _style_changes(prev: _Style, style: _Style) -> str:
+    """Return the ANSI codes that switch from one style to another."""
+    codes = []
+    for k, prev_value, value in zip(_STYLE_ATTRS, prev, style, strict=True):
+        if prev_value == value:
+            continue
+        if k in ("fg", "bg"):
+            codes.append(_get_char(value))
+        else:
+            codes.append(_get_char(ANSI_STYLES_REV[k if value else "/" + k]))
+    return "".join(codes)
+
+
+class _Line:
+    """A line of terminal output.
+
+    Stores the line's characters as a string and their styles as runs: the
+    style of characters `ends[i-1]` through `ends[i] - 1` is `styles[i]`.
+    Trailing blanks in the default style are not stored.
+    """
+
+    __slots__ = ("text", "ends", "styles")
+
+    def __init__(self) -> None:
+        self.text = ""
+        self.ends: list[int] = []
+        self.styles: list[_Style] = []
+
+    def __len__(self) -> int:
+        return len(self.text)
+
+    def _runs(self, start: int, stop: int) -> list[tuple[int, _Style]]:
+        """Return the (length, style) runs covering characters [start, stop)."""
+        runs = []
+        run_start = 0
+        for run_end, style in zip(self.ends, self.styles, strict=True):
+            if run_end > start and run_start < stop:
+                runs.append((min(run_end, stop) - max(run_start, start), style))
+            if run_end >= stop:
+                break
+            run_start = run_end
+        return runs
+
+    def _set_runs(self, runs: Iterable[tuple[int, _Style]]) -> None:
+        ends: list[int] = []
+        styles: list[_Style] = []
+        end = 0
+        for length, style in runs:
+            if not length:
+                continue
+            end += length
+            if styles and styles[-1] == style:
+                ends[-1] = end
+            else:
+                ends.append(end)
+                styles.append(style)
+        self.ends = ends
+        self.styles = styles
+
+    def write(self, x: int, text: str, style: _Style) -> None:
+        """Overwrite the characters starting at column x."""
+        if not text:
+            return
+        line_len = len(self.text)
+        stop = x + len(text)
+        runs = self._runs(0, min(x, line_len))
+        if x > line_len:
+            runs.append((x - line_len, _DEFAULT_STYLE))
+        runs.append((len(text), style))
+        runs.extend(self._runs(stop, line_len))
+
+        self.text = self.text[:x].ljust(x) + text + self.text[stop:]
+        self._set_runs(runs)
+        self._strip()
+
+    def erase(self, start: int, stop: int) -> None:
+        """Reset characters [start, stop) to blanks in the default style."""
+        stop = min(stop, len(self.text))
+        if start < stop:
+            self.write(start, " " * (stop - start), _DEFAULT_STYLE)
+
+    def _strip(self) -> None:
+        """Remove trailing blanks in the default style."""
+        while self.styles and self.styles[-1] == _DEFAULT_STYLE:
+            run_start = self.ends[-2] if len(self.ends) > 1 else 0
+            stripped = self.text[run_start:].rstrip(" ")
+            if stripped:
+                self.ends[-1] = run_start + len(stripped)
+                self.text = self.text[: self.ends[-1]]
+                return
+            self.text = self.text[:run_start]
+            self.ends.pop()
+            self.styles.pop()
+
+    def render(self) -> str:
+        """Return the line with ANSI codes wherever the style changes."""
+        if not self.styles:
+            return ""
+        if len(self.styles) == 1 and self.styles[0] == _DEFAULT_STYLE:
+            return self.text
+
+        out = []
+        run_start = 0
+        prev = _DEFAULT_STYLE
+        for run_end, style in zip(self.ends, self.styles, strict=True):
+            out.append(_style_changes(prev, style))
+            out.append(self.text[run_start:run_end])
+            run_start = run_end
+            prev = style
+        return "".join(out)
+
+
+def _overlay(segments: list[str]) -> str:
+    """Return what's visible after writing each segment over the previous ones."""
+    visible = segments[-1]
+    for segment in reversed(segments[:-1]):
+        if len(segment) > len(visible):
+            visible += segment[len(visible) :]
+    return visible
+
+
+# Matches separators other than carriage returns and newlines.
+_SEP_RE_NO_CR_LF = re.compile(SEP_RE.pattern.replace("\r|\n|", "", 1))
+
+
 class TerminalEmulator:
     """An FSM emulating a terminal.
 
-    Characters are stored in a 2D matrix (buffer) indexed by the cursor.
+    Lines are stored by their index, and characters in a line are indexed by
+    the cursor. Each line is stored as a string plus runs of styles.
     """
 
     _MAX_LINES = 100
 
     def __init__(self):
-        self.buffer = defaultdict(lambda: defaultdict(lambda: _defchar))
+        self.buffer: dict[int, _Line] = {}
         self.cursor = Cursor()
         self._num_lines = None  # Cache
 
@@ -236,81 +343,89 @@ class TerminalEmulator:
         self.carriage_return()
 
     def _get_line_len(self, n):
-        if n not in self.buffer:
-            return 0
-        line = self.buffer[n]
-        if not line:
-            return 0
-        n = max(line.keys())
-        for i in range(n, -1, -1):
-            if line[i] != _defchar:
-                return i + 1
-        return 0
+        line = self.buffer.get(n)
+        return len(line) if line is not None else 0
+
+    def _current_line(self) -> _Line:
+        line = self.buffer.get(self.cursor.y)
+        if line is None:
+            line = self.buffer[self.cursor.y] = _Line()
+        return line
 
     @property
     def num_lines(self):
         if self._num_lines is not None:
             return self._num_lines
         ret = 0
-        if self.buffer:
-            n = max(self.buffer.keys())
-            for i in range(n, -1, -1):
-                if self._get_line_len(i):
-                    ret = i + 1
-                    break
+        for i, line in self.buffer.items():
+            if len(line) and i + 1 > ret:
+                ret = i + 1
         self._num_lines = ret
         return ret
 
     def display(self):
         return [
-            [self.buffer[i][j].data for j in range(self._get_line_len(i))]
+            list(self.buffer[i].text) if i in self.buffer else []
             for i in range(self.num_lines)
         ]
 
     def erase_screen(self, mode=0):
         if mode == 0:
             for i in range(self.cursor.y + 1, self.num_lines):
-                if i in self.buffer:
-                    del self.buffer[i]
+                self.buffer.pop(i, None)
             self.erase_line(mode)
         if mode == 1:
             for i in range(self.cursor.y):
-                if i in self.buffer:
-                    del self.buffer[i]
+                self.buffer.pop(i, None)
             self.erase_line(mode)
         elif mode == 2 or mode == 3:
             self.buffer.clear()
 
     def erase_line(self, mode=0):
-        curr_line = self.buffer[self.cursor.y]
+        curr_line = self.buffer.get(self.cursor.y)
+        if curr_line is None:
+            return
         if mode == 0:
-            for i in range(self.cursor.x, self._get_line_len(self.cursor.y)):
-                if i in curr_line:
-                    del curr_line[i]
+            curr_line.erase(self.cursor.x, len(curr_line))
         elif mode == 1:
-            for i in range(self.cursor.x + 1):
-                if i in curr_line:
-                    del curr_line[i]
+            curr_line.erase(0, self.cursor.x + 1)
         else:
-            curr_line.clear()
+            curr_line.erase(0, len(curr_line))
 
     def insert_lines(self, n=1):
         for i in range(self.num_lines - 1, self.cursor.y, -1):
-            self.buffer[i + n] = self.buffer[i]
-        for i in range(self.cursor.y + 1, self.cursor.y + 1 + n):
             if i in self.buffer:
-                del self.buffer[i]
+                self.buffer[i + n] = self.buffer[i]
+            else:
+                self.buffer.pop(i + n, None)
+        for i in range(self.cursor.y + 1, self.cursor.y + 1 + n):
+            self.buffer.pop(i, None)
 
     def _write_plain_text(self, plain_text):
-        self.buffer[self.cursor.y].update(
-            [
-                (self.cursor.x + i, self.cursor.char.copy(data=c))
-                for i, c in enumerate(plain_text)
-            ]
-        )
-        self.cursor.x += len(plain_text)
+        if plain_text:
+            self._current_line().write(
+                self.cursor.x, plain_text, _style_of(self.cursor.char)
+            )
+            self.cursor.x += len(plain_text)
 
-    def _write_text(self, text):
+    def _write_line(self, text):
+        """Write text that contains no newlines.
+
+        Carriage returns are handled all at once by only writing what would
+        be visible after the text's segments overwrite each other.
+        """
+        if _SEP_RE_NO_CR_LF.search(text):
+            self._write_separated_text(text)
+            return
+
+        first, *rest = text.split("\r")
+        self._write_plain_text(first)
+        if rest:
+            self.carriage_return()
+            self._write_plain_text(_overlay(rest))
+            self.cursor.x = len(rest[-1])
+
+    def _write_separated_text(self, text):
         prev_end = 0
         for match in SEP_RE.finditer(text):
             start, end = match.span()
@@ -327,6 +442,13 @@ class TerminalEmulator:
                 continue
         self._write_plain_text(text[prev_end:])
 
+    def _write_text(self, text):
+        first, *rest = text.split("\n")
+        self._write_line(first)
+        for line in rest:
+            self.linefeed()
+            self._write_line(line)
+
     def _remove_osc(self, text):
         return re.sub(ANSI_OSC_RE, "", text)
 
@@ -395,53 +517,8 @@ class TerminalEmulator:
             pass
 
     def _get_line(self, n):
-        line = self.buffer[n]
-        line_len = self._get_line_len(n)
-        # We have to loop through each character in the line and check if foreground,
-        # background and other attributes (italics, bold, underline, etc) of the ith
-        # character are different from those of the (i-1)th character. If different, the
-        # appropriate ascii character for switching the color/attribute should be
-        # appended to the output string before appending the actual character. This loop
-        # and subsequent checks can be expensive, especially because 99% of terminal
-        # output use default colors and formatting. Even in outputs that do contain
-        # colors and styles, its unlikely that they will change on a per character
-        # basis.
-
-        # So instead we create a character list without any ascii codes (`out`), and a
-        # list of all the foregrounds in the line (`fgs`) on which we call np.diff() and
-        # np.where() to find the indices where the foreground change, and insert the
-        # ascii characters in the output list (`out`) on those indices. All of this is
-        # the done only if there are more than 1 foreground color in the line in the
-        # first place (`if len(set(fgs)) > 1 else None`). Same logic is repeated for
-        # background colors and other attributes.
-
-        out = [line[i].data for i in range(line_len)]
-
-        # for dynamic insert using original indices
-        idxs = np.arange(line_len)
-        insert = lambda i, c: (out.insert(idxs[i], c), idxs[i:].__iadd__(1))  # noqa
-
-        fgs = [int(_defchar.fg)] + [int(line[i].fg) for i in range(line_len)]
-        [
-            insert(i, _get_char(line[int(i)].fg)) for i in np.where(np.diff(fgs))[0]
-        ] if len(set(fgs)) > 1 else None
-        bgs = [int(_defchar.bg)] + [int(line[i].bg) for i in range(line_len)]
-        [
-            insert(i, _get_char(line[int(i)].bg)) for i in np.where(np.diff(bgs))[0]
-        ] if len(set(bgs)) > 1 else None
-        attrs = {
-            k: [False] + [line[i][k] for i in range(line_len)]
-            for k in Char.__slots__[3:]
-        }
-        [
-            [
-                insert(i, _get_char(ANSI_STYLES_REV[k if line[int(i)][k] else "/" + k]))
-                for i in np.where(np.diff(v))[0]
-            ]
-            for k, v in attrs.items()
-            if any(v)
-        ]
-        return "".join(out)
+        line = self.buffer.get(n)
+        return line.render() if line is not None else ""
 
     def read(self):
         num_lines = self.num_lines
@@ -472,11 +549,9 @@ class TerminalEmulator:
                 )
         if num_lines > self._MAX_LINES:
             shift = num_lines - self._MAX_LINES
-            for i in range(shift, num_lines):
-                self.buffer[i - shift] = self.buffer[i]
-            for i in range(self._MAX_LINES, max(self.buffer.keys())):
-                if i in self.buffer:
-                    del self.buffer[i]
+            self.buffer = {
+                i - shift: line for i, line in self.buffer.items() if i >= shift
+            }
             self.cursor.y -= min(self.cursor.y, shift)
             self._num_lines = num_lines = self._MAX_LINES
         self._prev_num_lines = num_lines
@@ -487,6 +562,16 @@ class TerminalEmulator:
 _MIN_CALLBACK_INTERVAL = 2  # seconds
 
 
+def _drain(q: queue.Queue) -> list:
+    """Get all items currently in a queue without blocking."""
+    items = []
+    while True:
+        try:
+            items.append(q.get_nowait())
+        except queue.Empty:
+            return items
+
+
 class RedirectBase:
     def __init__(
         self,
@@ -537,34 +622,36 @@ class StreamWrapper(RedirectBase):
         self._emulator = TerminalEmulator()
         self._queue: queue.Queue[str] = queue.Queue()
         self._stopped = threading.Event()
+        # Set whenever data is queued or the wrapper is stopped.
+        self._wakeup = threading.Event()
         self._flush_periodically = flush_periodically
 
     def _emulator_write(self) -> None:
         while True:
-            if self._queue.empty():
-                if self._stopped.is_set():
-                    return
-                time.sleep(0.5)
-                continue
+            self._wakeup.wait()
+            self._wakeup.clear()
+
+            data = _drain(self._queue)
+            if data:
+                if self._stopped.is_set() and sum(map(len, data)) > 100000:
+                    wandb.termlog(
+                        "Terminal output too large. Logging without processing."
+                    )
+                    self.flush()
 
-            data: list[str] = []
-            while not self._queue.empty():
-                data.append(self._queue.get())
+                    for line in data:
+                        self.flush(line)
 
-            if self._stopped.is_set() and sum(map(len, data)) > 100000:
-                wandb.termlog("Terminal output too large. Logging without processing.")
-                self.flush()
+                    return
 
-                for line in data:
-                    self.flush(line)
+                try:
+                    self._emulator.write("".join(data))
+                except Exception:
+                    pass
 
+            if self._stopped.is_set() and self._queue.empty():
                 return
 
-            try:
-                self._emulator.write("".join(data))
-            except Exception:
-                pass
-
     def _callback(self) -> None:
         while not (self._stopped.is_set() and self._queue.empty()):
             self.flush()
@@ -577,6 +664,7 @@ class StreamWrapper(RedirectBase):
             written_data = data[:written]
 
         self._queue.put(written_data)
+        self._wakeup.set()
 
     def install(self) -> None:
         if self._uninstall:
@@ -624,6 +712,7 @@ class StreamWrapper(RedirectBase):
         self._uninstall()
 
         self._stopped.set()
+        self._wakeup.set()
         self._emulator_write_thread.join(timeout=5)
         if self._emulator_write_thread.is_alive():
             wandb.termlog(f"Processing terminal output ({self.src})...")
@@ -760,6 +849,8 @@ class Redirect(RedirectBase):
         self._installed = True
         self._queue = queue.Queue()
         self._stopped = threading.Event()
+        # Set whenever data is queued or the redirect is stopped.
+        self._wakeup = threading.Event()
         self._pipe_relay_thread = threading.Thread(target=self._pipe_relay)
         self._pipe_relay_thread.daemon = True
         self._pipe_relay_thread.start()
@@ -783,6 +874,7 @@ class Redirect(RedirectBase):
         os.dup2(self._orig_src_fd, self.src_fd)
         os.write(self._pipe_write_fd, _LAST_WRITE_TOKEN)
         self._pipe_relay_thread.join()
+        self._wakeup.set()
         os.close(self._pipe_read_fd)
         os.close(self._pipe_write_fd)
 
@@ -845,6 +937,7 @@ class Redirect(RedirectBase):
                     while i < len(data):
                         i += self._orig_src.write(data[i:])
                 self._queue.put(data)
+                self._wakeup.set()
                 if brk:
                     return
             except OSError:
@@ -852,20 +945,20 @@ class Redirect(RedirectBase):
 
     def _emulator_write(self):
         while True:
-            if self._queue.empty():
-                if self._stopped.is_set():
+            self._wakeup.wait()
+            self._wakeup.clear()
+            data = _drain(self._queue)
+            if data:
+                if self._stopped.is_set() and sum(map(len, data)) > 100000:
+                    wandb.termlog(
+                        "Terminal output too large. Logging without processing."
+                    )
+                    self.flush()
+                    [self.flush(line) for line in data]
                     return
-                time.sleep(0.5)
-                continue
-            data = []
-            while not self._queue.empty():
-                data.append(self._queue.get())
-            if self._stopped.is_set() and sum(map(len, data)) > 100000:
-                wandb.termlog("Terminal output too large. Logging without processing.")
-                self.flush()
-                [self.flush(line) for line in data]
+                try:
+                    self._emulator.write(b"".join(data).decode("utf-8"))
+                except Exception:
+                    pass
+            if self._stopped.is_set() and self._queue.empty():
                 return
-            try:
-                self._emulator.write(b"".join(data).decode("utf-8"))
-            except Exception:
-                pass
@@ -1,46 +1,119 @@
 from __future__ import annotations
 
 import asyncio
+import collections
 import logging
 import struct
+import threading
 from types import TracebackType
+from typing import TYPE_CHECKING
 
 from wandb.proto import wandb_server_pb2 as spb
 from wandb.sdk.lib import asyncio_manager
 from wandb.sdk.mailbox.mailbox import Mailbox
 from wandb.sdk.mailbox.mailbox_handle import MailboxHandle
 
+if TYPE_CHECKING:
+    from wandb.proto import wandb_internal_pb2 as pb
+
 _logger = logging.getLogger(__name__)
 
 _HEADER_BYTE_INT_LEN = 5
 _HEADER_BYTE_INT_FMT = "<BI"
 
+# The tag of ServerRequest.record_publish: its field number and the
+# length-delimited wire type.
+_RECORD_PUBLISH_TAG = bytes(
+    [spb.ServerRequest.DESCRIPTOR.fields_by_name["record_publish"].number << 3 | 2]
+)
+
+# How many bytes may be queued for sending before publish_record() blocks.
+_MAX_PENDING_BYTES = 16 * 1024 * 1024
+
 
 class ServiceClient:
-    """Implements socket communication with the internal service."""
+    """Implements socket communication with the internal service.
+
+    Requests are queued and written by a single asyncio task, which writes
+    everything queued since its previous write at once and then waits for
+    the socket's flow control. Requests are written in the order in which
+    they are queued.
+    """
 
     def __init__(
         self,
         asyncer: asyncio_manager.AsyncioManager,
         reader: asyncio.StreamReader,
         writer: asyncio.StreamWriter,
+        *,
+        max_pending_bytes: int = _MAX_PENDING_BYTES,
     ) -> None:
-        self._broken_exc: Exception | None = None
+        self._broken_exc: BaseException | None = None
         self._broken_tb: TracebackType | None = None
 
+        self._asyncer = asyncer
         self._reader = reader
         self._writer = writer
         self._mailbox = Mailbox(asyncer, self._cancel_request)
+
+        self._outbox_lock = threading.Lock()
+        self._outbox_space = threading.Condition(self._outbox_lock)
+
+        self._outbox: collections.deque[bytes] = collections.deque()
+        """Frames to write. Guarded by _outbox_lock."""
+
+        self._pending_bytes = 0
+        """Size of frames queued or being written. Guarded by _outbox_lock."""
+
+        self._max_pending_bytes = max_pending_bytes
+
+        self._wakeup_scheduled = False
+        """Whether _outbox_ready will be set. Guarded by _outbox_lock."""
+
+        self._closing = False
+        """Whether close() was called. Guarded by _outbox_lock."""
+
+        self._outbox_ready = asyncio.Event()
+        self._writer_done = asyncio.Event()
+
         asyncer.run_soon(
             self._forward_responses,
             daemon=True,
             name="ServiceClient._forward_responses",
         )
+        asyncer.run_soon(
+            self._write_outbox,
+            daemon=True,
+            name="ServiceClient._write_outbox",
+        )
 
     async def publish(self, request: spb.ServerRequest) -> None:
         """Send a request without waiting for a response."""
         await self._send_server_request(request)
 
+    def publish_record(self, record: pb.Record, *, block: bool = True) -> None:
+        """Send a record in a record_publish request, from any thread.
+
+        This returns once the record is queued, without waiting for it to be
+        written.
+
+        Args:
+            record: The record to send.
+            block: Whether to wait for space if too many bytes are queued.
+                Must be False in the asyncio thread, which writes the queue.
+
+        Raises:
+            Exception: If the connection is broken or closed.
+        """
+        # Equivalent to serializing a ServerRequest containing the record,
+        # without copying the record into one.
+        data = record.SerializeToString()
+        self._enqueue(
+            _RECORD_PUBLISH_TAG + _encode_varint(len(data)),
+            data,
+            block=block,
+        )
+
     async def deliver(
         self,
         request: spb.ServerRequest,
@@ -59,6 +132,34 @@ class ServiceClient:
         return handle
 
     async def _send_server_request(self, request: spb.ServerRequest) -> None:
+        self._enqueue(request.SerializeToString(), block=False)
+
+    def _enqueue(self, *chunks: bytes, block: bool) -> None:
+        """Queue the chunks of a request for writing, as one frame."""
+        size = sum(len(chunk) for chunk in chunks)
+        header = struct.pack(_HEADER_BYTE_INT_FMT, ord("W"), size)
+
+        with self._outbox_lock:
+            self._raise_if_broken()
+            while block and self._pending_bytes >= self._max_pending_bytes:
+                self._outbox_space.wait()
+                self._raise_if_broken()
+
+            self._outbox.append(header)
+            self._outbox.extend(chunks)
+            self._pending_bytes += len(header) + size
+
+            if self._wakeup_scheduled:
+                return
+            self._wakeup_scheduled = True
+
+        self._asyncer.call_soon_threadsafe(self._outbox_ready.set)
+
+    def _raise_if_broken(self) -> None:
+        """Raise an error if requests can no longer be sent.
+
+        Must be called while holding _outbox_lock.
+        """
         if self._broken_exc:
             # Use with_traceback() to reuse the original traceback.
             # The exception's __traceback__ is modified by every `raise`
@@ -74,19 +175,55 @@ class ServiceClient:
             # See https://bugs.python.org/issue45924.
             raise self._broken_exc.with_traceback(self._broken_tb)
 
-        header = struct.pack(_HEADER_BYTE_INT_FMT, ord("W"), request.ByteSize())
-        self._writer.write(header)
-
-        data = request.SerializeToString()
-        self._writer.write(data)
+        if self._closing:
+            raise BrokenPipeError("The connection to the service is closed.")
 
+    async def _write_outbox(self) -> None:
+        """Write queued frames until the client is closed."""
         try:
-            await self._drain_writer()
+            while True:
+                await self._outbox_ready.wait()
+                self._outbox_ready.clear()
+
+                with self._outbox_lock:
+                    frames = self._outbox
+                    self._outbox = collections.deque()
+                    self._wakeup_scheduled = False
+                    closing = self._closing
+
+                if frames:
+                    size = sum(len(frame) for frame in frames)
+                    self._writer.writelines(frames)
+                    await self._drain_writer()
+
+                    with self._outbox_lock:
+                        self._pending_bytes -= size
+                        self._outbox_space.notify_all()
+
+                if closing:
+                    return
+
         except Exception as e:
-            self._broken_exc = e
-            self._broken_tb = e.__traceback__
+            _logger.exception("Error writing to the service.")
+            self._set_broken(e)
+
+        except BaseException:
+            # Cancelled, for example by AsyncioManager.join().
+            self._set_broken(
+                BrokenPipeError("Stopped writing to the service."),
+            )
             raise
 
+        finally:
+            self._writer_done.set()
+
+    def _set_broken(self, exc: BaseException) -> None:
+        """Fail current and future attempts to send requests."""
+        with self._outbox_lock:
+            self._broken_exc = exc
+            self._broken_tb = exc.__traceback__
+            self._outbox_space.notify_all()
+
     async def _drain_writer(self) -> None:
         """Wait for the socket's flow control."""
         await self._writer.drain()
@@ -107,6 +244,12 @@ class ServiceClient:
 
     async def close(self) -> None:
         """Flush and close the socket."""
+        with self._outbox_lock:
+            self._closing = True
+            self._outbox_space.notify_all()
+        self._outbox_ready.set()
+        await self._writer_done.wait()
+
         self._writer.close()
         await self._writer.wait_closed()
 
@@ -142,3 +285,13 @@ class ServiceClient:
         response = spb.ServerResponse()
         response.ParseFromString(data)
         return response
+
+
+def _encode_varint(value: int) -> bytes:
+    """Encode a non-negative integer as a protobuf varint."""
+    encoded = bytearray()
+    while value > 0x7F:
+        encoded.append(value & 0x7F | 0x80)
+        value >>= 7
+    encoded.append(value)
+    return bytes(encoded)
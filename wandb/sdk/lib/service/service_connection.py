@@ -35,6 +35,36 @@ class WandbApiFailedError(Exception):
         self.response = response
 
 
+def wait_api_response(
+    handle: MailboxHandle[wandb_api_pb2.ApiResponse],
+    timeout: float | None = None,
+) -> wandb_api_pb2.ApiResponse:
+    """Wait for the response to an ApiRequest.
+
+    Raises:
+        WandbApiFailedError: If the service is not running, doesn't respond
+            in time, or returns an error response.
+    """
+    try:
+        response = handle.wait_or(timeout=timeout)
+    except (MailboxClosedError, HandleAbandonedError):
+        raise WandbApiFailedError(
+            "Failed to execute API request:" + " the service process is not running.",
+        ) from None
+    except TimeoutError:
+        raise WandbApiFailedError(
+            "Failed to execute API request:"
+            + " the service process is busy and did not respond in time.",
+        ) from None
+
+    if response.HasField("api_error_response"):
+        raise WandbApiFailedError(
+            response.api_error_response.message,
+            response.api_error_response,
+        )
+    return response
+
+
 def connect_to_service(
     asyncer: asyncio_manager.AsyncioManager,
     settings: wandb_settings.Settings,
@@ -235,32 +265,26 @@ class ServiceConnection:
         handle = await self._client.deliver(request)
         return handle.map(lambda r: r.api_response)
 
+    def api_request_nowait(
+        self,
+        api_request: wandb_api_pb2.ApiRequest,
+    ) -> MailboxHandle[wandb_api_pb2.ApiResponse]:
+        """Send an ApiRequest and return a handle without waiting for a response.
+
+        Use `wait_api_response` to wait on the handle.
+        """
+        return self._asyncer.run(lambda: self.api_request_async(api_request))
+
     def api_request(
         self,
         api_request: wandb_api_pb2.ApiRequest,
         timeout: float | None = None,
     ) -> wandb_api_pb2.ApiResponse:
         """Send an ApiRequest and wait for a response."""
-        handle = self._asyncer.run(lambda: self.api_request_async(api_request))
-        try:
-            response = handle.wait_or(timeout=timeout)
-        except (MailboxClosedError, HandleAbandonedError):
-            raise WandbApiFailedError(
-                "Failed to execute API request:"
-                + " the service process is not running.",
-            ) from None
-        except TimeoutError:
-            raise WandbApiFailedError(
-                "Failed to execute API request:"
-                + " the service process is busy and did not respond in time.",
-            ) from None
-
-        if response.HasField("api_error_response"):
-            raise WandbApiFailedError(
-                response.api_error_response.message,
-                response.api_error_response,
-            )
-        return response
+        return wait_api_response(
+            self.api_request_nowait(api_request),
+            timeout=timeout,
+        )
 
     def api_publish(self, api_request: wandb_api_pb2.ApiRequest) -> None:
         """Publish an ApiRequest without waiting for a response."""
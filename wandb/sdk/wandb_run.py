@@ -1594,6 +1594,8 @@ class Run:
 
     def _set_backend(self, backend: InterfaceBase) -> None:
         self._interface = backend
+        if self._settings.x_coalesce_partial_history:
+            backend.coalesce_partial_history(shared=self._settings._shared)
 
     def _set_internal_run_interface(self, interface: InterfaceQueue) -> None:
         self._internal_run_interface = interface
@@ -52,6 +52,7 @@ CLIENT_ONLY_SETTINGS = (
     "reinit",
     "stop_fn",
     "use_dot_wandb",
+    "x_coalesce_partial_history",
     "x_files_dir",
     "x_sync_dir_suffix",
 )
@@ -614,6 +615,13 @@ class Settings(BaseModel, validate_assignment=True):
     <!-- lazydoc-ignore -->
     """
 
+    x_coalesce_partial_history: bool = False
+    """Whether to merge `log()` calls that don't commit a row before sending them.
+
+    Consecutive calls for the same step are sent to the service as one
+    message, reducing the per-call overhead of logging many small dicts.
+    """
+
     x_disable_meta: bool = False
     """Flag to disable the collection of system metadata."""
 
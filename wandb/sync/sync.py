@@ -3,8 +3,12 @@
 from __future__ import annotations
 
 import atexit
+import concurrent.futures
 import datetime
 import fnmatch
+import functools
+import json
+import multiprocessing
 import os
 import queue
 import sys
@@ -24,6 +28,102 @@ from wandb.util import check_and_warn_old
 WANDB_SUFFIX = ".wandb"
 SYNCED_SUFFIX = ".synced"
 TFEVENT_SUBSTRING = ".tfevents."
+CHECKPOINT_SUFFIX = ".sync-checkpoint"
+
+# How often to save the offset of the last synced record.
+_CHECKPOINT_INTERVAL_SECONDS = 30
+
+# Records that are not sent again when resuming from a checkpoint. These are
+# only streamed to the server by the file stream, which confirms that they
+# were received before the checkpoint is saved. Other records, such as config
+# and summary updates or artifacts, are cheap to send again.
+_SKIP_ON_RESUME = frozenset({"history", "output", "stats"})
+
+
+class _SyncCheckpoint:
+    """Tracks how much of a .wandb file was synced, to resume an interrupted sync.
+
+    Offsets are only saved once the sender confirms that the records before
+    them were uploaded. A checkpoint is for the run it was synced to, and is
+    ignored when syncing to a different run.
+    """
+
+    def __init__(self, sync_item: str, enabled: bool) -> None:
+        self._sync_item = sync_item
+        self._checkpoint_file = f"{sync_item}{CHECKPOINT_SUFFIX}"
+        self._enabled = enabled
+        self._time = time.monotonic()
+        self._destination: dict[str, str] | None = None
+        self._saved_destination: dict[str, str] | None = None
+        self.resume_offset = self._load() if enabled else None
+
+    def _load(self) -> int | None:
+        try:
+            with open(self._checkpoint_file) as f:
+                checkpoint = json.load(f)
+            offset = checkpoint["offset"]
+            self._saved_destination = checkpoint["destination"]
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+        if not isinstance(offset, int) or offset > os.path.getsize(self._sync_item):
+            return None
+        return offset
+
+    def set_destination(self, entity: str, project: str, run_id: str) -> None:
+        """Set the run being synced to, once the server has resolved it."""
+        self._destination = {"entity": entity, "project": project, "run_id": run_id}
+        if self._destination != self._saved_destination:
+            self.resume_offset = None
+
+    def save(self, offset: int) -> None:
+        """Record that all records up to an offset were uploaded."""
+        if not self._enabled or self._destination is None:
+            return
+        tmp_file = f"{self._checkpoint_file}.tmp"
+        with open(tmp_file, "w") as f:
+            json.dump({"offset": offset, "destination": self._destination}, f)
+        os.replace(tmp_file, self._checkpoint_file)
+
+    def due(self) -> bool:
+        """Whether it's time to checkpoint the records sent so far."""
+        if not self._enabled:
+            return False
+        now = time.monotonic()
+        if now - self._time <= _CHECKPOINT_INTERVAL_SECONDS:
+            return False
+        self._time = now
+        return True
+
+    def skip_data(self, data: memoryview | bytes, end_offset: int) -> bool:
+        """Whether a record was synced before, judging by its offset."""
+        return (
+            self._destination is not None
+            and self.resume_offset is not None
+            and end_offset <= self.resume_offset
+            and datastore.peek_record_type(data) in _SKIP_ON_RESUME
+        )
+
+    def skip_record(self, pb: wandb_internal_pb2.Record, resume_step: int) -> bool:
+        """Whether a history record was uploaded before, judging by its step."""
+        return (
+            self._destination is not None
+            and self.resume_offset is not None
+            and pb.WhichOneof("record_type") == "history"
+            and pb.history.step.num < resume_step
+        )
+
+    def finish(self, finished: bool) -> None:
+        """Remove the checkpoint of a run that was synced to the end.
+
+        An unfinished run keeps its checkpoint, so that it can be synced again
+        later from where it ended.
+        """
+        if not self._enabled or not finished:
+            return
+        try:
+            os.remove(self._checkpoint_file)
+        except FileNotFoundError:
+            pass
 
 
 class _LocalRun:
@@ -76,6 +176,10 @@ class SyncThread(threading.Thread):
         self._tmp_dir = tempfile.TemporaryDirectory()
         atexit.register(self._tmp_dir.cleanup)
 
+        # The number and size of the records sent, for reporting throughput.
+        self.records_synced = 0
+        self.bytes_synced = 0
+
     def _parse_pb(self, data, exit_pb=None):
         pb = wandb_internal_pb2.Record()
         pb.ParseFromString(data)
@@ -272,16 +376,26 @@ class SyncThread(threading.Thread):
             # If we're syncing tensorboard, let's use a tmp dir for images etc.
             root_dir = self._tmp_dir.name if sync_tb else os.path.dirname(sync_item)
 
+            # An interrupted sync resumes from where it left off.
+            checkpoint = _SyncCheckpoint(
+                sync_item,
+                enabled=not sync_tb and not self._view,
+            )
+
             # When appending we are allowing a possible resume, ie the run
             # does not have to exist already
-            resume = "allow" if self._append else None
+            resume = (
+                "allow"
+                if self._append or checkpoint.resume_offset is not None
+                else None
+            )
 
             sm = sender.SendManager.setup(root_dir, resume=resume)
             if sync_tb:
                 self._send_tensorboard(tb_root, tb_logdirs, sm)
                 continue
 
-            ds = datastore.DataStore()
+            ds = datastore.MmapDataStore()
             try:
                 ds.open_for_scan(sync_item)
             except AssertionError as e:
@@ -296,12 +410,17 @@ class SyncThread(threading.Thread):
                 data = self._robust_scan(ds)
                 if data is None:
                     break
+                if checkpoint.skip_data(data, ds.get_offset()):
+                    continue
                 pb, exit_pb, cont = self._parse_pb(data, exit_pb)
                 if exit_pb is not None:
                     finished = True
-                if cont:
+                if cont or checkpoint.skip_record(pb, sm.resume_step):
                     continue
+
                 sm.send(pb)
+                self.records_synced += 1
+                self.bytes_synced += len(data)
                 # send any records that were added in previous send
                 while not sm._record_q.empty():
                     data = sm._record_q.get(block=True)
@@ -310,8 +429,10 @@ class SyncThread(threading.Thread):
                 if pb.control.req_resp:
                     result = sm._result_q.get(block=True)
                     result_type = result.WhichOneof("result_type")
-                    if not shown and result_type == "run_result":
+                    if result_type == "run_result":
                         r = result.run_result.run
+                        checkpoint.set_destination(r.entity, r.project, r.run_id)
+                    if not shown and result_type == "run_result":
                         # TODO(jhr): hardcode until we have settings in sync
                         url = (
                             f"{self._app_url}"
@@ -322,7 +443,17 @@ class SyncThread(threading.Thread):
                         print(f"Syncing: {url} ... ", end="")  # noqa: T201
                         sys.stdout.flush()
                         shown = True
+                if checkpoint.due():
+                    sm.flush_file_stream(
+                        functools.partial(checkpoint.save, ds.get_offset())
+                    )
+            if not finished:
+                sm.flush_file_stream(
+                    functools.partial(checkpoint.save, ds.get_offset())
+                )
+            ds.close()
             sm.finish()
+            checkpoint.finish(finished)
             # Only mark synced if the run actually finished
             if self._mark_synced and not self._view and finished:
                 synced_file = f"{sync_item}{SYNCED_SUFFIX}"
@@ -347,6 +478,7 @@ class SyncManager:
         append=None,
         skip_console=None,
         replace_tags=None,
+        parallelism=1,
     ):
         self._sync_list = []
         self._thread = None
@@ -363,6 +495,7 @@ class SyncManager:
         self._append = append
         self._skip_console = skip_console
         self._replace_tags = replace_tags or {}
+        self._parallelism = parallelism
 
     def status(self):
         pass
@@ -370,10 +503,8 @@ class SyncManager:
     def add(self, p):
         self._sync_list.append(os.path.abspath(str(p)))
 
-    def start(self):
-        # create a thread for each file?
-        self._thread = SyncThread(
-            sync_list=self._sync_list,
+    def _sync_options(self):
+        return dict(
             project=self._project,
             entity=self._entity,
             run_id=self._run_id,
@@ -388,8 +519,54 @@ class SyncManager:
             skip_console=self._skip_console,
             replace_tags=self._replace_tags,
         )
+
+    def start(self):
+        if self._parallelism > 1 and len(self._sync_list) > 1:
+            self._thread = threading.Thread(target=self._sync_in_parallel)
+        else:
+            self._thread = SyncThread(
+                sync_list=self._sync_list,
+                **self._sync_options(),
+            )
         self._thread.start()
 
+    def _sync_in_parallel(self):
+        """Sync each item in a separate worker process.
+
+        Prints the aggregate throughput each time an item finishes.
+        """
+        if self._log_path is not None:
+            print(f"Find logs at: {self._log_path}")  # noqa: T201
+        options = self._sync_options()
+        options["log_path"] = None
+
+        start_time = time.monotonic()
+        records = nbytes = done = 0
+        with concurrent.futures.ProcessPoolExecutor(
+            max_workers=self._parallelism,
+            mp_context=multiprocessing.get_context("spawn"),
+        ) as executor:
+            futures = {
+                executor.submit(_sync_in_subprocess, sync_item, options): sync_item
+                for sync_item in self._sync_list
+            }
+            for future in concurrent.futures.as_completed(futures):
+                done += 1
+                try:
+                    item_records, item_bytes = future.result()
+                except Exception as e:
+                    wandb.termerror(f"Failed to sync {futures[future]}: {e}")
+                else:
+                    records += item_records
+                    nbytes += item_bytes
+
+                elapsed = max(time.monotonic() - start_time, 1e-9)
+                wandb.termlog(
+                    f"Synced {done}/{len(futures)} runs"
+                    f" ({records / elapsed:.0f} records/s,"
+                    f" {nbytes / elapsed / 1e6:.2f} MB/s)"
+                )
+
     def is_done(self):
         return not self._thread.is_alive()
 
@@ -398,6 +575,17 @@ class SyncManager:
         return False
 
 
+def _sync_in_subprocess(sync_item, options):
+    """Sync a single item in a worker process of `SyncManager`.
+
+    Returns:
+        The number and total size of the records sent.
+    """
+    thread = SyncThread(sync_list=[sync_item], **options)
+    thread.run()
+    return thread.records_synced, thread.bytes_synced
+
+
 def get_runs(
     include_offline: bool = True,
     include_online: bool = True,
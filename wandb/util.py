@@ -226,10 +226,19 @@ def get_optional_module(name) -> importlib.ModuleInterface | None:  # type: igno
 
 np = get_module("numpy")
 
-pd_available = False
-pandas_spec = importlib.util.find_spec("pandas")
-if pandas_spec is not None:
-    pd_available = True
+# Resolved by `__getattr__` on first access.
+pd_available: bool
+
+
+def __getattr__(name: str) -> Any:
+    # Whether pandas is installed is only looked up when first needed, so that
+    # importing this module doesn't search sys.path for pandas.
+    if name == "pd_available":
+        global pd_available
+        pd_available = importlib.util.find_spec("pandas") is not None
+        return pd_available
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 # TODO: Revisit these limits
 VALUE_BYTES_LIMIT = 100000
@@ -464,10 +473,10 @@ def is_numpy_array(obj: Any) -> bool:
 
 
 def is_pandas_data_frame(obj: Any) -> bool:
-    if pd_available:
-        import pandas as pd
-
-        return isinstance(obj, pd.DataFrame)
+    if sys.modules[__name__].pd_available:
+        # A DataFrame can only exist if pandas has been imported.
+        pd = sys.modules.get("pandas")
+        return pd is not None and isinstance(obj, pd.DataFrame)
     else:
         return is_pandas_data_frame_typename(get_full_typename(obj))
 
@@ -823,6 +832,56 @@ def json_dumps_safer_history(obj: Any, **kwargs: Any) -> str:
     return dumps(obj, cls=WandBHistoryJSONEncoder, **kwargs)
 
 
+def json_dumps_history_scalars(data: Mapping[str, Any]) -> list[str] | None:
+    """Convert the values of a flat history dict of scalars to json in bulk.
+
+    This is a fast path for the common case of logging only numbers and
+    strings. All numeric values are encoded with a single serializer call
+    rather than with one encoder instance per value.
+
+    Returns:
+        The json encoding of each value, in the order of `data`, or None if
+        any value is not an int, float, bool, str or NumPy numeric scalar. In
+        that case, values must be encoded with `json_dumps_safer_history`.
+    """
+    np = sys.modules.get("numpy")
+    encoded: list[str] = []
+    numbers: list[int | float | bool] = []
+    number_indices: list[int] = []
+
+    for value in data.values():
+        value_type = type(value)
+        if value_type is str:
+            encoded.append(dumps(value))
+            continue
+
+        if value_type is float or value_type is int or value_type is bool:
+            numbers.append(value)
+        elif (
+            np is not None
+            and isinstance(value, np.generic)
+            and value.dtype.kind in "biuf"
+        ):
+            numbers.append(_numpy_generic_convert(value, preserve_nan=True))
+        else:
+            return None
+
+        number_indices.append(len(encoded))
+        encoded.append("")
+
+    if numbers:
+        # Numbers, booleans, NaN and Infinity never contain a comma.
+        numbers_json = dumps(numbers, separators=(",", ":"))
+        for i, number_json in zip(
+            number_indices,
+            numbers_json[1:-1].split(","),
+            strict=True,
+        ):
+            encoded[i] = number_json
+
+    return encoded
+
+
 def make_json_if_not_number(
     v: int | float | str | Mapping | Sequence,
 ) -> int | float | str:
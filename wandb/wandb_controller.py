@@ -83,10 +83,130 @@ sweeps = get_module(
 SWEEP_INITIAL_RUN_STATE = sweeps.RunState.pending
 
 
+# Every this many updates, all of a sweep's runs are read rather than only the
+# runs updated since the previous read, so that deleted runs are dropped.
+_FULL_SYNC_INTERVAL = 60
+
+
 def _id_generator(size=10, chars=string.ascii_lowercase + string.digits):
     return "".join(random.choice(chars) for _ in range(size))
 
 
+def _parse_run(run: dict) -> dict:
+    """Decode the JSON fields of a run returned by the backend."""
+    rr = run.copy()
+    rr.pop("updatedAt", None)
+    if "summaryMetrics" in rr and rr["summaryMetrics"]:
+        rr["summaryMetrics"] = json.loads(rr["summaryMetrics"])
+    if "config" not in rr:
+        raise ValueError("sweep object is missing config")
+    rr["config"] = json.loads(rr["config"])
+    return rr
+
+
+class _SweepRunCache:
+    """The runs of a sweep, updated incrementally from the backend.
+
+    Each update only reads the runs updated since the previous one, and only
+    reads the history of runs whose metric changed.
+    """
+
+    def __init__(self, api: InternalApi, sweep_id: str) -> None:
+        self._api = api
+        self._sweep_id = sweep_id
+
+        # Run name to the run as returned by the backend.
+        self._raw: dict[str, dict] = {}
+        # Run name to the run with its JSON fields decoded.
+        self._parsed: dict[str, dict] = {}
+        self._runs: dict[str, sweeps.SweepRun] = {}
+
+        # The metric whose history is cached, and for each run the summary
+        # value and step at which its history was read.
+        self._metric: str | None = None
+        self._history: dict[str, list] = {}
+        self._history_at: dict[str, tuple] = {}
+
+        self._updated_since: str | None = None
+        self._updates = 0
+
+    @property
+    def raw_runs(self) -> list[dict]:
+        return list(self._raw.values())
+
+    @property
+    def runs(self) -> list[sweeps.SweepRun]:
+        return list(self._runs.values())
+
+    def update(self, metric: str | None) -> None:
+        full_sync = self._updates % _FULL_SYNC_INTERVAL == 0
+        self._updates += 1
+        raw_runs = self._api.sweep_runs(
+            self._sweep_id,
+            updated_since=None if full_sync else self._updated_since,
+        )
+
+        if full_sync:
+            names = {r["name"] for r in raw_runs}
+            for name in [name for name in self._raw if name not in names]:
+                del self._raw[name], self._parsed[name], self._runs[name]
+                self._history.pop(name, None)
+                self._history_at.pop(name, None)
+
+        changed = set()
+        for run in raw_runs:
+            name = run["name"]
+            updated_at = run.get("updatedAt")
+            if updated_at and (
+                self._updated_since is None or updated_at > self._updated_since
+            ):
+                self._updated_since = updated_at
+            if self._raw.get(name) != run:
+                self._raw[name] = run
+                self._parsed[name] = _parse_run(run)
+                changed.add(name)
+
+        changed.update(self._update_history(metric))
+
+        for name in self._raw:
+            if name in changed:
+                self._runs[name] = sweeps.SweepRun(
+                    **self._parsed[name],
+                    sampledHistory=self._history.get(name, []),
+                )
+
+    def _update_history(self, metric: str | None) -> list[str]:
+        """Read the history of runs whose metric changed.
+
+        Returns the names of the runs whose history was read.
+        """
+        if metric != self._metric:
+            self._metric = metric
+            self._history.clear()
+            self._history_at.clear()
+        if not metric:
+            return []
+
+        moved = {}
+        for name, run in self._parsed.items():
+            summary = run.get("summaryMetrics") or {}
+            at = (summary.get(metric), summary.get("_step"))
+            if name not in self._history_at or self._history_at[name] != at:
+                moved[name] = at
+        if not moved:
+            return []
+
+        specs = json.dumps({"keys": ["_step", metric], "samples": 100000})
+        histories = self._api.runs_sampled_history(list(moved), specs)
+        for name, at in moved.items():
+            sampled_history = []
+            for history_dict_list in histories.get(name) or []:
+                sampled_history += history_dict_list
+            self._history[name] = sampled_history
+            self._history_at[name] = at
+        return list(moved)
+
+
 class ControllerError(Exception):
     """Base class for sweep errors."""
 
@@ -163,6 +283,8 @@ class _WandbController:
         self._sweep_runs: list[sweeps.SweepRun] | None = None
         # dictionary mapping name of run to run object
         self._sweep_runs_map: dict[str, sweeps.SweepRun] | None = None
+        # runs of the sweep, updated incrementally every step
+        self._run_cache: _SweepRunCache | None = None
         # scheduler dict (read only from controller) - used as feedback from the server
         self._scheduler: dict | None = None
         # controller dict (write only from controller) - used to send commands to server
@@ -425,45 +547,20 @@ class _WandbController:
             time.sleep(5)
 
     def _sweep_object_read_from_backend(self) -> dict | None:
-        specs_json = {}
-        if self._sweep_metric:
-            k = ["_step"]
-            k.append(self._sweep_metric)
-            specs_json = {"keys": k, "samples": 100000}
-        specs = json.dumps(specs_json)
         # TODO(jhr): catch exceptions?
-        sweep_obj = self._api.sweep(self._sweep_id, specs)
+        sweep_obj = self._api.sweep(self._sweep_id, "{}", include_runs=False)
         if not sweep_obj:
             return
         self._sweep_obj = sweep_obj
         self._sweep_config = yaml.safe_load(sweep_obj["config"])
         self._sweep_metric = self._sweep_config.get("metric", {}).get("name")
 
-        _sweep_runs: list[sweeps.SweepRun] = []
-        for r in sweep_obj["runs"]:
-            rr = r.copy()
-            if "summaryMetrics" in rr and rr["summaryMetrics"]:
-                rr["summaryMetrics"] = json.loads(rr["summaryMetrics"])
-            if "config" not in rr:
-                raise ValueError("sweep object is missing config")
-            rr["config"] = json.loads(rr["config"])
-            if "history" in rr:
-                if isinstance(rr["history"], list):
-                    rr["history"] = [json.loads(d) for d in rr["history"]]
-                else:
-                    raise ValueError(
-                        "Invalid history value: expected list of json strings: {}".format(
-                            rr["history"]
-                        )
-                    )
-            if "sampledHistory" in rr:
-                sampled_history = []
-                for historyDictList in rr["sampledHistory"]:
-                    sampled_history += historyDictList
-                rr["sampledHistory"] = sampled_history
-            _sweep_runs.append(sweeps.SweepRun(**rr))
-
-        self._sweep_runs = _sweep_runs
+        if self._run_cache is None:
+            self._run_cache = _SweepRunCache(self._api, self._sweep_id)
+        self._run_cache.update(self._sweep_metric)
+        sweep_obj["runs"] = self._run_cache.raw_runs
+
+        self._sweep_runs = self._run_cache.runs
         self._sweep_runs_map = {r.name: r for r in self._sweep_runs}
 
         self._controller = json.loads(sweep_obj.get("controller") or "{}")